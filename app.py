@@ -4,8 +4,10 @@ News Relationship Explorer - Flask Application Entry Point
 Run with: python app.py
 """
 from flask import Flask, send_from_directory
-from backend.db import init_db
+from flask_compress import Compress
+from backend.db import init_db, close_request_db
 from backend.api import register_blueprints
+from backend.api.serialization import ORJSONProvider
 import os
 
 
@@ -23,6 +25,20 @@ def create_app():
         app.config['SECRET_KEY'] = os.urandom(24).hex()
         app.config['PORT'] = 5000
     
+    # Generated SECRET_KEY, created here (not at import) so only the app
+    # writes it, next to the app rather than in the working directory
+    if not app.config.get('SECRET_KEY'):
+        from backend.config import load_or_create_secret
+        app.config['SECRET_KEY'] = load_or_create_secret(
+            app.config.get('SECRET_KEY_PATH') or os.path.join(app.instance_path, '.secret_key')
+        )
+    
+    # Serialize JSON responses with orjson
+    app.json = ORJSONProvider(app)
+    
+    # Compress JSON API responses (br/gzip)
+    Compress(app)
+    
     # Ensure instance directory exists
     os.makedirs('instance', exist_ok=True)
     
@@ -32,6 +48,9 @@ def create_app():
     # Register API blueprints
     register_blueprints(app)
     
+    # Close the per-request database connection at the end of each request
+    app.teardown_appcontext(close_request_db)
+    
     # Serve index.html at root
     @app.route('/')
     def index():
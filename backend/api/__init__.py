@@ -9,6 +9,8 @@ from backend.api.entities import entities_bp
 from backend.api.storylines import storylines_bp
 from backend.api.dashboard import dashboard_bp
 from backend.api.monitoring import monitoring_bp
+from backend.services.dashboard import DashboardService
+from backend.services.monitoring import MonitoringService
 
 
 def register_blueprints(app):
@@ -33,4 +35,8 @@ def register_blueprints(app):
     api_bp.register_blueprint(monitoring_bp)
     
     app.register_blueprint(api_bp)
+    
+    # Services hold no per-request state, so handlers share one instance
+    app.extensions['dashboard_service'] = DashboardService()
+    app.extensions['monitoring_service'] = MonitoringService()
 
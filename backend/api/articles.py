@@ -3,7 +3,8 @@ Article API endpoints.
 Provides list, search, and filtering capabilities.
 """
 from flask import Blueprint, request, jsonify
-from backend.db import get_db
+from backend.db import get_request_db
+from backend.api.serialization import json_list_response
 from backend.services.search import search_articles
 from backend.services.ingest import ingest_csv
 from pathlib import Path
@@ -12,6 +13,8 @@ from backend.config import Config
 
 articles_bp = Blueprint('articles', __name__)
 
+ARTICLE_FIELDS = ('id', 'title', 'summary', 'url', 'outlet', 'date', 'date_bin')
+
 
 @articles_bp.route('/articles', methods=['GET'])
 def get_articles():
@@ -25,11 +28,12 @@ def get_articles():
     - outlet: Filter by outlet (domain name)
     - limit: Max results (default: 100)
     - offset: Pagination offset (default: 0)
+    - include_total: If "false", skip counting the total matches (default: true)
     
     Returns:
     {
         "items": [{"id", "title", "date", "url", "outlet", "summary"}],
-        "total": int
+        "total": int  (omitted when include_total=false)
     }
     """
     # Parse query parameters
@@ -40,19 +44,22 @@ def get_articles():
     cluster_id = request.args.get('cluster_id', type=int)
     limit = int(request.args.get('limit', 100))
     offset = int(request.args.get('offset', 0))
+    include_total = request.args.get('include_total', 'true').lower() != 'false'
     
     # Clamp limit to reasonable range
     limit = max(1, min(limit, 1000))
     offset = max(0, offset)
     
     # Build query
-    conn = get_db()
+    conn = get_request_db()
     cursor = conn.cursor()
     
     # Use FTS5 if query provided, otherwise regular SELECT
+    total = None
     if query:
-        results = search_articles(query, date_from, date_to, outlet, cluster_id, limit, offset)
-        total = search_articles(query, date_from, date_to, outlet, cluster_id, limit=10000, offset=0, count_only=True)
+        results = search_articles(query, date_from, date_to, outlet, cluster_id, limit, offset, conn=conn)
+        if include_total:
+            total = search_articles(query, date_from, date_to, outlet, cluster_id, count_only=True, conn=conn)
     else:
         # Build WHERE clause
         conditions = []
@@ -76,45 +83,35 @@ def get_articles():
         
         where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
         
-        # Get total count
-        cursor.execute(f"SELECT COUNT(*) FROM articles {where_clause}", params)
-        total = cursor.fetchone()[0]
-        
-        # Get articles
-        params.extend([limit, offset])
+        # Get articles (and the total via a window count in the same statement)
+        total_column = ", COUNT(*) OVER () AS total" if include_total else ""
         cursor.execute(f"""
-            SELECT id, title, summary, url, outlet, date, date_bin
+            SELECT id, title, summary, url, outlet, date, date_bin{total_column}
             FROM articles
             {where_clause}
             ORDER BY date DESC, id DESC
             LIMIT ? OFFSET ?
-        """, params)
+        """, params + [limit, offset])
         
         results = cursor.fetchall()
+        
+        if include_total:
+            if results:
+                total = results[0]['total']
+            elif offset > 0:
+                # Page is past the end, so the window count is unavailable
+                cursor.execute(f"SELECT COUNT(*) FROM articles {where_clause}", params)
+                total = cursor.fetchone()[0]
+            else:
+                total = 0
     
-    # Format results
-    items = []
-    for row in results:
-        if isinstance(row, dict):
-            item = row
-        else:
-            item = {
-                'id': row['id'],
-                'title': row['title'],
-                'summary': row['summary'],
-                'url': row['url'],
-                'outlet': row['outlet'],
-                'date': row['date'],
-                'date_bin': row['date_bin']
-            }
-        items.append(item)
+    # Format results (both query paths select the article fields first, so
+    # trailing helper columns such as rank/total are dropped by zip)
+    items = [dict(zip(ARTICLE_FIELDS, row)) for row in results]
     
-    conn.close()
+    extra = {'total': total} if include_total else {}
     
-    return jsonify({
-        'items': items,
-        'total': total
-    })
+    return json_list_response('items', items, **extra)
 
 
 @articles_bp.route('/ingest/csv', methods=['POST'])
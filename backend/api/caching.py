@@ -0,0 +1,80 @@
+"""
+Response caching for read-mostly API endpoints.
+
+Payloads are cached in-process keyed on the corpus version (see
+backend.db.get_corpus_version), and the same version is sent as a weak
+ETag so clients holding current data get 304 Not Modified.
+"""
+import threading
+from cachetools import TTLCache
+from flask import request, jsonify, make_response
+
+
+class ResponseCache:
+    """Thread-safe TTL cache of JSON payloads."""
+    
+    def __init__(self, maxsize=64, ttl=60):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+    
+    def get_or_build(self, key, build):
+        """Return the cached payload for key, calling build() on a miss."""
+        with self._lock:
+            payload = self._cache.get(key)
+        if payload is None:
+            payload = build()
+            with self._lock:
+                self._cache[key] = payload
+        return payload
+    
+    def clear(self):
+        """Drop all cached payloads."""
+        with self._lock:
+            self._cache.clear()
+
+
+def conditional_response(version, key, build, max_age=None):
+    """
+    Serve build()'s response with an ETag, skipping build() on a match.
+    
+    Args:
+        version: Corpus version token from get_corpus_version()
+        key: Tuple of request parameters the response depends on
+        build: Zero-argument callable that produces the Flask response
+        max_age: If set, let clients and shared caches reuse the response
+            for this many seconds without revalidating
+    
+    Returns:
+        Flask response (304 if the client's If-None-Match is current)
+    """
+    etag = '-'.join(str(part) for part in (version, *key))
+    
+    # Weak ETag: compressed and uncompressed bodies are equivalent
+    if request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+    else:
+        response = build()
+    
+    response.set_etag(etag, weak=True)
+    if max_age is not None:
+        response.cache_control.public = True
+        response.cache_control.max_age = max_age
+    return response
+
+
+def cached_json_response(cache, version, key, build):
+    """
+    Serve build()'s payload as JSON with an ETag, reusing cached payloads.
+    
+    Args:
+        cache: ResponseCache holding payloads for this endpoint
+        version: Corpus version token from get_corpus_version()
+        key: Tuple of request parameters the payload depends on
+        build: Zero-argument callable that produces the payload
+    
+    Returns:
+        Flask response (304 if the client's If-None-Match is current)
+    """
+    return conditional_response(
+        version, key, lambda: jsonify(cache.get_or_build((version, *key), build))
+    )
@@ -3,10 +3,14 @@ Cluster API endpoints.
 Provides cluster information and cluster-specific article lists.
 """
 from flask import Blueprint, jsonify, request
-from backend.db import get_db
+from backend.db import get_request_db, get_corpus_version, fetchall_dicts
+from backend.api.caching import ResponseCache, cached_json_response
+from backend.api.serialization import raw_json_list_response
 
 clusters_bp = Blueprint('clusters', __name__)
 
+_clusters_cache = ResponseCache(maxsize=64, ttl=60)
+
 
 @clusters_bp.route('/clusters', methods=['GET'])
 def get_clusters():
@@ -27,51 +31,47 @@ def get_clusters():
             "unclustered": 23
         }
     }
+    
+    Responses carry an ETag and are cached until the corpus changes.
     """
-    conn = get_db()
+    conn = get_request_db()
+    return cached_json_response(_clusters_cache, get_corpus_version(conn), (),
+                                lambda: _build_clusters_summary(conn))
+
+
+def _build_clusters_summary(conn):
+    """Query the cluster list and article stats for GET /api/clusters."""
     cursor = conn.cursor()
     
-    try:
-        # Get all clusters
-        cursor.execute("""
-            SELECT id, label, size, score
-            FROM clusters
-            ORDER BY size DESC, id ASC
-        """)
-        
-        clusters = []
-        for row in cursor.fetchall():
-            clusters.append({
-                'id': row['id'],
-                'label': row['label'] or 'Unlabeled',
-                'size': row['size'] or 0,
-                'score': row['score']
-            })
-        
-        # Get stats
-        cursor.execute("SELECT COUNT(*) FROM clusters")
-        total_clusters = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM articles WHERE cluster_id IS NOT NULL")
-        clustered_articles = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM articles WHERE cluster_id IS NULL")
-        unclustered = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM articles")
-        total_articles = cursor.fetchone()[0]
-        
-        return jsonify({
-            'clusters': clusters,
-            'stats': {
-                'total_clusters': total_clusters,
-                'total_articles': total_articles,
-                'clustered_articles': clustered_articles,
-                'unclustered': unclustered
-            }
-        })
-    finally:
-        conn.close()
+    # Get all clusters
+    cursor.execute("""
+        SELECT id,
+               COALESCE(NULLIF(label, ''), 'Unlabeled') AS label,
+               COALESCE(size, 0) AS size,
+               score
+        FROM clusters
+        ORDER BY size DESC, id ASC
+    """)
+    clusters = fetchall_dicts(cursor)
+    
+    # Get article stats in a single pass over articles
+    cursor.execute("""
+        SELECT COUNT(*) AS total,
+               COALESCE(SUM(cluster_id IS NOT NULL), 0) AS clustered,
+               COALESCE(SUM(cluster_id IS NULL), 0) AS unclustered
+        FROM articles
+    """)
+    stats_row = cursor.fetchone()
+    
+    return {
+        'clusters': clusters,
+        'stats': {
+            'total_clusters': len(clusters),
+            'total_articles': stats_row['total'],
+            'clustered_articles': stats_row['clustered'],
+            'unclustered': stats_row['unclustered']
+        }
+    }
 
 
 @clusters_bp.route('/cluster/<int:cluster_id>/articles', methods=['GET'])
@@ -92,7 +92,7 @@ def get_cluster_articles(cluster_id):
         "cluster": {"id": int, "label": str, "size": int}
     }
     """
-    conn = get_db()
+    conn = get_request_db()
     cursor = conn.cursor()
     
     limit = int(request.args.get('limit', 100))
@@ -100,64 +100,46 @@ def get_cluster_articles(cluster_id):
     limit = max(1, min(limit, 1000))
     offset = max(0, offset)
     
-    try:
-        # Get cluster info
-        cursor.execute("""
-            SELECT id, label, size, score
-            FROM clusters
-            WHERE id = ?
-        """, (cluster_id,))
-        cluster_row = cursor.fetchone()
-        
-        if not cluster_row:
-            return jsonify({
-                'ok': False,
-                'error': {
-                    'code': 'CLUSTER_NOT_FOUND',
-                    'message': f'Cluster {cluster_id} not found'
-                }
-            }), 404
-        
-        cluster = {
-            'id': cluster_row['id'],
-            'label': cluster_row['label'],
-            'size': cluster_row['size'],
-            'score': cluster_row['score']
-        }
-        
-        # Get total count
-        cursor.execute("""
-            SELECT COUNT(*) FROM articles WHERE cluster_id = ?
-        """, (cluster_id,))
-        total = cursor.fetchone()[0]
-        
-        # Get articles
-        cursor.execute("""
+    # Get cluster info
+    cursor.execute("""
+        SELECT id, label, size, score
+        FROM clusters
+        WHERE id = ?
+    """, (cluster_id,))
+    cluster_row = cursor.fetchone()
+    
+    if not cluster_row:
+        return jsonify({
+            'ok': False,
+            'error': {
+                'code': 'CLUSTER_NOT_FOUND',
+                'message': f'Cluster {cluster_id} not found'
+            }
+        }), 404
+    
+    cluster = dict(cluster_row)
+    
+    # Get total count
+    cursor.execute("""
+        SELECT COUNT(*) FROM articles WHERE cluster_id = ?
+    """, (cluster_id,))
+    total = cursor.fetchone()[0]
+    
+    # Get articles, encoded as a JSON array by SQLite
+    cursor.execute("""
+        SELECT json_group_array(json_object(
+            'id', id, 'title', title, 'summary', summary, 'url', url,
+            'outlet', outlet, 'date', date, 'date_bin', date_bin, 'cluster_id', cluster_id
+        ))
+        FROM (
             SELECT id, title, summary, url, outlet, date, date_bin, cluster_id
             FROM articles
             WHERE cluster_id = ?
             ORDER BY date DESC, id DESC
             LIMIT ? OFFSET ?
-        """, (cluster_id, limit, offset))
-        
-        items = []
-        for row in cursor.fetchall():
-            items.append({
-                'id': row['id'],
-                'title': row['title'],
-                'summary': row['summary'],
-                'url': row['url'],
-                'outlet': row['outlet'],
-                'date': row['date'],
-                'date_bin': row['date_bin'],
-                'cluster_id': row['cluster_id']
-            })
-        
-        return jsonify({
-            'items': items,
-            'total': total,
-            'cluster': cluster
-        })
-    finally:
-        conn.close()
+        )
+    """, (cluster_id, limit, offset))
+    items_json = cursor.fetchone()[0]
+    
+    return raw_json_list_response('items', items_json, total=total, cluster=cluster)
 
@@ -2,11 +2,15 @@
 Dashboard API endpoints
 """
 
-from flask import Blueprint, request, jsonify
-from backend.services.dashboard import DashboardService
+from datetime import date
+from flask import Blueprint, current_app, request
+from backend.db import get_request_db, get_corpus_version
+from backend.api.caching import ResponseCache, cached_json_response
 
 dashboard_bp = Blueprint('dashboard', __name__)
 
+_summary_cache = ResponseCache(maxsize=64, ttl=60)
+
 
 @dashboard_bp.route('/dashboard/summary', methods=['GET'])
 def get_dashboard_summary():
@@ -27,12 +31,19 @@ def get_dashboard_summary():
             "key_actors": [...],
             "cluster_evolution": [...]
         }
+    
+    Responses carry an ETag and are cached until the corpus changes.
     """
     days_back = request.args.get('days_back', default=30, type=int)
     days_back = max(7, min(days_back, 365))  # Clamp to 7-365
     
-    service = DashboardService()
-    summary = service.get_dashboard_summary(days_back=days_back)
+    # Date windows are relative to today, so today is part of the cache key
+    today = date.today().isoformat()
+    version = get_corpus_version(get_request_db())
     
-    return jsonify(summary)
+    service = current_app.extensions['dashboard_service']
+    return cached_json_response(
+        _summary_cache, version, (days_back, today),
+        lambda: service.get_dashboard_summary(days_back=days_back)
+    )
 
@@ -3,10 +3,20 @@ Entities API endpoints
 """
 
 from flask import Blueprint, request, jsonify
-from backend.db import get_db
+from backend.db import get_request_db, fetchall_dicts
+from backend.api.serialization import json_list_response
+from backend.api.pagination import (
+    InvalidCursor, get_page_size, decode_cursor, next_cursor, invalid_cursor_response
+)
 
 entities_bp = Blueprint('entities', __name__)
 
+# The trigram tokenizer can only match queries of at least three characters
+TRIGRAM_MIN_LENGTH = 3
+
+# Keyset pagination order for /entities/:id/timeline (ascending)
+TIMELINE_SORT_KEY = ('date', 'id')
+
 
 @entities_bp.route('/entities', methods=['GET'])
 def get_entities():
@@ -21,45 +31,44 @@ def get_entities():
     query = request.args.get('q', '').strip()
     min_degree = request.args.get('min_degree', type=int)
     
-    conn = get_db()
+    conn = get_request_db()
     cursor = conn.cursor()
     
     # Build query
+    join_clause = ""
     conditions = []
     params = []
     
+    if min_degree:
+        conditions.append("e.degree >= ?")
+        params.append(min_degree)
+    
     if entity_type:
         conditions.append("e.type = ?")
         params.append(entity_type)
     
-    if query:
+    if len(query) >= TRIGRAM_MIN_LENGTH:
+        # Substring match through the trigram index, quoted as a phrase
+        join_clause = "JOIN entities_fts f ON f.rowid = e.id"
+        conditions.append("entities_fts MATCH ?")
+        params.append('"{}"'.format(query.replace('"', '""')))
+    elif query:
+        # Too short to form a trigram; fall back to a scan
         conditions.append("e.name LIKE ?")
         params.append(f"%{query}%")
     
     where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
     
-    # Get entities with degree (article count)
+    # degree (article count) is maintained by triggers on article_entities
     cursor.execute(f"""
-        SELECT e.id, e.name, e.type, COUNT(ae.article_id) as degree
+        SELECT e.id, e.name, e.type, e.degree
         FROM entities e
-        LEFT JOIN article_entities ae ON e.id = ae.entity_id
+        {join_clause}
         {where_clause}
-        GROUP BY e.id, e.name, e.type
-        HAVING degree >= COALESCE(?, 0)
-        ORDER BY degree DESC
+        ORDER BY e.degree DESC
         LIMIT 500
-    """, params + [min_degree if min_degree else 0])
-    
-    entities = []
-    for row in cursor.fetchall():
-        entities.append({
-            'id': row['id'],
-            'name': row['name'],
-            'type': row['type'],
-            'degree': row['degree']
-        })
-    
-    conn.close()
+    """, params)
+    entities = fetchall_dicts(cursor)
     
     return jsonify({'items': entities})
 
@@ -69,9 +78,17 @@ def get_entity_timeline(entity_id):
     """
     GET /api/entities/:id/timeline
     
-    Returns: { entity: {...}, articles: [{id, title, date, role_type}] }
+    Query: limit (default 200, max 1000), cursor
+    
+    Returns: { entity: {...}, articles: [{id, title, date, role_type}], next_cursor: str|null }
     """
-    conn = get_db()
+    limit = get_page_size()
+    try:
+        after = decode_cursor(request.args.get('cursor'), len(TIMELINE_SORT_KEY))
+    except InvalidCursor:
+        return jsonify(invalid_cursor_response()), 400
+    
+    conn = get_request_db()
     cursor = conn.cursor()
     
     # Get entity info
@@ -79,37 +96,24 @@ def get_entity_timeline(entity_id):
     entity_row = cursor.fetchone()
     
     if not entity_row:
-        conn.close()
         return jsonify({'ok': False, 'error': {'code': 'NOT_FOUND'}}), 404
     
-    entity = {
-        'id': entity_row['id'],
-        'name': entity_row['name'],
-        'type': entity_row['type']
-    }
+    entity = dict(entity_row)
     
-    # Get articles mentioning this entity
-    cursor.execute("""
-        SELECT a.id, a.title, a.date, er.role_type
+    # Get articles mentioning this entity (one page, in date order)
+    keyset_condition = "AND (a.date, a.id) > (?, ?)" if after is not None else ""
+    cursor.execute(f"""
+        SELECT a.id, a.title, a.date, COALESCE(er.role_type, 'neutral') AS role_type
         FROM articles a
         JOIN article_entities ae ON a.id = ae.article_id
         LEFT JOIN entity_roles er ON a.id = er.article_id AND ae.entity_id = er.entity_id
-        WHERE ae.entity_id = ?
-        ORDER BY a.date ASC
-    """, (entity_id,))
-    
-    articles = []
-    for row in cursor.fetchall():
-        articles.append({
-            'id': row['id'],
-            'title': row['title'],
-            'date': row['date'],
-            'role_type': row['role_type'] or 'neutral'
-        })
-    
-    conn.close()
+        WHERE ae.entity_id = ? {keyset_condition}
+        ORDER BY a.date ASC, a.id ASC
+        LIMIT ?
+    """, [entity_id, *(after or []), limit + 1])
+    articles, cursor_token = next_cursor(fetchall_dicts(cursor), limit, TIMELINE_SORT_KEY)
     
-    return jsonify({'entity': entity, 'articles': articles})
+    return json_list_response('articles', articles, entity=entity, next_cursor=cursor_token)
 
 
 @entities_bp.route('/entities/<int:entity_id>/relationships', methods=['GET'])
@@ -119,32 +123,22 @@ def get_entity_relationships(entity_id):
     
     Returns: { related_entities: [{entity_id, name, co_mention_count}] }
     """
-    conn = get_db()
+    conn = get_request_db()
     cursor = conn.cursor()
     
-    # Find entities co-mentioned with this one
+    # Find entities co-mentioned with this one (drive the join from this entity's articles)
     cursor.execute("""
-        SELECT e.id, e.name, COUNT(*) as co_mentions
-        FROM entities e
-        JOIN article_entities ae2 ON e.id = ae2.entity_id
-        WHERE ae2.article_id IN (
-            SELECT article_id FROM article_entities WHERE entity_id = ?
-        )
-        AND e.id != ?
+        SELECT e.id AS entity_id, e.name, COUNT(*) AS co_mention_count
+        FROM article_entities ae1
+        JOIN article_entities ae2
+            ON ae2.article_id = ae1.article_id AND ae2.entity_id != ae1.entity_id
+        JOIN entities e ON e.id = ae2.entity_id
+        WHERE ae1.entity_id = ?
         GROUP BY e.id, e.name
-        ORDER BY co_mentions DESC
+        ORDER BY co_mention_count DESC
         LIMIT 50
-    """, (entity_id, entity_id))
-    
-    related = []
-    for row in cursor.fetchall():
-        related.append({
-            'entity_id': row['id'],
-            'name': row['name'],
-            'co_mention_count': row['co_mentions']
-        })
-    
-    conn.close()
+    """, (entity_id,))
+    related = fetchall_dicts(cursor)
     
     return jsonify({'related_entities': related})
 
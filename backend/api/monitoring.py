@@ -2,8 +2,9 @@
 Monitoring API endpoints
 """
 
-from flask import Blueprint, request, jsonify
-from backend.services.monitoring import MonitoringService
+from datetime import datetime, timedelta
+from flask import Blueprint, current_app, request, jsonify
+from backend.db import get_request_db
 
 monitoring_bp = Blueprint('monitoring', __name__)
 
@@ -43,7 +44,7 @@ def get_alerts():
     alert_type = request.args.get('alert_type')
     severity = request.args.get('severity')
     
-    service = MonitoringService()
+    service = current_app.extensions['monitoring_service']
     alerts = service.get_recent_alerts(
         limit=limit,
         since=since,
@@ -64,7 +65,7 @@ def acknowledge_alert(alert_id):
     Returns:
         {"success": true, "acknowledged": alert_id}
     """
-    service = MonitoringService()
+    service = current_app.extensions['monitoring_service']
     result = service.acknowledge_alert(alert_id)
     
     return jsonify(result)
@@ -85,7 +86,7 @@ def run_monitoring():
             "new_actors": int
         }
     """
-    service = MonitoringService()
+    service = current_app.extensions['monitoring_service']
     result = service.run_detections()
     
     return jsonify(result)
@@ -105,28 +106,22 @@ def get_monitoring_stats():
             "recent_alerts_24h": int
         }
     """
-    from backend.db import get_db
-    
-    conn = get_db()
+    conn = get_request_db()
     cursor = conn.cursor()
     
-    # Get total alerts
-    cursor.execute("SELECT COUNT(*) as count FROM alerts")
-    total_alerts = cursor.fetchone()['count']
-    
-    # Get unacknowledged alerts
-    cursor.execute("SELECT COUNT(*) as count FROM alerts WHERE acknowledged = 0")
-    unacknowledged = cursor.fetchone()['count']
-    
-    # Get recent alerts (last 24 hours)
-    from datetime import datetime, timedelta
     last_24h = (datetime.now() - timedelta(hours=24)).isoformat()
-    cursor.execute("SELECT COUNT(*) as count FROM alerts WHERE triggered_at >= ?", (last_24h,))
-    recent_24h = cursor.fetchone()['count']
+    
+    # Get total, unacknowledged, and last-24h counts in one pass over alerts
+    cursor.execute("""
+        SELECT COUNT(*) AS total,
+               COALESCE(SUM(acknowledged = 0), 0) AS unacknowledged,
+               COALESCE(SUM(triggered_at >= ?), 0) AS recent_24h
+        FROM alerts
+    """, (last_24h,))
+    row = cursor.fetchone()
     
     return jsonify({
-        'total_alerts': total_alerts,
-        'unacknowledged_alerts': unacknowledged,
-        'recent_alerts_24h': recent_24h
+        'total_alerts': row['total'],
+        'unacknowledged_alerts': row['unacknowledged'],
+        'recent_alerts_24h': row['recent_24h']
     })
-
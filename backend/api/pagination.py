@@ -0,0 +1,78 @@
+"""
+Keyset pagination helpers.
+
+List endpoints return a next_cursor token encoding the sort key of the
+last row on the page; passing it back as ?cursor= resumes after that row
+with an index range scan instead of an OFFSET skip.
+"""
+import base64
+import binascii
+import orjson
+from flask import request
+
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 1000
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+def get_page_size():
+    """Read ?limit= from the request, clamped to 1..MAX_PAGE_SIZE."""
+    limit = request.args.get('limit', default=DEFAULT_PAGE_SIZE, type=int)
+    return max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def encode_cursor(values):
+    """Encode a row's sort-key values as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(orjson.dumps(list(values))).decode('ascii')
+
+
+def decode_cursor(token, size):
+    """
+    Decode a cursor token into its sort-key values.
+    
+    Args:
+        token: Token from a previous next_cursor (or None)
+        size: Number of sort-key values expected
+    
+    Returns:
+        List of values, or None if no token was given
+    
+    Raises:
+        InvalidCursor: If the token is malformed
+    """
+    if not token:
+        return None
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(token.encode('ascii')))
+    except (binascii.Error, orjson.JSONDecodeError, UnicodeEncodeError, ValueError):
+        raise InvalidCursor(token)
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor(token)
+    return values
+
+
+def next_cursor(rows, limit, key_columns):
+    """
+    Trim a page fetched with LIMIT limit + 1 and build its next_cursor.
+    
+    Returns:
+        tuple: (rows for this page, next_cursor token or None on the last page)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1][column] for column in key_columns)
+
+
+def invalid_cursor_response():
+    """Standard 400 error payload for a malformed cursor."""
+    return {
+        'ok': False,
+        'error': {
+            'code': 'INVALID_CURSOR',
+            'message': 'Malformed pagination cursor'
+        }
+    }
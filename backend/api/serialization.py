@@ -0,0 +1,93 @@
+"""
+JSON serialization for API responses using orjson.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from flask import Response, jsonify
+from flask.json.provider import JSONProvider
+
+# Non-string dict keys (e.g. cluster ids) are stringified like the stdlib encoder
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# Lists at least this long are streamed in chunks instead of encoded in one piece
+STREAM_MIN_ITEMS = 500
+STREAM_CHUNK_SIZE = 200
+
+# Streamed lists at least this long encode each next chunk on a worker thread
+# while the current one is written out. orjson holds the GIL, so this only
+# overlaps encoding with the socket write, not with other encoding.
+PREFETCH_MIN_ITEMS = 50000
+_encoder = ThreadPoolExecutor(max_workers=4, thread_name_prefix='json-encode')
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (used by jsonify)."""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS),
+                                        mimetype='application/json')
+
+
+def json_list_response(key, items, **fields):
+    """
+    Build a JSON response of the form {key: items, **fields}.
+    
+    Short lists go through jsonify. Long lists are encoded chunk by chunk
+    from a generator so the body is sent as it is produced rather than
+    built as one large buffer first.
+    """
+    if len(items) < STREAM_MIN_ITEMS:
+        return jsonify({key: items, **fields})
+    
+    chunks = (items[start:start + STREAM_CHUNK_SIZE] for start in range(0, len(items), STREAM_CHUNK_SIZE))
+    encoded = _encode_ahead(chunks) if len(items) >= PREFETCH_MIN_ITEMS else map(_encode_chunk, chunks)
+    
+    def generate():
+        yield b'{' + orjson.dumps(key) + b':['
+        for index, part in enumerate(encoded):
+            if index:
+                yield b','
+            yield part
+        yield b']'
+        for name, value in fields.items():
+            yield b',' + orjson.dumps(name) + b':' + orjson.dumps(value, option=ORJSON_OPTIONS)
+        yield b'}'
+    
+    return Response(generate(), mimetype='application/json')
+
+
+def _encode_chunk(chunk):
+    """Encode a list chunk without its enclosing brackets."""
+    return orjson.dumps(chunk, option=ORJSON_OPTIONS)[1:-1]
+
+
+def _encode_ahead(chunks):
+    """Yield encoded chunks, encoding one chunk ahead on the worker pool."""
+    pending = None
+    for chunk in chunks:
+        future = _encoder.submit(_encode_chunk, chunk)
+        if pending is not None:
+            yield pending.result()
+        pending = future
+    if pending is not None:
+        yield pending.result()
+
+
+def raw_json_list_response(key, items_json, **fields):
+    """
+    Build a JSON response of the form {key: items, **fields} around a list
+    that is already encoded (e.g. by SQLite's json_group_array), so the rows
+    never become Python objects.
+    """
+    body = [b'{', orjson.dumps(key), b':', items_json.encode('utf-8')]
+    for name, value in fields.items():
+        body.append(b',' + orjson.dumps(name) + b':' + orjson.dumps(value, option=ORJSON_OPTIONS))
+    body.append(b'}')
+    return Response(b''.join(body), mimetype='application/json')
@@ -3,26 +3,43 @@ Storylines API endpoints
 """
 
 from flask import Blueprint, request, jsonify
-from backend.db import get_db
+from backend.db import get_request_db, fetchall_dicts
+from backend.api.serialization import json_list_response
+from backend.api.pagination import (
+    InvalidCursor, get_page_size, decode_cursor, next_cursor, invalid_cursor_response
+)
 
 storylines_bp = Blueprint('storylines', __name__)
 
+# Keyset pagination order for /storylines (all descending). momentum_score
+# is nullable, so it is read as COALESCE(momentum_score, 0) everywhere (a
+# NULL in the cursor's row-value comparison would end the listing)
+STORYLINE_SORT_KEY = ('momentum_score', 'last_date', 'id')
+STORYLINE_MOMENTUM_SQL = "COALESCE(momentum_score, 0)"
+
 
 @storylines_bp.route('/storylines', methods=['GET'])
 def get_storylines():
     """
     GET /api/storylines
     
-    Query: status, min_momentum, from_date, to_date
+    Query: status, min_momentum, from_date, to_date, limit (default 200, max 1000), cursor
     
-    Returns: { storylines: [{id, label, status, momentum_score, article_count, first_date, last_date}] }
+    Returns: { storylines: [{id, label, status, momentum_score, article_count, first_date, last_date}],
+               next_cursor: str|null }
     """
     status = request.args.get('status')
     min_momentum = request.args.get('min_momentum', type=float)
     from_date = request.args.get('from_date')
     to_date = request.args.get('to_date')
+    limit = get_page_size()
+    
+    try:
+        after = decode_cursor(request.args.get('cursor'), len(STORYLINE_SORT_KEY))
+    except InvalidCursor:
+        return jsonify(invalid_cursor_response()), 400
     
-    conn = get_db()
+    conn = get_request_db()
     cursor = conn.cursor()
     
     # Build query
@@ -34,7 +51,7 @@ def get_storylines():
         params.append(status)
     
     if min_momentum is not None:
-        conditions.append("momentum_score >= ?")
+        conditions.append(f"{STORYLINE_MOMENTUM_SQL} >= ?")
         params.append(min_momentum)
     
     if from_date:
@@ -45,30 +62,26 @@ def get_storylines():
         conditions.append("first_date <= ?")
         params.append(to_date)
     
+    if after is not None:
+        # The leading bound lets SQLite seek idx_storylines_momentum (it
+        # doesn't range-scan an expression index on the row value alone)
+        conditions.append(f"{STORYLINE_MOMENTUM_SQL} <= ?")
+        conditions.append(f"({STORYLINE_MOMENTUM_SQL}, last_date, id) < (?, ?, ?)")
+        params.extend([after[0], *after])
+    
     where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
     
     cursor.execute(f"""
-        SELECT id, label, status, momentum_score, article_count, first_date, last_date
+        SELECT id, label, status, {STORYLINE_MOMENTUM_SQL} AS momentum_score,
+               article_count, first_date, last_date
         FROM storylines
         {where_clause}
-        ORDER BY momentum_score DESC, last_date DESC
-    """, params)
-    
-    storylines = []
-    for row in cursor.fetchall():
-        storylines.append({
-            'id': row['id'],
-            'label': row['label'],
-            'status': row['status'],
-            'momentum_score': row['momentum_score'],
-            'article_count': row['article_count'],
-            'first_date': row['first_date'],
-            'last_date': row['last_date']
-        })
-    
-    conn.close()
-    
-    return jsonify({'storylines': storylines})
+        ORDER BY {STORYLINE_MOMENTUM_SQL} DESC, last_date DESC, id DESC
+        LIMIT ?
+    """, params + [limit + 1])
+    storylines, cursor_token = next_cursor(fetchall_dicts(cursor), limit, STORYLINE_SORT_KEY)
+    
+    return json_list_response('storylines', storylines, next_cursor=cursor_token)
 
 
 @storylines_bp.route('/storyline/<int:storyline_id>/articles', methods=['GET'])
@@ -78,7 +91,7 @@ def get_storyline_articles(storyline_id):
     
     Returns: { storyline: {...}, articles: [{id, title, date, tier, sequence_order}] }
     """
-    conn = get_db()
+    conn = get_request_db()
     cursor = conn.cursor()
     
     # Get storyline info
@@ -90,17 +103,9 @@ def get_storyline_articles(storyline_id):
     
     storyline_row = cursor.fetchone()
     if not storyline_row:
-        conn.close()
         return jsonify({'ok': False, 'error': {'code': 'NOT_FOUND', 'message': 'Storyline not found'}}), 404
     
-    storyline = {
-        'id': storyline_row['id'],
-        'label': storyline_row['label'],
-        'status': storyline_row['status'],
-        'momentum_score': storyline_row['momentum_score'],
-        'first_date': storyline_row['first_date'],
-        'last_date': storyline_row['last_date']
-    }
+    storyline = dict(storyline_row)
     
     # Get articles
     cursor.execute("""
@@ -110,18 +115,7 @@ def get_storyline_articles(storyline_id):
         WHERE sa.storyline_id = ?
         ORDER BY sa.sequence_order
     """, (storyline_id,))
-    
-    articles = []
-    for row in cursor.fetchall():
-        articles.append({
-            'id': row['id'],
-            'title': row['title'],
-            'date': row['date'],
-            'tier': row['tier'],
-            'sequence_order': row['sequence_order']
-        })
-    
-    conn.close()
+    articles = fetchall_dicts(cursor)
     
     return jsonify({'storyline': storyline, 'articles': articles})
 
@@ -2,11 +2,57 @@
 Timeline API endpoints.
 Provides temporal distribution of articles over time.
 """
-from flask import Blueprint, jsonify, request
-from backend.db import get_db
+from flask import Blueprint, request
+from backend.db import get_request_db, get_corpus_version
+from backend.config import Config
+from backend.api.caching import ResponseCache, conditional_response
+from backend.api.serialization import raw_json_list_response
 
 timeline_bp = Blueprint('timeline', __name__)
 
+# Encoded bins JSON per (corpus version, grouping, cluster filter)
+_bins_cache = ResponseCache(maxsize=64, ttl=60)
+
+
+def _timeline_sql(period_column, conditions):
+    """
+    Build the timeline statement for one grouping column and filter set.
+    
+    Aggregates per (period, cluster), then folds each period's clusters into
+    a by_cluster object and encodes the bins as a JSON array, all in SQLite.
+    """
+    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+    return f"""
+        WITH counts AS (
+            SELECT {period_column} AS date_period,
+                   COALESCE(CAST(cluster_id AS TEXT), 'null') AS cluster_key,
+                   COUNT(*) AS count
+            FROM articles
+            {where_clause}
+            GROUP BY {period_column}, cluster_id
+        ),
+        bins AS (
+            SELECT date_period, SUM(count) AS count,
+                   json_group_object(cluster_key, count) AS by_cluster
+            FROM counts
+            GROUP BY date_period
+            ORDER BY date_period ASC
+        )
+        SELECT json_group_array(json_object(
+            'date', date_period, 'count', count, 'by_cluster', json(by_cluster)
+        ))
+        FROM bins
+    """
+
+
+# date_period_month is a generated column (date_bin, or the date's
+# year-month), indexed together with cluster_id; other groupings use
+# date_bin as-is
+_TIMELINE_SQL_MONTH_ALL = _timeline_sql("date_period_month", [])
+_TIMELINE_SQL_MONTH_BY_CLUSTER = _timeline_sql("date_period_month", ["cluster_id = ?"])
+_TIMELINE_SQL_BIN_ALL = _timeline_sql("date_bin", ["date_bin IS NOT NULL"])
+_TIMELINE_SQL_BIN_BY_CLUSTER = _timeline_sql("date_bin", ["cluster_id = ?", "date_bin IS NOT NULL"])
+
 
 @timeline_bp.route('/timeline', methods=['GET'])
 def get_timeline():
@@ -35,82 +81,33 @@ def get_timeline():
             ...
         ]
     }
+    
+    Responses carry an ETag (304 when unchanged) and may be cached for
+    Config.API_CACHE_MAX_AGE seconds; the encoded bins are also cached
+    in-process until the corpus changes.
     """
-    conn = get_db()
-    cursor = conn.cursor()
+    conn = get_request_db()
     
-    try:
-        cluster_id = request.args.get('cluster_id', type=int)
-        group_by = request.args.get('group_by', 'month')  # month, week, or use date_bin
-        
-        # Build WHERE clause
-        conditions = []
-        params = []
-        
-        if cluster_id is not None:
-            conditions.append("cluster_id = ?")
-            params.append(cluster_id)
-        
-        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-        
-        # Query to get counts grouped by date_bin
-        # If no date_bin, use the date column's year-month
-        if group_by == 'month':
-            # Group by date_bin if available, otherwise extract year-month from date
-            cursor.execute(f"""
-                SELECT 
-                    COALESCE(date_bin, strftime('%Y-%m', date)) as date_period,
-                    COUNT(*) as count,
-                    cluster_id
-                FROM articles
-                {where_clause}
-                GROUP BY date_period, cluster_id
-                ORDER BY date_period ASC
-            """, params)
-        else:
-            # Use date_bin as-is
-            cursor.execute(f"""
-                SELECT 
-                    date_bin as date_period,
-                    COUNT(*) as count,
-                    cluster_id
-                FROM articles
-                {where_clause}
-                AND date_bin IS NOT NULL
-                GROUP BY date_bin, cluster_id
-                ORDER BY date_bin ASC
-            """, params)
-        
-        rows = cursor.fetchall()
-        
-        # Group by date_period and aggregate by cluster
-        bins_dict = {}
-        
-        for row in rows:
-            date_period = row['date_period']
-            count = row['count']
-            cluster_id = row['cluster_id']
-            
-            if date_period not in bins_dict:
-                bins_dict[date_period] = {
-                    'date': date_period,
-                    'count': 0,
-                    'by_cluster': {}
-                }
-            
-            bins_dict[date_period]['count'] += count
-            
-            # Track by cluster
-            cluster_key = str(cluster_id) if cluster_id is not None else 'null'
-            bins_dict[date_period]['by_cluster'][cluster_key] = \
-                bins_dict[date_period]['by_cluster'].get(cluster_key, 0) + count
-        
-        # Convert to list and sort
-        bins = sorted(bins_dict.values(), key=lambda x: x['date'])
-        
-        return jsonify({
-            'bins': bins
-        })
-    finally:
-        conn.close()
-
+    cluster_id = request.args.get('cluster_id', type=int)
+    group_by = request.args.get('group_by', 'month')  # month, week, or use date_bin
+    
+    # One fixed statement per (grouping, cluster filter) combination, so the
+    # SQL text is stable and hits sqlite3's prepared-statement cache
+    month = group_by == 'month'
+    if cluster_id is not None:
+        sql = _TIMELINE_SQL_MONTH_BY_CLUSTER if month else _TIMELINE_SQL_BIN_BY_CLUSTER
+        params = (cluster_id,)
+    else:
+        sql = _TIMELINE_SQL_MONTH_ALL if month else _TIMELINE_SQL_BIN_ALL
+        params = ()
+    
+    version = get_corpus_version(conn)
+    key = ('month' if month else 'date_bin', cluster_id)
+    
+    def build():
+        bins_json = _bins_cache.get_or_build(
+            (version, *key), lambda: conn.execute(sql, params).fetchone()[0]
+        )
+        return raw_json_list_response('bins', bins_json)
+    
+    return conditional_response(version, key, build, max_age=Config.API_CACHE_MAX_AGE)
@@ -2,12 +2,54 @@
 UMAP API endpoints.
 Provides 2D UMAP projection coordinates for visualization.
 """
-from flask import Blueprint, jsonify, request
-from backend.db import get_db
+import numpy as np
+import orjson
+from flask import Blueprint, Response, request
+from backend.db import get_request_db, get_corpus_version, fetchall_dicts
 from backend.config import Config
+from backend.api.caching import conditional_response
+from backend.api.serialization import ORJSON_OPTIONS, json_list_response
 
 umap_bp = Blueprint('umap', __name__)
 
+# cluster_id value for unclustered points in the columnar format
+UNCLUSTERED = -1
+
+# Fixed statements (one per detail level and format) so the SQL text is
+# stable and hits sqlite3's prepared-statement cache
+_UMAP_SQL_TEMPLATE = """
+    SELECT id, CAST(umap_x AS REAL) AS x, CAST(umap_y AS REAL) AS y, {cluster_column}{detail_columns}
+    FROM articles
+    WHERE umap_x IS NOT NULL AND umap_y IS NOT NULL
+    ORDER BY id
+"""
+_UMAP_SQL = _UMAP_SQL_TEMPLATE.format(cluster_column="cluster_id", detail_columns="")
+_UMAP_DETAILS_SQL = _UMAP_SQL_TEMPLATE.format(cluster_column="cluster_id", detail_columns=", title, summary")
+
+# The columnar format maps NULL clusters to UNCLUSTERED in SQL, so every
+# row fits the fixed-width record dtype below
+_UMAP_COLUMNS_CLUSTER = f"COALESCE(cluster_id, {UNCLUSTERED}) AS cluster_id"
+_UMAP_COLUMNS_SQL = _UMAP_SQL_TEMPLATE.format(cluster_column=_UMAP_COLUMNS_CLUSTER, detail_columns="")
+_UMAP_COLUMNS_DETAILS_SQL = _UMAP_SQL_TEMPLATE.format(
+    cluster_column=_UMAP_COLUMNS_CLUSTER, detail_columns=", title, summary"
+)
+
+# Record layouts for the columnar format, one field per selected column
+_COLUMNS_DTYPE = np.dtype([
+    ('id', np.int64), ('x', np.float32), ('y', np.float32), ('cluster_id', np.int32),
+])
+_COLUMNS_DETAILS_DTYPE = np.dtype(_COLUMNS_DTYPE.descr + [('title', object), ('summary', object)])
+
+# Projection settings reported in every response's meta block
+UMAP_META = {
+    'model': Config.EMBEDDING_MODEL_NAME,
+    'umap': {
+        'n_neighbors': Config.UMAP_N_NEIGHBORS,
+        'min_dist': Config.UMAP_MIN_DIST,
+        'metric': Config.UMAP_METRIC
+    }
+}
+
 
 @umap_bp.route('/umap', methods=['GET'])
 def get_umap():
@@ -16,6 +58,10 @@ def get_umap():
     
     Returns 2D UMAP positions for all articles with coordinates.
     
+    Query parameters:
+    - include_details: If "true", include title and summary (default: false)
+    - format: "points" (default) or "columns"
+    
     Response:
     {
         "points": [
@@ -33,59 +79,73 @@ def get_umap():
             "has_clusters": true
         }
     }
+    
+    With format=columns, "points" is a struct of arrays instead,
+    {"id": [...], "x": [...], "y": [...], "cluster_id": [...]}, where x/y are
+    float32 and unclustered points have cluster_id -1.
+    
+    Responses carry an ETag (304 when unchanged) and may be cached for
+    Config.API_CACHE_MAX_AGE seconds.
     """
-    conn = get_db()
-    cursor = conn.cursor()
+    conn = get_request_db()
     
-    try:
-        # Get all articles with UMAP coordinates (include title and summary for tooltips)
-        include_details = request.args.get('include_details', 'false').lower() == 'true'
-        
-        if include_details:
-            cursor.execute("""
-                SELECT id, umap_x, umap_y, cluster_id, title, summary
-                FROM articles
-                WHERE umap_x IS NOT NULL AND umap_y IS NOT NULL
-                ORDER BY id
-            """)
-        else:
-            cursor.execute("""
-                SELECT id, umap_x, umap_y, cluster_id
-                FROM articles
-                WHERE umap_x IS NOT NULL AND umap_y IS NOT NULL
-                ORDER BY id
-            """)
-        
-        points = []
-        for row in cursor.fetchall():
-            point = {
-                'id': row['id'],
-                'x': float(row['umap_x']) if row['umap_x'] is not None else None,
-                'y': float(row['umap_y']) if row['umap_y'] is not None else None,
-                'cluster_id': row['cluster_id']
-            }
-            if include_details:
-                point['title'] = row['title']
-                point['summary'] = row['summary']
-            points.append(point)
-        
-        # Check if we have clusters
-        cursor.execute("SELECT COUNT(*) FROM clusters")
-        has_clusters = cursor.fetchone()[0] > 0
-        
-        return jsonify({
-            'points': points,
-            'meta': {
-                'model': Config.EMBEDDING_MODEL.split('/')[-1],  # Just model name
-                'umap': {
-                    'n_neighbors': Config.UMAP_N_NEIGHBORS,
-                    'min_dist': Config.UMAP_MIN_DIST,
-                    'metric': Config.UMAP_METRIC
-                },
-                'total_points': len(points),
-                'has_clusters': has_clusters
-            }
-        })
-    finally:
-        conn.close()
+    # Get all articles with UMAP coordinates (include title and summary for tooltips)
+    include_details = request.args.get('include_details', 'false').lower() == 'true'
+    
+    columnar = request.args.get('format', 'points') == 'columns'
+    
+    return conditional_response(
+        get_corpus_version(conn), (include_details, columnar),
+        lambda: _build_umap_response(conn.cursor(), include_details, columnar),
+        max_age=Config.API_CACHE_MAX_AGE
+    )
+
 
+def _build_umap_response(cursor, include_details, columnar):
+    """Query the projected points and meta block for GET /api/umap."""
+    if columnar:
+        points, total_points = _fetch_columns(cursor, include_details)
+    else:
+        cursor.execute(_UMAP_DETAILS_SQL if include_details else _UMAP_SQL)
+        points = fetchall_dicts(cursor)
+        total_points = len(points)
+    
+    # Check if we have clusters
+    cursor.execute("SELECT EXISTS(SELECT 1 FROM clusters)")
+    has_clusters = bool(cursor.fetchone()[0])
+    
+    meta = {
+        **UMAP_META,
+        'total_points': total_points,
+        'has_clusters': has_clusters
+    }
+    
+    if columnar:
+        body = orjson.dumps({'points': points, 'meta': meta},
+                            option=ORJSON_OPTIONS | orjson.OPT_SERIALIZE_NUMPY)
+        return Response(body, mimetype='application/json')
+    
+    return json_list_response('points', points, meta=meta)
+
+
+def _fetch_columns(cursor, include_details):
+    """
+    Fetch UMAP rows into typed NumPy columns (struct of arrays).
+    
+    Rows are read straight from the cursor into one record array, so the
+    float/int coercion happens in NumPy's C loop rather than per value in
+    Python. Returns (columns, row count).
+    """
+    cursor.row_factory = None  # plain tuples, which np.fromiter reads as records
+    cursor.execute(_UMAP_COLUMNS_DETAILS_SQL if include_details else _UMAP_COLUMNS_SQL)
+    records = np.fromiter(cursor, dtype=_COLUMNS_DETAILS_DTYPE if include_details else _COLUMNS_DTYPE)
+    
+    # orjson serializes contiguous numeric arrays only; text fields are lists
+    columns = {
+        name: np.ascontiguousarray(records[name])
+        for name in _COLUMNS_DTYPE.names
+    }
+    if include_details:
+        columns['title'] = records['title'].tolist()
+        columns['summary'] = records['summary'].tolist()
+    return columns, len(records)
@@ -10,11 +10,52 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def load_or_create_secret(path):
+    """
+    Read the generated secret key at path, creating it on first use.
+    
+    The key is written to a temporary file and hard-linked into place, so
+    another process sees either no file or the complete key. An empty
+    file (left by an interrupted write) is treated as missing.
+    """
+    path = Path(path)
+    try:
+        secret = path.read_text().strip()
+    except FileNotFoundError:
+        secret = ''
+    if secret:
+        return secret
+    
+    secret = os.urandom(24).hex()
+    tmp_path = path.with_name(f'.tmp.{os.getpid()}.{path.name}')
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(secret)
+        try:
+            os.link(tmp_path, path)
+        except FileExistsError:
+            # Another process got there first (or an empty file was left)
+            existing = path.read_text().strip()
+            if existing:
+                return existing
+            os.replace(tmp_path, path)
+    except OSError:
+        return secret  # Unwritable instance dir; fall back to a per-process key
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return secret
+
+
 class Config:
     """Application configuration."""
     
     # Flask settings
-    SECRET_KEY = os.getenv('SECRET_KEY', os.urandom(24).hex())
+    # Unset: create_app generates one and keeps it in SECRET_KEY_PATH
+    # (default <instance_path>/.secret_key) so sessions survive restarts
+    SECRET_KEY = os.getenv('SECRET_KEY')
+    SECRET_KEY_PATH = os.getenv('SECRET_KEY_PATH')
     PORT = int(os.getenv('PORT', 5000))
     
     # Database
@@ -30,6 +71,9 @@ class Config:
     CLUSTER_MIN_SIZE = int(os.getenv('CLUSTER_MIN_SIZE', 8))
     CLUSTER_MIN_SAMPLES = int(os.getenv('CLUSTER_MIN_SAMPLES', 1))
     KNN_K = int(os.getenv('KNN_K', 20))  # Top-k neighbors for similarity graph
+    HDBSCAN_CACHE_DIR = os.getenv('HDBSCAN_CACHE_DIR', os.path.join('data', 'hdbscan_cache'))
+    HDBSCAN_CACHE_BYTES = int(os.getenv('HDBSCAN_CACHE_BYTES', 1024 ** 3))  # Trimmed to this after each fit
+    USE_GPU_CLUSTERING = os.getenv('USE_GPU_CLUSTERING', 'false').lower() == 'true'  # Needs RAPIDS cuML
     
     # UMAP configuration
     UMAP_N_NEIGHBORS = int(os.getenv('UMAP_N_NEIGHBORS', 15))
@@ -38,15 +82,50 @@ class Config:
     
     # FAISS index
     FAISS_INDEX_PATH = os.getenv('FAISS_INDEX_PATH', os.path.join('data', 'faiss.index'))
+    # index_factory spec, or 'auto': Flat under FAISS_FLAT_MAX_VECTORS, then
+    # 8-bit scalar-quantized HNSW32 under FAISS_HNSW_MAX_VECTORS, IVF{4*sqrt(n)} above
+    FAISS_INDEX_SPEC = os.getenv('FAISS_INDEX_SPEC', 'auto')
+    FAISS_FLAT_MAX_VECTORS = int(os.getenv('FAISS_FLAT_MAX_VECTORS', 10000))
+    FAISS_HNSW_MAX_VECTORS = int(os.getenv('FAISS_HNSW_MAX_VECTORS', 1000000))
+    FAISS_EF_SEARCH = int(os.getenv('FAISS_EF_SEARCH', 64))  # HNSW search breadth
+    FAISS_NPROBE = int(os.getenv('FAISS_NPROBE', 16))  # IVF lists scanned per query
+    
+    # Normalized embedding matrix reused by clustering until embeddings change
+    EMBEDDINGS_CACHE_PATH = os.getenv('EMBEDDINGS_CACHE_PATH', os.path.join('data', 'embeddings_normalized.npy'))
+    
+    # Cluster centroids from the last full clustering, used to assign new articles
+    CLUSTER_CENTROIDS_PATH = os.getenv('CLUSTER_CENTROIDS_PATH', os.path.join('data', 'cluster_centroids.npz'))
     
     # Embedding model
     EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
+    EMBEDDING_MODEL_NAME = EMBEDDING_MODEL.rsplit('/', 1)[-1]  # Without the org prefix
     EMBEDDING_DIM = int(os.getenv('EMBEDDING_DIM', 384))
+    # Stored embeddings are unit length (encode normalizes them), so FAISS
+    # skips re-normalizing; set false for embeddings written another way
+    ASSUME_NORMALIZED = os.getenv('ASSUME_NORMALIZED', 'true').lower() == 'true'
+    # With several GPUs, embeddings are encoded by one worker process per GPU,
+    # dispatched at least this many texts at a time
+    MULTIGPU_THRESHOLD = int(os.getenv('MULTIGPU_THRESHOLD', 1000))
+    # Intra-op threads for CPU encoding (0 = min(8, CPU count))
+    TORCH_NUM_THREADS = int(os.getenv('TORCH_NUM_THREADS', 0))
+    # Run the model in half precision when on a GPU
+    EMBEDDING_FP16 = os.getenv('EMBEDDING_FP16', 'true').lower() == 'true'
     
     # KeyBERT configuration
     KEYBERT_TOP_N = int(os.getenv('KEYBERT_TOP_N', 10))
     KEYBERT_TOP_K_LABELS = int(os.getenv('KEYBERT_TOP_K_LABELS', 3))
     
+    # Seconds clients and CDNs may reuse /api/timeline and /api/umap responses
+    API_CACHE_MAX_AGE = int(os.getenv('API_CACHE_MAX_AGE', 60))
+    
+    # Response compression (flask-compress >= 1.15 for streaming)
+    COMPRESS_MIMETYPES = ['application/json']
+    COMPRESS_LEVEL = int(os.getenv('COMPRESS_LEVEL', 6))
+    # Smaller bodies fit in one packet either way; compressing them only costs CPU
+    COMPRESS_MIN_SIZE = int(os.getenv('COMPRESS_MIN_SIZE', 1024))
+    COMPRESS_ALGORITHM = ['br', 'gzip']  # br when accepted, gzip for every other client
+    COMPRESS_ALGORITHM_STREAMING = ['br', 'deflate']  # Streamed list responses (gzip can't stream)
+    
     # Ensure data directory exists
     @staticmethod
     def ensure_directories():
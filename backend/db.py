@@ -2,316 +2,633 @@
 Database connection and schema initialization.
 Uses SQLite with FTS5 for full-text search.
 """
-import sqlite3
+try:
+    # pysqlite3-binary bundles a current, optimized SQLite build; fall back to
+    # the interpreter's sqlite3 where no wheel is available
+    import pysqlite3 as sqlite3
+except ImportError:
+    import sqlite3
 from pathlib import Path
+from flask import g
 from backend.config import Config
 
+# Tables whose writes bump corpus_version (invalidates cached API responses)
+VERSIONED_TABLES = (
+    'articles', 'clusters', 'entities', 'article_entities', 'entity_roles',
+    'storylines', 'storyline_articles', 'alerts',
+)
+
+# Per-connection tuning applied to every connection when it is opened
+# (journal_mode=WAL is persistent, so init_db sets it once per database)
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Additional settings for the read-only request connection
+REQUEST_PRAGMAS = CONNECTION_PRAGMAS + (
+    "PRAGMA query_only=1",
+)
+
+# Compiled statements kept per request connection (sqlite3 default is 128)
+REQUEST_STATEMENT_CACHE_SIZE = 256
+
 
 def get_db():
-    """Get a database connection."""
-    Config.ensure_directories()
+    """
+    Get a database connection.
+    
+    The database directory must already exist; init_db() creates it at
+    startup.
+    """
     conn = sqlite3.connect(Config.DATABASE_PATH)
     conn.row_factory = sqlite3.Row  # Enable column access by name
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
     return conn
 
 
+def get_request_db():
+    """
+    Get the database connection for the current request.
+    
+    The connection is read-only, opened once per app context and cached on
+    flask.g, so handlers must not close it; close_request_db() does that on
+    teardown. Writes go through get_db().
+    """
+    if 'db' not in g:
+        # API handlers only read, so open read-only; WAL (set by init_db)
+        # lets these readers run alongside ingest and pipeline writers
+        uri = Path(Config.DATABASE_PATH).resolve().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True, cached_statements=REQUEST_STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        for pragma in REQUEST_PRAGMAS:
+            conn.execute(pragma)
+        g.db = conn
+    return g.db
+
+
+def close_request_db(exception=None):
+    """Close the request connection (registered as an app-context teardown)."""
+    conn = g.pop('db', None)
+    if conn is not None:
+        conn.close()
+
+
+def fetchall_dicts(cursor):
+    """Fetch all remaining rows from a cursor as plain dicts keyed by column name."""
+    keys = [column[0] for column in cursor.description]
+    # Iterate the cursor so rows are converted as they are stepped, without
+    # first materializing a list of Row objects
+    return [dict(zip(keys, row)) for row in cursor]
+
+
+def get_corpus_version(conn):
+    """
+    Get an opaque token that changes whenever a versioned table is written.
+    
+    The random epoch is generated when the database is created, so tokens
+    never repeat across a deleted and re-created database.
+    """
+    row = conn.execute("SELECT epoch, version FROM corpus_version WHERE id = 1").fetchone()
+    return f"{row[0]}-{row[1]}"
+
+
+def analyze_db(conn):
+    """
+    Refresh the query planner's statistics (sqlite_stat1, plus sqlite_stat4
+    where SQLite is built with it).
+    
+    Run after bulk writes, so filters on skewed columns such as
+    articles.cluster_id are planned against the current distribution.
+    """
+    conn.execute("ANALYZE")
+    conn.commit()
+
+
+def _existing_columns(cursor, table):
+    """Names of all columns of a table, including generated columns."""
+    return {row[1] for row in cursor.execute(f"PRAGMA table_xinfo({table})")}
+
+
+def _add_missing_columns(cursor, table, columns):
+    """
+    Add each (name, definition) column the table lacks (migration).
+    
+    Returns the names of the columns that were added.
+    """
+    existing = _existing_columns(cursor, table)
+    added = []
+    for name, definition in columns:
+        if name not in existing:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+            added.append(name)
+    return added
+
+
+def _create_widened_index(cursor, index_name, table, columns):
+    """
+    Create a multi-column index, replacing the single-column index of the
+    same name that older databases have (migration).
+    """
+    cursor.execute(f"PRAGMA index_info({index_name})")
+    if len(cursor.fetchall()) == 1:
+        cursor.execute(f"DROP INDEX {index_name}")
+    cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table}({columns})")
+
+
 def init_db():
-    """Initialize the database schema (idempotent)."""
+    """
+    Initialize the database schema (idempotent).
+    
+    Applies each SCHEMA_MIGRATIONS step newer than the database's
+    PRAGMA user_version, then records the latest version, so an up-to-date
+    database costs a single pragma read. Also creates the data directories,
+    so connections opened afterwards need no filesystem checks.
+    """
+    Config.ensure_directories()
     conn = get_db()
     cursor = conn.cursor()
     
-    # Create articles table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS articles (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            title TEXT NOT NULL,
-            summary TEXT,
-            url TEXT UNIQUE NOT NULL,
-            outlet TEXT,
-            date TEXT NOT NULL,
-            date_bin TEXT,
-            cluster_id INTEGER,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # Add P1/P2 columns to articles table if they don't exist (migration for existing databases)
-    for column in ['cluster_id', 'umap_x', 'umap_y', 'storyline_id']:
-        try:
-            if column == 'storyline_id':
-                cursor.execute(f"ALTER TABLE articles ADD COLUMN {column} INTEGER REFERENCES storylines(id)")
-            else:
-                cursor.execute(f"ALTER TABLE articles ADD COLUMN {column} REAL")
-        except sqlite3.OperationalError:
-            # Column already exists, which is fine
-            pass
+    # WAL is persistent, so read-only request connections inherit it
+    cursor.execute("PRAGMA journal_mode=WAL")
     
-    # Create embeddings table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS embeddings (
-            article_id INTEGER PRIMARY KEY,
-            vec BLOB NOT NULL,
-            FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
-        )
-    """)
+    current_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+    pending = [(version, migrate) for version, migrate in SCHEMA_MIGRATIONS if version > current_version]
     
-    # Create similarities table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS similarities (
-            src_id INTEGER NOT NULL,
-            dst_id INTEGER NOT NULL,
-            cosine REAL NOT NULL,
-            shared_entities TEXT,
-            shared_terms TEXT,
-            tier TEXT CHECK(tier IN ('near_duplicate', 'continuation', 'related')),
-            PRIMARY KEY (src_id, dst_id),
-            FOREIGN KEY (src_id) REFERENCES articles(id) ON DELETE CASCADE,
-            FOREIGN KEY (dst_id) REFERENCES articles(id) ON DELETE CASCADE
-        )
-    """)
+    for version, migrate in pending:
+        migrate(cursor)
+        cursor.execute(f"PRAGMA user_version = {version}")
     
-    # Add tier column to similarities if it doesn't exist (migration)
-    try:
-        cursor.execute("ALTER TABLE similarities ADD COLUMN tier TEXT CHECK(tier IN ('near_duplicate', 'continuation', 'related'))")
-    except sqlite3.OperationalError:
-        # Column already exists, which is fine
-        pass
+    conn.commit()
     
-    # Create clusters table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS clusters (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            label TEXT,
-            size INTEGER,
-            score REAL
-        )
-    """)
+    if pending:
+        # New tables and indexes start without statistics
+        analyze_db(conn)
+    conn.close()
     
-    # Create entities table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS entities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT NOT NULL,
-            type TEXT CHECK(type IN ('PERSON','ORG','GPE','LOC','OTHER')),
-            canonical_name TEXT
-        )
-    """)
+    if pending:
+        print(f"Database initialized at {Config.DATABASE_PATH} (schema version {pending[-1][0]})")
+
+
+# Base schema DDL, run as scripts so SQLite parses each batch in one call.
+# Steps that depend on introspection (column upgrades, widened indexes)
+# run between them in _migrate_base_schema.
+_BASE_TABLES_SQL = """
+    -- Create articles table
+    CREATE TABLE IF NOT EXISTS articles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        summary TEXT,
+        url TEXT UNIQUE NOT NULL,
+        outlet TEXT,
+        date TEXT NOT NULL,
+        date_bin TEXT,
+        cluster_id INTEGER,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Create embeddings table
+    CREATE TABLE IF NOT EXISTS embeddings (
+        article_id INTEGER PRIMARY KEY,
+        vec BLOB NOT NULL,
+        FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
+    );
+
+    -- Create similarities table
+    CREATE TABLE IF NOT EXISTS similarities (
+        src_id INTEGER NOT NULL,
+        dst_id INTEGER NOT NULL,
+        cosine REAL NOT NULL,
+        shared_entities TEXT,
+        shared_terms TEXT,
+        tier TEXT CHECK(tier IN ('near_duplicate', 'continuation', 'related')),
+        PRIMARY KEY (src_id, dst_id),
+        FOREIGN KEY (src_id) REFERENCES articles(id) ON DELETE CASCADE,
+        FOREIGN KEY (dst_id) REFERENCES articles(id) ON DELETE CASCADE
+    );
+
+    -- Create clusters table
+    CREATE TABLE IF NOT EXISTS clusters (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        label TEXT,
+        size INTEGER,
+        score REAL
+    );
+
+    -- Create entities table
+    CREATE TABLE IF NOT EXISTS entities (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        type TEXT CHECK(type IN ('PERSON','ORG','GPE','LOC','OTHER')),
+        canonical_name TEXT,
+        degree INTEGER NOT NULL DEFAULT 0
+    );
+
+    -- Create entity_roles table (P2)
+    CREATE TABLE IF NOT EXISTS entity_roles (
+        entity_id INTEGER NOT NULL,
+        article_id INTEGER NOT NULL,
+        role_type TEXT CHECK(role_type IN ('protagonist', 'antagonist', 'subject', 'adjudicator', 'neutral')) NOT NULL,
+        confidence REAL DEFAULT 0.5,
+        evidence TEXT,
+        PRIMARY KEY (entity_id, article_id),
+        FOREIGN KEY (entity_id) REFERENCES entities(id) ON DELETE CASCADE,
+        FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
+    );
+
+    -- Create storylines table (P2.2)
+    CREATE TABLE IF NOT EXISTS storylines (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        label TEXT NOT NULL,
+        status TEXT CHECK(status IN ('active', 'dormant', 'concluded')),
+        momentum_score REAL DEFAULT 0.0,
+        first_date TEXT NOT NULL,
+        last_date TEXT NOT NULL,
+        article_count INTEGER DEFAULT 0
+    );
+
+    -- Create storyline_articles table (P2.2)
+    CREATE TABLE IF NOT EXISTS storyline_articles (
+        storyline_id INTEGER NOT NULL,
+        article_id INTEGER NOT NULL,
+        tier TEXT CHECK(tier IN ('tier1', 'tier2', 'tier3')),
+        sequence_order INTEGER NOT NULL,
+        PRIMARY KEY (storyline_id, article_id),
+        FOREIGN KEY (storyline_id) REFERENCES storylines(id) ON DELETE CASCADE,
+        FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
+    );
+
+    -- Create alerts table (P3.2)
+    CREATE TABLE IF NOT EXISTS alerts (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        alert_type TEXT CHECK(alert_type IN ('topic_surge', 'story_reactivation', 'new_actor', 'divergence')) NOT NULL,
+        entity_json TEXT NOT NULL,
+        triggered_at TEXT NOT NULL,
+        description TEXT NOT NULL,
+        severity TEXT CHECK(severity IN ('low', 'medium', 'high')) DEFAULT 'medium',
+        acknowledged BOOLEAN DEFAULT 0
+    );
+
+    -- Create article_entities table
+    CREATE TABLE IF NOT EXISTS article_entities (
+        article_id INTEGER NOT NULL,
+        entity_id INTEGER NOT NULL,
+        weight REAL,
+        count INTEGER DEFAULT 1,
+        first_mention_char INTEGER,
+        confidence REAL DEFAULT 1.0,
+        PRIMARY KEY (article_id, entity_id),
+        FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE,
+        FOREIGN KEY (entity_id) REFERENCES entities(id) ON DELETE CASCADE
+    );
+
+    -- Create vector_meta table for FAISS index metadata
+    CREATE TABLE IF NOT EXISTS vector_meta (
+        version INTEGER PRIMARY KEY DEFAULT 1,
+        dim INTEGER NOT NULL,
+        count INTEGER NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Create corpus_version table (single row bumped by triggers on every write)
+    CREATE TABLE IF NOT EXISTS corpus_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        epoch TEXT NOT NULL DEFAULT (lower(hex(randomblob(8)))),
+        version INTEGER NOT NULL DEFAULT 0
+    );
+    INSERT OR IGNORE INTO corpus_version (id) VALUES (1);
+
+    -- Create full-text search virtual table (FTS5)
+    CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+        title,
+        summary,
+        content='articles',
+        content_rowid='id',
+        tokenize='porter unicode61'
+    );
+
+    -- Trigram FTS5 table for substring search on entity names
+    CREATE VIRTUAL TABLE IF NOT EXISTS entities_fts USING fts5(
+        name,
+        content='entities',
+        content_rowid='id',
+        tokenize='trigram'
+    );
+"""
+
+_BASE_INDEXES_SQL = """
+    -- Create indexes (outlet, cluster, and similarity source indexes are
+    -- created by _create_widened_index, which upgrades legacy databases)
+    CREATE INDEX IF NOT EXISTS idx_articles_date
+    ON articles(date);
+
+    -- Covering indexes for the /api/timeline GROUP BY date_bin, cluster_id
+    CREATE INDEX IF NOT EXISTS idx_articles_datebin_cluster
+    ON articles(date_bin, cluster_id);
+
+    CREATE INDEX IF NOT EXISTS idx_articles_cluster_datebin
+    ON articles(cluster_id, date_bin);
+
+    CREATE INDEX IF NOT EXISTS idx_articles_period_month
+    ON articles(date_period_month, cluster_id);
+
+    -- Create indexes for P1 tables
+    CREATE INDEX IF NOT EXISTS idx_embeddings_article
+    ON embeddings(article_id);
+
+    CREATE INDEX IF NOT EXISTS idx_similarities_dst
+    ON similarities(dst_id);
+
+    CREATE INDEX IF NOT EXISTS idx_entities_name
+    ON entities(name);
+
+    CREATE INDEX IF NOT EXISTS idx_entities_type
+    ON entities(type);
+
+    -- Serves /api/entities, which filters and orders by degree
+    CREATE INDEX IF NOT EXISTS idx_entities_degree
+    ON entities(degree DESC, type);
+
+    -- Reverse of the article_entities primary key, for entity -> articles lookups
+    CREATE INDEX IF NOT EXISTS idx_article_entities_entity
+    ON article_entities(entity_id, article_id);
+
+    -- Create indexes for entity_roles table (P2)
+    CREATE INDEX IF NOT EXISTS idx_entity_roles_article
+    ON entity_roles(article_id);
+
+    CREATE INDEX IF NOT EXISTS idx_entity_roles_entity
+    ON entity_roles(entity_id);
+
+    -- Create indexes for storylines tables (P2.2)
+    CREATE INDEX IF NOT EXISTS idx_articles_storyline
+    ON articles(storyline_id);
+
+    -- Matches the /api/storylines keyset order (momentum, recency, id)
+    CREATE INDEX IF NOT EXISTS idx_storylines_momentum
+    ON storylines(momentum_score DESC, last_date DESC, id DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_storyline_articles_order
+    ON storyline_articles(storyline_id, sequence_order);
+
+    -- Create indexes for alerts table (P3.2)
+    CREATE INDEX IF NOT EXISTS idx_alerts_triggered
+    ON alerts(triggered_at DESC);
+
+    CREATE INDEX IF NOT EXISTS idx_alerts_type
+    ON alerts(alert_type);
+
+    CREATE INDEX IF NOT EXISTS idx_alerts_severity
+    ON alerts(severity);
+"""
+
+_BASE_TRIGGERS_SQL = """
+    -- Create trigger to keep FTS5 in sync with articles table
+    CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, summary)
+        VALUES('delete', old.id, old.title, old.summary);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, title, summary)
+        VALUES('delete', old.id, old.title, old.summary);
+        INSERT INTO articles_fts(rowid, title, summary)
+        VALUES (new.id, new.title, new.summary);
+    END;
+
+    -- Create triggers to keep entities_fts in sync with entity names
+    CREATE TRIGGER IF NOT EXISTS entities_fts_insert AFTER INSERT ON entities BEGIN
+        INSERT INTO entities_fts(rowid, name) VALUES (new.id, new.name);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS entities_fts_delete AFTER DELETE ON entities BEGIN
+        INSERT INTO entities_fts(entities_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    END;
+
+    -- Only on name changes, so degree bumps don't rewrite the index
+    CREATE TRIGGER IF NOT EXISTS entities_fts_update AFTER UPDATE OF name ON entities BEGIN
+        INSERT INTO entities_fts(entities_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        INSERT INTO entities_fts(rowid, name) VALUES (new.id, new.name);
+    END;
+
+    -- Create triggers to keep entities.degree in sync with article_entities
+    CREATE TRIGGER IF NOT EXISTS article_entities_degree_insert AFTER INSERT ON article_entities BEGIN
+        UPDATE entities SET degree = degree + 1 WHERE id = new.entity_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS article_entities_degree_delete AFTER DELETE ON article_entities BEGIN
+        UPDATE entities SET degree = degree - 1 WHERE id = old.entity_id;
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS article_entities_degree_update AFTER UPDATE OF entity_id ON article_entities
+    WHEN new.entity_id != old.entity_id BEGIN
+        UPDATE entities SET degree = degree - 1 WHERE id = old.entity_id;
+        UPDATE entities SET degree = degree + 1 WHERE id = new.entity_id;
+    END;
+""" + "".join(
+    # Bump corpus_version on writes to versioned tables
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} AFTER {event} ON {table} BEGIN
+        UPDATE corpus_version SET version = version + 1 WHERE id = 1;
+    END;
+"""
+    for table in VERSIONED_TABLES
+    for event in ('INSERT', 'UPDATE', 'DELETE')
+)
+
+
+def _execute_script(cursor, script):
+    """Run a DDL script as one transaction."""
+    cursor.executescript(f"BEGIN;\n{script}\nCOMMIT;")
+
+
+def _migrate_base_schema(cursor):
+    """
+    Schema version 1: every table, index, and trigger.
     
-    # Add canonical_name column if it doesn't exist (migration)
-    try:
-        cursor.execute("ALTER TABLE entities ADD COLUMN canonical_name TEXT")
-    except sqlite3.OperationalError:
-        # Column already exists, which is fine
-        pass
+    Databases created before schema versioning report user_version 0 and
+    may be at any earlier layout, so this step stays idempotent and
+    upgrades them in place.
+    """
+    # entities_fts is rebuilt below only when this step creates it
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='entities_fts'")
+    entities_fts_exists = cursor.fetchone() is not None
     
-    # Create entity_roles table (P2)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS entity_roles (
-            entity_id INTEGER NOT NULL,
-            article_id INTEGER NOT NULL,
-            role_type TEXT CHECK(role_type IN ('protagonist', 'antagonist', 'subject', 'adjudicator', 'neutral')) NOT NULL,
-            confidence REAL DEFAULT 0.5,
-            evidence TEXT,
-            PRIMARY KEY (entity_id, article_id),
-            FOREIGN KEY (entity_id) REFERENCES entities(id) ON DELETE CASCADE,
-            FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
-        )
-    """)
+    _execute_script(cursor, _BASE_TABLES_SQL)
     
-    # Create storylines table (P2.2)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS storylines (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            label TEXT NOT NULL,
-            status TEXT CHECK(status IN ('active', 'dormant', 'concluded')),
-            momentum_score REAL DEFAULT 0.0,
-            first_date TEXT NOT NULL,
-            last_date TEXT NOT NULL,
-            article_count INTEGER DEFAULT 0
-        )
-    """)
-    
-    # Create storyline_articles table (P2.2)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS storyline_articles (
-            storyline_id INTEGER NOT NULL,
-            article_id INTEGER NOT NULL,
-            tier TEXT CHECK(tier IN ('tier1', 'tier2', 'tier3')),
-            sequence_order INTEGER NOT NULL,
-            PRIMARY KEY (storyline_id, article_id),
-            FOREIGN KEY (storyline_id) REFERENCES storylines(id) ON DELETE CASCADE,
-            FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE
-        )
-    """)
+    # Add P1/P2 columns to articles table if they don't exist (migration for existing databases)
+    _add_missing_columns(cursor, 'articles', [
+        ('cluster_id', "REAL"),
+        ('umap_x', "REAL"),
+        ('umap_y', "REAL"),
+        ('storyline_id', "INTEGER REFERENCES storylines(id)"),
+        # Month bucket used by /api/timeline: date_bin, or the date's year-month
+        ('date_period_month', "TEXT GENERATED ALWAYS AS (COALESCE(date_bin, substr(date, 1, 7))) VIRTUAL"),
+    ])
     
-    # Create alerts table (P3.2)
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS alerts (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            alert_type TEXT CHECK(alert_type IN ('topic_surge', 'story_reactivation', 'new_actor', 'divergence')) NOT NULL,
-            entity_json TEXT NOT NULL,
-            triggered_at TEXT NOT NULL,
-            description TEXT NOT NULL,
-            severity TEXT CHECK(severity IN ('low', 'medium', 'high')) DEFAULT 'medium',
-            acknowledged BOOLEAN DEFAULT 0
-        )
-    """)
+    # Add tier column to similarities if it doesn't exist (migration)
+    _add_missing_columns(cursor, 'similarities', [
+        ('tier', "TEXT CHECK(tier IN ('near_duplicate', 'continuation', 'related'))"),
+    ])
     
-    # Create article_entities table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS article_entities (
-            article_id INTEGER NOT NULL,
-            entity_id INTEGER NOT NULL,
-            weight REAL,
-            count INTEGER DEFAULT 1,
-            first_mention_char INTEGER,
-            confidence REAL DEFAULT 1.0,
-            PRIMARY KEY (article_id, entity_id),
-            FOREIGN KEY (article_id) REFERENCES articles(id) ON DELETE CASCADE,
-            FOREIGN KEY (entity_id) REFERENCES entities(id) ON DELETE CASCADE
-        )
-    """)
+    # Add canonical_name column if it doesn't exist (migration)
+    _add_missing_columns(cursor, 'entities', [('canonical_name', "TEXT")])
     
     # Add P2 columns to article_entities if they don't exist (migration)
-    for column in ['count', 'first_mention_char', 'confidence']:
-        try:
-            if column == 'count':
-                cursor.execute(f"ALTER TABLE article_entities ADD COLUMN {column} INTEGER DEFAULT 1")
-            elif column == 'first_mention_char':
-                cursor.execute(f"ALTER TABLE article_entities ADD COLUMN {column} INTEGER")
-            elif column == 'confidence':
-                cursor.execute(f"ALTER TABLE article_entities ADD COLUMN {column} REAL DEFAULT 1.0")
-        except sqlite3.OperationalError:
-            # Column already exists, which is fine
-            pass
-    
-    # Create vector_meta table for FAISS index metadata
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS vector_meta (
-            version INTEGER PRIMARY KEY DEFAULT 1,
-            dim INTEGER NOT NULL,
-            count INTEGER NOT NULL,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-    
-    # Create full-text search virtual table (FTS5)
-    cursor.execute("""
-        CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
-            title,
-            summary,
-            content='articles',
-            content_rowid='id',
-            tokenize='porter unicode61'
-        )
-    """)
-    
-    # Create indexes
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_articles_date 
-        ON articles(date)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_articles_outlet 
-        ON articles(outlet)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_articles_cluster 
-        ON articles(cluster_id)
-    """)
-    
-    # Create indexes for P1 tables
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_embeddings_article 
-        ON embeddings(article_id)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_similarities_src 
-        ON similarities(src_id)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_similarities_dst 
-        ON similarities(dst_id)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_entities_name 
-        ON entities(name)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_entities_type 
-        ON entities(type)
-    """)
-    
-    # Create indexes for entity_roles table (P2)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_entity_roles_article 
-        ON entity_roles(article_id)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_entity_roles_entity 
-        ON entity_roles(entity_id)
-    """)
-    
-    # Create indexes for storylines tables (P2.2)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_articles_storyline 
-        ON articles(storyline_id)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_storyline_articles_order
-        ON storyline_articles(storyline_id, sequence_order)
-    """)
-    
-    # Create indexes for alerts table (P3.2)
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_alerts_triggered
-        ON alerts(triggered_at DESC)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_alerts_type
-        ON alerts(alert_type)
-    """)
-    
-    cursor.execute("""
-        CREATE INDEX IF NOT EXISTS idx_alerts_severity
-        ON alerts(severity)
-    """)
-    
-    # Create trigger to keep FTS5 in sync with articles table
+    _add_missing_columns(cursor, 'article_entities', [
+        ('count', "INTEGER DEFAULT 1"),
+        ('first_mention_char', "INTEGER"),
+        ('confidence', "REAL DEFAULT 1.0"),
+    ])
+    
+    # Add degree column (articles mentioning the entity) if it doesn't exist (migration)
+    if _add_missing_columns(cursor, 'entities', [('degree', "INTEGER NOT NULL DEFAULT 0")]):
+        # Backfill from existing links; triggers keep it current from here on
+        cursor.execute("""
+            UPDATE entities SET degree = (
+                SELECT COUNT(*) FROM article_entities ae WHERE ae.entity_id = entities.id
+            )
+        """)
+    
+    if not entities_fts_exists:
+        # Index entities that predate the FTS table
+        cursor.execute("INSERT INTO entities_fts(entities_fts) VALUES ('rebuild')")
+    
+    # Outlet and cluster filters are listed newest first, so these indexes
+    # carry date (and the implicit rowid) to avoid a sort
+    _create_widened_index(cursor, 'idx_articles_outlet', 'articles', 'outlet, date')
+    _create_widened_index(cursor, 'idx_articles_cluster', 'articles', 'cluster_id, date')
+    
+    # Top-k neighbours (/api/similar) walk this index in cosine order
+    _create_widened_index(cursor, 'idx_similarities_src', 'similarities', 'src_id, cosine DESC')
+    
+    _execute_script(cursor, _BASE_INDEXES_SQL + _BASE_TRIGGERS_SQL)
+
+
+def _migrate_umap_index(cursor):
+    """Schema version 2: covering partial index for the /api/umap scan."""
     cursor.execute("""
-        CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
-            INSERT INTO articles_fts(rowid, title, summary) 
-            VALUES (new.id, new.title, new.summary);
-        END
+        CREATE INDEX IF NOT EXISTS idx_articles_umap_nn
+        ON articles(id, umap_x, umap_y, cluster_id)
+        WHERE umap_x IS NOT NULL AND umap_y IS NOT NULL
     """)
-    
-    cursor.execute("""
-        CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
-            INSERT INTO articles_fts(articles_fts, rowid, title, summary) 
-            VALUES('delete', old.id, old.title, old.summary);
-        END
+
+
+def _migrate_embedding_dtype(cursor):
+    """Schema version 3: record the element type of each embedding BLOB."""
+    # Existing rows were all written as float32
+    _add_missing_columns(cursor, 'embeddings', [('dtype', "TEXT NOT NULL DEFAULT 'float32'")])
+
+
+def _migrate_dashboard_indexes(cursor):
+    """Schema version 4: widen idx_articles_date to cover the dashboard scans."""
+    # The per-day heatmap and cluster evolution read only date and cluster_id;
+    # key_actors reaches article_entities through its (article_id, ...) key
+    _create_widened_index(cursor, 'idx_articles_date', 'articles', 'date, cluster_id')
+
+
+def _migrate_embedding_scale(cursor):
+    """Schema version 5: per-vector scale for int8 embedding BLOBs (NULL otherwise)."""
+    _add_missing_columns(cursor, 'embeddings', [('scale', "REAL")])
+
+
+def _migrate_entity_first_seen(cursor):
+    """
+    Schema version 6: date each entity was first mentioned.
+    
+    Backfilled here and kept current by triggers on article_entities, so new
+    actor detection reads one row per entity instead of scanning its history.
+    """
+    _execute_script(cursor, """
+        CREATE TABLE IF NOT EXISTS entity_first_seen (
+            entity_id INTEGER PRIMARY KEY,
+            first_date TEXT,
+            FOREIGN KEY (entity_id) REFERENCES entities(id) ON DELETE CASCADE
+        );
+        
+        CREATE INDEX IF NOT EXISTS idx_entity_first_seen_date
+        ON entity_first_seen(first_date);
+        
+        INSERT OR REPLACE INTO entity_first_seen (entity_id, first_date)
+        SELECT ae.entity_id, MIN(a.date)
+        FROM article_entities ae
+        JOIN articles a ON ae.article_id = a.id
+        GROUP BY ae.entity_id;
+        
+        CREATE TRIGGER IF NOT EXISTS article_entities_first_seen_insert AFTER INSERT ON article_entities BEGIN
+            INSERT INTO entity_first_seen (entity_id, first_date)
+            SELECT new.entity_id, date FROM articles WHERE id = new.article_id
+            ON CONFLICT (entity_id) DO UPDATE SET first_date = excluded.first_date
+            WHERE first_date IS NULL OR excluded.first_date < first_date;
+        END;
+        
+        -- Only recompute when the removed mention could have been the first
+        -- (its article is already gone when the delete cascades from articles)
+        CREATE TRIGGER IF NOT EXISTS article_entities_first_seen_delete AFTER DELETE ON article_entities
+        WHEN coalesce((SELECT date FROM articles WHERE id = old.article_id)
+                      <= (SELECT first_date FROM entity_first_seen WHERE entity_id = old.entity_id), 1) BEGIN
+            UPDATE entity_first_seen SET first_date = (
+                SELECT MIN(a.date)
+                FROM article_entities ae
+                JOIN articles a ON ae.article_id = a.id
+                WHERE ae.entity_id = old.entity_id
+            )
+            WHERE entity_id = old.entity_id;
+        END;
     """)
-    
-    cursor.execute("""
-        CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
-            INSERT INTO articles_fts(articles_fts, rowid, title, summary) 
-            VALUES('delete', old.id, old.title, old.summary);
-            INSERT INTO articles_fts(rowid, title, summary) 
-            VALUES (new.id, new.title, new.summary);
-        END
+
+
+def _migrate_embeddings_version(cursor):
+    """
+    Schema version 7: write counter for the embeddings table.
+    
+    Kept apart from corpus_version.version so the clustering matrix cache is
+    invalidated by embedding writes (including INSERT OR REPLACE rewrites)
+    but not by the cluster assignments every run writes back.
+    """
+    _add_missing_columns(cursor, 'corpus_version', [('embeddings_version', "INTEGER NOT NULL DEFAULT 0")])
+    _execute_script(cursor, "".join(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS embeddings_version_{event.lower()} AFTER {event} ON embeddings BEGIN
+            UPDATE corpus_version SET embeddings_version = embeddings_version + 1 WHERE id = 1;
+        END;
+        """
+        for event in ('INSERT', 'UPDATE', 'DELETE')
+    ))
+
+
+def _migrate_storylines_momentum_index(cursor):
+    """
+    Schema version 8: key idx_storylines_momentum on COALESCE(momentum_score, 0).
+    
+    momentum_score is nullable; /api/storylines orders and pages on the
+    coalesced value, so the index has to use the same expression.
+    """
+    _execute_script(cursor, """
+        DROP INDEX IF EXISTS idx_storylines_momentum;
+        CREATE INDEX idx_storylines_momentum
+        ON storylines(COALESCE(momentum_score, 0) DESC, last_date DESC, id DESC);
     """)
-    
-    conn.commit()
-    conn.close()
-    
-    print(f"Database initialized at {Config.DATABASE_PATH}")
+
+
+# Ordered (version, migration) steps applied by init_db; append new steps
+# with the next version number rather than editing earlier ones
+SCHEMA_MIGRATIONS = [
+    (1, _migrate_base_schema),
+    (2, _migrate_umap_index),
+    (3, _migrate_embedding_dtype),
+    (4, _migrate_dashboard_indexes),
+    (5, _migrate_embedding_scale),
+    (6, _migrate_entity_first_seen),
+    (7, _migrate_embeddings_version),
+    (8, _migrate_storylines_momentum_index),
+]
 
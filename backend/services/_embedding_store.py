@@ -0,0 +1,112 @@
+"""
+Embedding BLOB storage: the int8 codec and the batched matrix loader.
+Kept free of the model and FAISS imports so storage can be used (and
+tested) without them.
+"""
+import numpy as np
+from typing import List, Tuple, Optional
+
+# Rows fetched per batch when loading all embeddings
+EMBEDDING_FETCH_SIZE = 4096
+
+# Element type new embeddings are stored as: int8 with a per-vector scale
+# (max |component| / 127), a quarter of float32. Rows written as float32 or
+# float16 stay readable.
+EMBEDDING_STORAGE_DTYPE = 'int8'
+
+
+def quantize(vectors: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convert (n, dim) float vectors to EMBEDDING_STORAGE_DTYPE rows.
+    
+    Returns:
+        tuple: (stored, scales); scales holds each int8 row's multiplier
+        and is None for float storage
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if EMBEDDING_STORAGE_DTYPE != 'int8':
+        return np.ascontiguousarray(vectors, dtype=EMBEDDING_STORAGE_DTYPE), None
+    
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1  # All-zero rows
+    stored = np.rint(vectors / scales[:, None]).astype(np.int8)
+    return stored, scales
+
+
+def blob_to_vector(blob: bytes, dtype: str = EMBEDDING_STORAGE_DTYPE,
+                   scale: Optional[float] = None) -> np.ndarray:
+    """Convert BLOB stored as dtype (with its int8 scale) to a float32 numpy array."""
+    vector = np.frombuffer(blob, dtype=dtype).astype(np.float32)
+    if scale is not None:
+        vector *= scale
+    return vector
+
+
+def blobs_to_matrix(blobs, dtype: str = EMBEDDING_STORAGE_DTYPE, scales=None) -> np.ndarray:
+    """
+    Convert equal-length BLOBs stored as dtype to an (n, dim) float32 matrix.
+    
+    The blobs are concatenated into one writable buffer and viewed in
+    place, so there is a single allocation instead of one array per row
+    (plus one widening copy for non-float32 storage). Int8 rows are
+    multiplied by their scales in place.
+    """
+    buffer = bytearray().join(blobs)
+    matrix = np.frombuffer(buffer, dtype=dtype).reshape(len(blobs), -1)
+    matrix = matrix.astype(np.float32, copy=False)
+    if scales is not None:
+        matrix *= np.asarray(scales, dtype=np.float32)[:, None]
+    return matrix
+
+
+def load_matrix(conn, after_article_id: int = 0) -> Tuple[np.ndarray, List[int]]:
+    """
+    Load every stored embedding, ordered by article_id.
+    
+    Rows are fetched EMBEDDING_FETCH_SIZE at a time and copied into a
+    preallocated matrix, so only one batch of BLOBs is held at once.
+    
+    Args:
+        conn: Database connection
+        after_article_id: Only load embeddings of articles with a larger id
+    
+    Returns:
+        tuple: (embeddings_array, article_ids_list); the array is empty
+        if there are no embeddings
+    """
+    cursor = conn.cursor()
+    cursor.arraysize = EMBEDDING_FETCH_SIZE
+    
+    # Count and scan in one read transaction so they see the same rows
+    cursor.execute("BEGIN")
+    try:
+        cursor.execute("SELECT COUNT(*) FROM embeddings WHERE article_id > ?", (after_article_id,))
+        count = cursor.fetchone()[0]
+        if count == 0:
+            return np.array([]), []
+        
+        cursor.execute("""
+            SELECT article_id, vec, dtype, scale FROM embeddings
+            WHERE article_id > ?
+            ORDER BY article_id
+        """, (after_article_id,))
+        embeddings_array = None
+        article_ids = []
+        
+        while rows := cursor.fetchmany():
+            dtypes = {row[2] for row in rows}
+            if len(dtypes) == 1:
+                dtype = dtypes.pop()
+                scales = [row[3] for row in rows] if dtype == 'int8' else None
+                batch = blobs_to_matrix([row[1] for row in rows], dtype, scales)
+            else:
+                # Batch straddles rows written before and after a storage change
+                batch = np.stack([blob_to_vector(*row[1:]) for row in rows])
+            if embeddings_array is None:
+                embeddings_array = np.empty((count, batch.shape[1]), dtype=np.float32)
+            embeddings_array[len(article_ids):len(article_ids) + len(rows)] = batch
+            article_ids.extend(row[0] for row in rows)
+        
+        return embeddings_array, article_ids
+    finally:
+        conn.rollback()
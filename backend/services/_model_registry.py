@@ -0,0 +1,43 @@
+"""
+Shared sentence-transformers models.
+Loads each model once per process so services that embed text reuse it.
+"""
+import logging
+import os
+import threading
+from pathlib import Path
+from sentence_transformers import SentenceTransformer
+import torch
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+_models = {}
+_lock = threading.Lock()
+
+
+def get_sentence_transformer(model_name: str = None) -> SentenceTransformer:
+    """
+    Get a sentence-transformers model, loading it on first use.
+    
+    Args:
+        model_name: Model to load (defaults to Config.EMBEDDING_MODEL)
+        
+    Returns:
+        SentenceTransformer shared by every caller in this process
+    """
+    model_name = model_name or Config.EMBEDDING_MODEL
+    with _lock:
+        if model_name not in _models:
+            logger.info(f"Loading embedding model: {model_name}")
+            cache_dir = Path(Config.MODEL_CACHE_DIR)
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Load model with cache directory
+            model = SentenceTransformer(model_name, cache_folder=str(cache_dir))
+            torch.set_num_threads(Config.TORCH_NUM_THREADS or min(8, os.cpu_count() or 1))
+            if Config.EMBEDDING_FP16 and torch.cuda.is_available():
+                model.half()
+            logger.info(f"Model loaded: {model_name}")
+            _models[model_name] = model
+        return _models[model_name]
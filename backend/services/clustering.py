@@ -2,19 +2,54 @@
 Clustering service.
 Clusters articles using HDBSCAN with k-means fallback.
 """
+import json
 import logging
 import numpy as np
+from pathlib import Path
 import sqlite3
 from typing import Tuple, List, Dict
-from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score
+from scipy.sparse import csr_matrix
+from sklearn.cluster import KMeans, MiniBatchKMeans
 import hdbscan
+from joblib import Memory, Parallel, delayed, effective_n_jobs
+from threadpoolctl import threadpool_limits
 from backend.db import get_db
 from backend.config import Config
 from backend.services.embeddings import EmbeddingService
 
+# Optional GPU implementations (RAPIDS cuML), used with Config.USE_GPU_CLUSTERING
+try:
+    from cuml.cluster import HDBSCAN as GPUHDBSCAN, KMeans as GPUKMeans
+    HAS_CUML = True
+except ImportError:
+    HAS_CUML = False
+
+# Approximate k-NN graphs for HDBSCAN (pynndescent ships with umap-learn)
+try:
+    from pynndescent import NNDescent
+    HAS_PYNNDESCENT = True
+except ImportError:
+    HAS_PYNNDESCENT = False
+
 logger = logging.getLogger(__name__)
 
+# k-means k scan: stop after this many consecutive k without a better silhouette
+KMEANS_PATIENCE = 3
+KMEANS_BATCH_SIZE = 4096
+
+# HDBSCAN over larger corpora runs on random batches of this many points
+# (it lumps most points into one cluster when fit on tens of thousands),
+# re-pooling each pass's noise for the next pass
+HDBSCAN_BATCH_SIZE = 3000
+HDBSCAN_BATCH_PASSES = 2
+# Batch clusters whose normalized centroids are closer than this are merged
+HDBSCAN_MERGE_DISTANCE = 0.3
+# Fits on at least this many points use a sparse approximate k-NN distance
+# graph (exact neighbour search degrades towards brute force at embedding
+# dimensionality); smaller fits use exact distances
+HDBSCAN_ANN_MIN_POINTS = 1000
+HDBSCAN_ANN_NEIGHBORS = 30
+
 
 class ClusteringService:
     """Service for clustering articles using HDBSCAN or k-means."""
@@ -24,47 +59,203 @@ class ClusteringService:
         self.embedding_service = EmbeddingService()
         self.min_cluster_size = Config.CLUSTER_MIN_SIZE
         self.min_samples = Config.CLUSTER_MIN_SAMPLES
+        self.use_gpu = Config.USE_GPU_CLUSTERING and HAS_CUML
+        if Config.USE_GPU_CLUSTERING and not HAS_CUML:
+            logger.warning("USE_GPU_CLUSTERING is set but cuML is not installed; clustering on CPU")
         
-    def _load_embeddings(self) -> Tuple[np.ndarray, List[int]]:
+    def _load_embeddings(self, conn=None) -> Tuple[np.ndarray, List[int]]:
         """
-        Load all embeddings from database.
+        Load all embeddings from database, L2-normalized.
+        
+        The normalized matrix is cached at Config.EMBEDDINGS_CACHE_PATH and
+        memory-mapped on later runs while the embeddings table is unchanged.
+        
+        Args:
+            conn: Connection to read with; a new one is opened (and closed)
+                if omitted
         
         Returns:
             tuple: (embeddings_array, article_ids_list)
         """
-        conn = get_db()
+        own_conn = conn is None
+        if own_conn:
+            conn = get_db()
         cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                SELECT e.article_id, e.vec
-                FROM embeddings e
-                ORDER BY e.article_id
-            """)
-            rows = cursor.fetchall()
-            
-            if len(rows) == 0:
-                return np.array([]), []
-            
-            embeddings = []
-            article_ids = []
+            cache_key = self._embeddings_cache_key(cursor)
+            cached = self._read_embeddings_cache(cache_key)
+            if cached is not None:
+                cursor.execute("SELECT article_id FROM embeddings ORDER BY article_id")
+                article_ids = [row[0] for row in cursor]
+                if len(article_ids) == len(cached):
+                    logger.info(f"Loaded {len(cached)} normalized embeddings from cache")
+                    return cached, article_ids
             
-            for row in rows:
-                vector = self.embedding_service._blob_to_vector(row['vec'])
-                embeddings.append(vector)
-                article_ids.append(row['article_id'])
+            embeddings_array, article_ids = self.embedding_service._load_matrix(conn)
             
-            embeddings_array = np.array(embeddings, dtype=np.float32)
+            if len(article_ids) == 0:
+                return embeddings_array, article_ids
             
-            # Normalize for cosine similarity
-            norms = np.linalg.norm(embeddings_array, axis=1, keepdims=True)
+            # Normalize for cosine similarity, in place (row norms from one
+            # einsum pass, no temporary copy of the matrix)
+            norms = np.einsum('ij,ij->i', embeddings_array, embeddings_array)
+            np.sqrt(norms, out=norms)
             norms[norms == 0] = 1  # Avoid division by zero
-            embeddings_array = embeddings_array / norms
+            embeddings_array /= norms[:, None]
+            
+            self._write_embeddings_cache(cache_key, embeddings_array)
             
             return embeddings_array, article_ids
             
         finally:
-            conn.close()
+            if own_conn:
+                conn.close()
+    
+    def _embeddings_cache_key(self, cursor) -> Dict:
+        """Describe the embeddings table contents the cache must match."""
+        # The epoch is random per database, so a cache left by another
+        # database never matches; embeddings_version is bumped by triggers
+        # on every embeddings write
+        cursor.execute("SELECT epoch, embeddings_version FROM corpus_version WHERE id = 1")
+        database, version = cursor.fetchone()
+        return {
+            'database': database,
+            'version': version,
+            'model': self.embedding_service.model_name,
+            'dim': self.embedding_service.dim,
+        }
+    
+    @staticmethod
+    def _read_embeddings_cache(key: Dict):
+        """Memory-map the cached matrix if its sidecar matches key, else None."""
+        cache_path = Path(Config.EMBEDDINGS_CACHE_PATH)
+        try:
+            with open(cache_path.with_suffix('.json')) as f:
+                if json.load(f) != key:
+                    return None
+            return np.load(cache_path, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _write_embeddings_cache(key: Dict, embeddings: np.ndarray):
+        """Save the normalized matrix and its sidecar (best effort)."""
+        cache_path = Path(Config.EMBEDDINGS_CACHE_PATH)
+        sidecar_path = cache_path.with_suffix('.json')
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Drop the old sidecar first so a partial write is never trusted
+            sidecar_path.unlink(missing_ok=True)
+            np.save(cache_path, embeddings)
+            with open(sidecar_path, 'w') as f:
+                json.dump(key, f)
+        except OSError as e:
+            logger.warning(f"Could not write embeddings cache: {e}")
+    
+    def _save_centroids(self, database: str, embeddings: np.ndarray, labels: np.ndarray,
+                        article_ids: List[int]):
+        """
+        Save cluster centroids and radii for assigning later articles (best effort).
+        
+        A cluster's radius is the distance from its centroid to its farthest
+        member; new articles outside every radius are left unclustered.
+        """
+        centroids_path = Path(Config.CLUSTER_CENTROIDS_PATH)
+        clustered = labels >= 0
+        try:
+            if not clustered.any():
+                centroids_path.unlink(missing_ok=True)
+                return
+            
+            cluster_ids, centroids = self._normalized_centroids(embeddings, labels)
+            rows = np.searchsorted(cluster_ids, labels[clustered])
+            distances = np.linalg.norm(embeddings[clustered] - centroids[rows], axis=1)
+            radii = np.zeros(len(cluster_ids), dtype=np.float32)
+            np.maximum.at(radii, rows, distances)
+            
+            self._write_centroids(database, cluster_ids, centroids, radii, max(article_ids))
+        except OSError as e:
+            logger.warning(f"Could not write cluster centroids: {e}")
+    
+    @staticmethod
+    def _write_centroids(database: str, cluster_ids: np.ndarray, centroids: np.ndarray,
+                         radii: np.ndarray, last_article_id: int):
+        """Write the centroid file (raises OSError)."""
+        centroids_path = Path(Config.CLUSTER_CENTROIDS_PATH)
+        centroids_path.parent.mkdir(parents=True, exist_ok=True)
+        # Open the path ourselves so np.savez does not append .npz
+        with open(centroids_path, 'wb') as f:
+            np.savez(f, database=database, cluster_ids=cluster_ids, centroids=centroids,
+                     radii=radii, last_article_id=last_article_id)
+    
+    @staticmethod
+    def _read_centroids(database: str):
+        """Load the centroid file if it was written for this database, else None."""
+        try:
+            with np.load(Config.CLUSTER_CENTROIDS_PATH) as state:
+                if str(state['database']) != database:
+                    return None
+                return {name: state[name] for name in state.files}
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _assign_new_articles(self, conn, database: str):
+        """
+        Assign articles embedded since the last full clustering to the
+        nearest existing cluster, without reclustering.
+        
+        Returns:
+            dict: {'assigned': int, 'unassigned': int}, or None if there are
+            no centroids saved for this database
+        """
+        state = self._read_centroids(database)
+        if state is None:
+            return None
+        
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT article_id, vec, dtype, scale FROM embeddings
+            WHERE article_id > ?
+            ORDER BY article_id
+        """, (int(state['last_article_id']),))
+        rows = cursor.fetchall()
+        if not rows:
+            return {'assigned': 0, 'unassigned': 0}
+        
+        article_ids = [row[0] for row in rows]
+        vectors = np.stack([self.embedding_service._blob_to_vector(*row[1:]) for row in rows])
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        vectors /= norms
+        
+        # Euclidean distance between unit vectors from their dot products
+        distances = np.sqrt(np.maximum(0.0, 2.0 - 2.0 * (vectors @ state['centroids'].T)))
+        nearest = distances.argmin(axis=1)
+        within = distances[np.arange(len(rows)), nearest] <= state['radii'][nearest]
+        assigned = state['cluster_ids'][nearest[within]]
+        
+        updates = list(zip(assigned.tolist(), np.asarray(article_ids)[within].tolist()))
+        sizes = np.unique(assigned, return_counts=True)
+        
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany("UPDATE articles SET cluster_id = ? WHERE id = ?", updates)
+            cursor.executemany("UPDATE clusters SET size = size + ? WHERE id = ?",
+                               zip(sizes[1].tolist(), sizes[0].tolist()))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        
+        try:
+            self._write_centroids(database, state['cluster_ids'], state['centroids'],
+                                  state['radii'], article_ids[-1])
+        except OSError as e:
+            logger.warning(f"Could not write cluster centroids: {e}")
+        
+        logger.info(f"Assigned {len(updates)} of {len(rows)} new articles to existing clusters")
+        return {'assigned': len(updates), 'unassigned': len(rows) - len(updates)}
     
     def _cluster_hdbscan(self, embeddings: np.ndarray) -> Tuple[np.ndarray, int]:
         """
@@ -79,17 +270,26 @@ class ClusteringService:
             n_clusters: number of clusters found
         """
         logger.info(f"Running HDBSCAN with min_cluster_size={self.min_cluster_size}, "
-                   f"min_samples={self.min_samples}")
+                   f"min_samples={self.min_samples}{' on GPU' if self.use_gpu else ''}")
+        
+        if not self.use_gpu:
+            # The hdbscan package builds its trees in float64; cast once here
+            # instead of letting every fit (one per batch) copy its slice
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float64)
         
         # HDBSCAN doesn't support 'cosine' metric directly
         # Use 'euclidean' on normalized vectors (equivalent to cosine distance)
-        clusterer = hdbscan.HDBSCAN(
-            min_cluster_size=self.min_cluster_size,
-            min_samples=self.min_samples,
-            metric='euclidean'  # Euclidean on normalized vectors = cosine distance
-        )
-        
-        labels = clusterer.fit_predict(embeddings)
+        if len(embeddings) > HDBSCAN_BATCH_SIZE:
+            labels = self._cluster_hdbscan_batched(embeddings)
+        else:
+            # Reuse the minimum spanning tree when the same embeddings are
+            # reclustered. Only this whole-corpus fit is cached: batched fits
+            # would add an entry per batch on every run
+            memory = None if self.use_gpu else Memory(Config.HDBSCAN_CACHE_DIR, verbose=0)
+            labels = self._hdbscan_fit_predict(embeddings, memory=memory)
+            if memory is not None:
+                # Evict the least recently used entries past the size budget
+                memory.reduce_size(bytes_limit=Config.HDBSCAN_CACHE_BYTES)
         
         # Count clusters (excluding noise label -1)
         unique_labels = set(labels)
@@ -99,9 +299,186 @@ class ClusteringService:
         
         return labels, n_clusters
     
+    def _cluster_hdbscan_batched(self, embeddings: np.ndarray, batch_size: int = HDBSCAN_BATCH_SIZE,
+                                 passes: int = HDBSCAN_BATCH_PASSES) -> np.ndarray:
+        """
+        Run HDBSCAN on random batches and merge the per-batch clusters.
+        
+        Each pass shuffles the still-unclustered points and fits HDBSCAN per
+        batch; points left as noise are pooled into the next pass. Clusters
+        found in different batches are then merged by centroid distance.
+        
+        Args:
+            embeddings: Normalized embedding vectors
+            batch_size: Points per HDBSCAN fit
+            passes: Number of passes over the unclustered points
+            
+        Returns:
+            labels: cluster labels (-1 for noise), numbered from 0
+        """
+        rng = np.random.default_rng(42)
+        labels = np.full(len(embeddings), -1, dtype=np.int64)
+        remaining = np.arange(len(embeddings))
+        next_label = 0
+        
+        for pass_num in range(passes):
+            if len(remaining) < self.min_cluster_size:
+                break
+            remaining = rng.permutation(remaining)
+            noise = []
+            
+            for start in range(0, len(remaining), batch_size):
+                batch = remaining[start:start + batch_size]
+                batch_labels = self._hdbscan_fit_predict(embeddings[batch])
+                clustered = batch_labels >= 0
+                
+                labels[batch[clustered]] = batch_labels[clustered] + next_label
+                if clustered.any():
+                    next_label += int(batch_labels.max()) + 1
+                noise.append(batch[~clustered])
+            
+            remaining = np.concatenate(noise)
+            logger.info(f"HDBSCAN pass {pass_num + 1}: {next_label} batch clusters, {len(remaining)} noise points")
+        
+        return self._merge_close_clusters(embeddings, labels)
+    
+    @staticmethod
+    def _merge_close_clusters(embeddings: np.ndarray, labels: np.ndarray,
+                              max_distance: float = HDBSCAN_MERGE_DISTANCE) -> np.ndarray:
+        """
+        Merge clusters whose normalized centroids are within max_distance.
+        
+        Merging is transitive (union-find over the close pairs). Returns
+        labels renumbered from 0, with noise left at -1.
+        """
+        clustered = labels >= 0
+        if not clustered.any():
+            return labels
+        
+        cluster_labels = labels[clustered]
+        cluster_ids, centroids = ClusteringService._normalized_centroids(embeddings, labels)
+        
+        # Euclidean distance between unit vectors from their dot products
+        similarity = centroids @ centroids.T
+        distances = np.sqrt(np.maximum(0.0, 2.0 - 2.0 * similarity))
+        
+        parent = np.arange(len(cluster_ids))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for i, j in np.argwhere(np.triu(distances < max_distance, k=1)):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[root_j] = root_i
+        
+        roots = np.array([find(i) for i in range(len(cluster_ids))])
+        _, merged = np.unique(roots, return_inverse=True)
+        
+        # Map each original label to its merged, renumbered label
+        lookup = np.full(int(cluster_ids.max()) + 1, -1, dtype=np.int64)
+        lookup[cluster_ids] = merged
+        merged_labels = labels.copy()
+        merged_labels[clustered] = lookup[cluster_labels]
+        return merged_labels
+    
+    @staticmethod
+    def _normalized_centroids(embeddings: np.ndarray, labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Unit-length centroid of each cluster, noise excluded.
+        
+        Returns:
+            tuple: (cluster_ids, centroids), cluster_ids ascending and
+            centroids a float32 row per cluster id
+        """
+        clustered = labels >= 0
+        
+        # Centroids via one sort and reduceat instead of a mask per cluster
+        cluster_labels = labels[clustered]
+        order = np.argsort(cluster_labels, kind='stable')
+        sorted_labels = cluster_labels[order]
+        starts = np.flatnonzero(np.r_[True, sorted_labels[1:] != sorted_labels[:-1]])
+        cluster_ids = sorted_labels[starts]
+        centroids = np.add.reduceat(embeddings[clustered][order], starts, axis=0).astype(np.float32)
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        centroids /= norms
+        return cluster_ids, centroids
+    
+    def _hdbscan_fit_predict(self, embeddings: np.ndarray, memory: Memory = None) -> np.ndarray:
+        """
+        Fit HDBSCAN on one set of points, on an approximate k-NN graph when possible.
+        
+        memory caches the exact-distance fit; the sparse graph fit is not cached.
+        """
+        if self.use_gpu or not HAS_PYNNDESCENT or len(embeddings) < HDBSCAN_ANN_MIN_POINTS:
+            return self._hdbscan_model(memory=memory).fit_predict(embeddings)
+        
+        try:
+            graph = self._knn_distance_graph(embeddings)
+            return self._hdbscan_model(metric='precomputed').fit_predict(graph)
+        except ValueError as e:
+            # HDBSCAN rejects sparse graphs that split into several components
+            logger.info(f"Approximate k-NN graph not usable ({e}); using exact distances")
+            return self._hdbscan_model(memory=memory).fit_predict(embeddings)
+    
+    @staticmethod
+    def _knn_distance_graph(embeddings: np.ndarray) -> csr_matrix:
+        """
+        Symmetric sparse Euclidean k-NN distance graph, via pynndescent.
+        
+        Each point's self match is dropped; exact duplicates keep a tiny
+        nonzero distance so they remain edges of the sparse graph.
+        """
+        n = len(embeddings)
+        n_neighbors = min(HDBSCAN_ANN_NEIGHBORS + 1, n - 1)
+        indices, distances = NNDescent(
+            embeddings, n_neighbors=n_neighbors, metric='euclidean', random_state=42
+        ).neighbor_graph
+        
+        rows = np.repeat(np.arange(n), indices.shape[1])
+        cols = indices.ravel()
+        keep = (cols >= 0) & (cols != rows)
+        graph = csr_matrix(
+            (np.maximum(distances.ravel()[keep], 1e-8), (rows[keep], cols[keep])), shape=(n, n)
+        )
+        return graph.maximum(graph.T).tocsr()
+    
+    def _hdbscan_model(self, metric: str = 'euclidean', memory: Memory = None):
+        """
+        HDBSCAN estimator (cuML on GPU, else the hdbscan package).
+        
+        memory, if given, caches the CPU fit's minimum spanning tree.
+        """
+        if self.use_gpu:
+            # cuML returns NumPy labels for NumPy input
+            return GPUHDBSCAN(
+                min_cluster_size=self.min_cluster_size,
+                min_samples=self.min_samples,
+                metric='euclidean'
+            )
+        # hdbscan's default memory is an uncached Memory(None)
+        cache_kwargs = {'memory': memory} if memory is not None else {}
+        return hdbscan.HDBSCAN(
+            min_cluster_size=self.min_cluster_size,
+            min_samples=self.min_samples,
+            metric=metric,  # Euclidean (or precomputed Euclidean) on normalized vectors = cosine
+            core_dist_n_jobs=-1,  # Core distances on every CPU
+            **cache_kwargs
+        )
+    
+    def _kmeans_model(self, k: int):
+        """k-means estimator for the k scan (cuML on GPU, else mini-batch)."""
+        if self.use_gpu:
+            return GPUKMeans(n_clusters=k, n_init=3, random_state=42)
+        return MiniBatchKMeans(n_clusters=k, batch_size=KMEANS_BATCH_SIZE, n_init=3, random_state=42)
+    
     def _cluster_kmeans(self, embeddings: np.ndarray, k_range: Tuple[int, int] = (2, 20)) -> Tuple[np.ndarray, int]:
         """
-        Cluster embeddings using k-means with silhouette score optimization.
+        Cluster embeddings using k-means with (centroid) silhouette optimization.
         
         Args:
             embeddings: Normalized embedding vectors
@@ -130,29 +507,37 @@ class ClusteringService:
         best_score = -1
         best_k = k_min
         best_labels = None
-        best_kmeans = None
-        
-        # Try different k values
-        for k in range(k_min, k_max + 1):
-            if k > n_samples:
-                break
-            
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(embeddings)
-            
-            # Calculate silhouette score
-            if len(set(labels)) > 1:  # Need at least 2 clusters for silhouette
-                try:
-                    score = silhouette_score(embeddings, labels, sample_size=min(1000, n_samples))
-                except Exception as e:
-                    logger.warning(f"Error calculating silhouette for k={k}: {e}")
-                    score = -1
+        misses = 0
+        
+        # Fit k values in parallel waves (the fits release the GIL), then
+        # walk each wave in k order until the silhouette stops improving.
+        # Waves are capped at the patience so at most KMEANS_PATIENCE fits
+        # run past the stopping k. Concurrent fits run single-threaded so
+        # they don't oversubscribe the cores: BLAS is limited here (its pool
+        # is process-wide), OpenMP inside each worker (its limit is per thread).
+        candidates = list(range(k_min, min(k_max, n_samples) + 1))
+        n_jobs = 1 if self.use_gpu else min(effective_n_jobs(-1), KMEANS_PATIENCE)
+        fit_threads = 1 if n_jobs > 1 else None
+        with threadpool_limits(limits=fit_threads, user_api='blas'), \
+                Parallel(n_jobs=n_jobs, prefer='threads') as parallel:
+            for start in range(0, len(candidates), n_jobs):
+                wave = candidates[start:start + n_jobs]
+                results = parallel(delayed(self._fit_kmeans)(embeddings, k, fit_threads) for k in wave)
+                
+                for k, (labels, score) in zip(wave, results):
+                    if score > best_score:
+                        best_score = score
+                        best_k = k
+                        best_labels = labels
+                        misses = 0
+                    else:
+                        misses += 1
+                        if misses >= KMEANS_PATIENCE:
+                            break
                 
-                if score > best_score:
-                    best_score = score
-                    best_k = k
-                    best_labels = labels
-                    best_kmeans = kmeans
+                if misses >= KMEANS_PATIENCE:
+                    logger.info(f"Silhouette stopped improving after k={best_k}; stopping at k={k}")
+                    break
         
         if best_labels is None:
             # Fallback: just use k_min
@@ -165,90 +550,112 @@ class ClusteringService:
         
         return best_labels, best_k
     
-    def _update_article_clusters(self, article_ids: List[int], labels: np.ndarray):
+    def _fit_kmeans(self, embeddings: np.ndarray, k: int, n_threads: int = None) -> Tuple[np.ndarray, float]:
         """
-        Update articles.cluster_id in database.
+        Fit k-means for one k and score it.
         
         Args:
-            article_ids: List of article IDs (same order as labels)
-            labels: Cluster labels from clustering
-        """
-        conn = get_db()
-        cursor = conn.cursor()
+            embeddings: Normalized embedding vectors
+            k: Number of clusters
+            n_threads: OpenMP threads for this fit (None leaves the default)
         
-        try:
-            # Update cluster_id for each article
-            # Use NULL for noise points (label == -1)
-            updates = []
-            for article_id, label in zip(article_ids, labels):
-                cluster_id = int(label) if label >= 0 else None
-                updates.append((cluster_id, article_id))
-            
-            cursor.executemany("""
-                UPDATE articles SET cluster_id = ? WHERE id = ?
-            """, updates)
-            
-            conn.commit()
-            
-            # Count articles per cluster
-            cluster_counts = {}
-            for label in labels:
-                if label >= 0:
-                    cluster_counts[int(label)] = cluster_counts.get(int(label), 0) + 1
+        Returns:
+            tuple: (labels, centroid silhouette), the score -1 if all points
+            landed in one cluster
+        """
+        with threadpool_limits(limits=n_threads, user_api='openmp'):
+            kmeans = self._kmeans_model(k)
+            labels = kmeans.fit_predict(embeddings)
             
-            logger.info(f"Updated cluster_id for {len(updates)} articles")
-            logger.info(f"Cluster distribution: {len(cluster_counts)} clusters")
+            # Score with the centroid silhouette (distances to the fitted
+            # centers come from the model, no pairwise distances needed)
+            score = -1
+            if len(set(labels)) > 1:  # Need at least 2 clusters for silhouette
+                score = self._centroid_silhouette(kmeans.transform(embeddings), labels)
+        return labels, score
+    
+    @staticmethod
+    def _centroid_silhouette(distances: np.ndarray, labels: np.ndarray) -> float:
+        """
+        Approximate the silhouette score from point-to-centroid distances.
+        
+        Each point's a is the distance to its own centroid and b the distance
+        to the nearest other centroid; the score is mean((b - a) / max(a, b)).
+        O(n * k), against O(n^2) for the exact silhouette.
+        
+        Args:
+            distances: (n_samples, k) distances to each cluster center
+            labels: Cluster label of each point (column index into distances)
             
-        except Exception as e:
-            logger.error(f"Error updating article clusters: {e}", exc_info=True)
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        Returns:
+            Score in [-1, 1], higher for tighter, better separated clusters
+        """
+        rows = np.arange(len(labels))
+        own = distances[rows, labels].copy()
+        
+        distances = distances.copy()
+        distances[rows, labels] = np.inf
+        nearest_other = distances.min(axis=1)
+        
+        margin = np.maximum(own, nearest_other)
+        scores = np.divide(nearest_other - own, margin, out=np.zeros_like(own), where=margin > 0)
+        return float(scores.mean())
     
-    def _update_clusters_table(self, labels: np.ndarray):
+    @staticmethod
+    def _cluster_sizes(labels: np.ndarray) -> Dict[int, int]:
+        """Count articles per cluster (noise excluded), in cluster id order."""
+        counts = np.bincount(labels[labels >= 0])
+        return {cluster_id: int(count) for cluster_id, count in enumerate(counts) if count > 0}
+    
+    def _update_article_clusters(self, cursor, article_ids: List[int], labels: np.ndarray):
         """
-        Create/update clusters table with cluster metadata.
+        Update articles.cluster_id in the caller's open write transaction.
         
         Args:
+            cursor: Cursor on the connection holding the transaction
+            article_ids: List of article IDs (same order as labels)
             labels: Cluster labels from clustering
         """
-        conn = get_db()
-        cursor = conn.cursor()
+        # Use NULL for noise points (label == -1); tolist() converts the
+        # labels to Python ints in one call
+        updates = [
+            (label if label >= 0 else None, article_id)
+            for label, article_id in zip(labels.tolist(), article_ids)
+        ]
+        cursor.executemany("""
+            UPDATE articles SET cluster_id = ? WHERE id = ?
+        """, updates)
+        
+        logger.info(f"Updated cluster_id for {len(updates)} articles")
+    
+    def _update_clusters_table(self, cursor, labels: np.ndarray):
+        """
+        Replace the clusters table rows in the caller's open write transaction.
         
-        try:
-            # Clear existing clusters
-            cursor.execute("DELETE FROM clusters")
-            
-            # Count articles per cluster
-            cluster_counts = {}
-            for label in labels:
-                if label >= 0:
-                    cluster_id = int(label)
-                    cluster_counts[cluster_id] = cluster_counts.get(cluster_id, 0) + 1
-            
-            # Insert cluster records (labels will be updated in step 7)
-            for cluster_id, size in sorted(cluster_counts.items()):
-                cursor.execute("""
-                    INSERT INTO clusters (id, label, size, score)
-                    VALUES (?, ?, ?, ?)
-                """, (cluster_id, None, size, 0.0))
-            
-            conn.commit()
-            
-            logger.info(f"Updated clusters table: {len(cluster_counts)} clusters")
-            
-        except Exception as e:
-            logger.error(f"Error updating clusters table: {e}", exc_info=True)
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        Args:
+            cursor: Cursor on the connection holding the transaction
+            labels: Cluster labels from clustering
+        """
+        cursor.execute("DELETE FROM clusters")
+        
+        cluster_counts = self._cluster_sizes(labels)
+        
+        # Insert cluster records (labels will be updated in step 7)
+        cursor.executemany("""
+            INSERT INTO clusters (id, label, size, score)
+            VALUES (?, ?, ?, ?)
+        """, [(cluster_id, None, size, 0.0) for cluster_id, size in cluster_counts.items()])
+        
+        logger.info(f"Updated clusters table: {len(cluster_counts)} clusters")
     
     def cluster_articles(self, force_recompute=False) -> Dict:
         """
         Cluster articles using HDBSCAN with k-means fallback.
         
+        Once clusters exist, later calls only assign newly embedded articles
+        to the nearest saved cluster centroid; force_recompute reclusters
+        the whole corpus.
+        
         Args:
             force_recompute: If True, recompute even if clusters exist
             
@@ -261,6 +668,9 @@ class ClusteringService:
         cursor = conn.cursor()
         
         try:
+            cursor.execute("SELECT epoch FROM corpus_version WHERE id = 1")
+            database = cursor.fetchone()[0]
+            
             # Check if clustering already done
             if not force_recompute:
                 cursor.execute("SELECT COUNT(*) FROM articles WHERE cluster_id IS NOT NULL")
@@ -269,6 +679,18 @@ class ClusteringService:
                 if clustered_count > 0:
                     cursor.execute("SELECT COUNT(*) FROM clusters")
                     clusters_count = cursor.fetchone()[0]
+                    
+                    # Fold in articles embedded since the last full run
+                    incremental = self._assign_new_articles(conn, database)
+                    if incremental and incremental['assigned'] + incremental['unassigned'] > 0:
+                        return {
+                            'clusters_created': clusters_count,
+                            'articles_clustered': incremental['assigned'],
+                            'noise': incremental['unassigned'],
+                            'method': 'incremental',
+                            'status': 'completed'
+                        }
+                    
                     logger.info(f"Clustering already exists: {clustered_count} articles, {clusters_count} clusters")
                     return {
                         'clusters_created': clusters_count,
@@ -277,42 +699,53 @@ class ClusteringService:
                         'method': 'existing',
                         'status': 'skipped'
                     }
+            
+            # Load embeddings
+            embeddings, article_ids = self._load_embeddings(conn)
+            
+            if len(embeddings) == 0:
+                logger.warning("No embeddings found for clustering")
+                return {
+                    'clusters_created': 0,
+                    'articles_clustered': 0,
+                    'noise': 0,
+                    'method': None,
+                    'status': 'no_embeddings'
+                }
+            
+            logger.info(f"Clustering {len(embeddings)} articles...")
+            
+            # Try HDBSCAN first
+            labels, n_clusters = self._cluster_hdbscan(embeddings)
+            
+            # Fallback to k-means if HDBSCAN found < 2 clusters
+            method = 'hdbscan'
+            if n_clusters < 2:
+                logger.info("HDBSCAN found < 2 clusters, falling back to k-means")
+                labels, n_clusters = self._cluster_kmeans(embeddings)
+                method = 'kmeans'
+            
+            # Count noise points
+            noise_count = int(np.sum(labels == -1))
+            clustered_count = len(embeddings) - noise_count
+            
+            # Update articles and clusters in one write transaction, with the
+            # write lock taken up front (WAL and synchronous=NORMAL are set by
+            # get_db/init_db)
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                self._update_article_clusters(cursor, article_ids, labels)
+                self._update_clusters_table(cursor, labels)
+                conn.commit()
+            except Exception as e:
+                logger.error(f"Error saving clusters: {e}", exc_info=True)
+                conn.rollback()
+                raise
+            
+            self._save_centroids(database, embeddings, labels, article_ids)
         finally:
             conn.close()
         
-        # Load embeddings
-        embeddings, article_ids = self._load_embeddings()
-        
-        if len(embeddings) == 0:
-            logger.warning("No embeddings found for clustering")
-            return {
-                'clusters_created': 0,
-                'articles_clustered': 0,
-                'noise': 0,
-                'method': None,
-                'status': 'no_embeddings'
-            }
-        
-        logger.info(f"Clustering {len(embeddings)} articles...")
-        
-        # Try HDBSCAN first
-        labels, n_clusters = self._cluster_hdbscan(embeddings)
-        
-        # Fallback to k-means if HDBSCAN found < 2 clusters
-        method = 'hdbscan'
-        if n_clusters < 2:
-            logger.info("HDBSCAN found < 2 clusters, falling back to k-means")
-            labels, n_clusters = self._cluster_kmeans(embeddings)
-            method = 'kmeans'
-        
-        # Count noise points
-        noise_count = int(np.sum(labels == -1))
-        clustered_count = len(embeddings) - noise_count
-        
-        # Update database
-        self._update_article_clusters(article_ids, labels)
-        self._update_clusters_table(labels)
-        
         stats = {
             'clusters_created': n_clusters,
             'articles_clustered': clustered_count,
@@ -6,11 +6,16 @@ summary for the monitoring dashboard.
 """
 
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from backend.db import get_db
+from backend.db import get_db, fetchall_dicts
 
 logger = logging.getLogger(__name__)
 
+# Shared pool for the independent dashboard section queries
+_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix='dashboard')
+
 
 class DashboardService:
     """Service for dashboard data aggregation."""
@@ -45,9 +50,6 @@ class DashboardService:
         """
         logger.info(f"Generating dashboard summary for last {days_back} days...")
         
-        conn = get_db()
-        cursor = conn.cursor()
-        
         summary = {
             "active_storylines": [],
             "recent_alerts": [],
@@ -57,131 +59,133 @@ class DashboardService:
             "stats": {}
         }
         
+        # Get cutoff dates
+        now = datetime.now()
+        days_back_date = (now - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        days_7_ago = (now - timedelta(days=7)).strftime('%Y-%m-%d')
+        
+        # Sections are independent reads, so run them concurrently on separate
+        # connections (sqlite3 releases the GIL while a query executes)
+        sections = {
+            "active_storylines": (self._get_active_storylines,),
+            "temporal_heatmap": (self._get_temporal_heatmap, days_back_date),
+            "key_actors": (self._get_key_actors, days_7_ago),
+            "cluster_evolution": (self._get_cluster_evolution, days_back_date),
+            "stats": (self._get_stats, days_7_ago),
+        }
+        futures = {
+            _executor.submit(self._run_section, *section): name
+            for name, section in sections.items()
+        }
+        
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                summary[name] = future.result()
+            except Exception as e:
+                logger.error(f"Error generating dashboard {name}: {e}", exc_info=True)
+        
+        logger.info("Dashboard summary generated successfully")
+        return summary
+    
+    @staticmethod
+    def _run_section(builder, *args):
+        """Run one section builder on its own connection."""
+        conn = get_db()
         try:
-            # Get cutoff dates
-            now = datetime.now()
-            days_back_date = (now - timedelta(days=days_back)).strftime('%Y-%m-%d')
-            days_7_ago = (now - timedelta(days=7)).strftime('%Y-%m-%d')
-            
-            # Get active storylines (top 10 by momentum)
-            cursor.execute("""
-                SELECT id, label, status, momentum_score, article_count, first_date, last_date
-                FROM storylines
-                WHERE status = 'active'
-                ORDER BY momentum_score DESC, last_date DESC
-                LIMIT 10
-            """)
-            summary["active_storylines"] = [
-                {
-                    'id': row['id'],
-                    'label': row['label'],
-                    'status': row['status'],
-                    'momentum_score': row['momentum_score'],
-                    'article_count': row['article_count'],
-                    'first_date': row['first_date'],
-                    'last_date': row['last_date']
-                }
-                for row in cursor.fetchall()
-            ]
-            
-            # Get temporal heatmap data (last N days)
-            cursor.execute("""
-                SELECT date, COUNT(*) as count
-                FROM articles
-                WHERE date >= ?
-                GROUP BY date
-                ORDER BY date ASC
-            """, (days_back_date,))
-            summary["temporal_heatmap"] = [
-                {'date': row['date'], 'count': row['count']}
-                for row in cursor.fetchall()
-            ]
-            
-            # Get key actors (top 20 entities by mentions in last 7 days)
-            cursor.execute("""
-                SELECT 
-                    e.id as entity_id,
-                    e.name,
-                    e.type,
-                    COUNT(ae.article_id) as mentions_7d
-                FROM entities e
-                JOIN article_entities ae ON e.id = ae.entity_id
-                JOIN articles a ON ae.article_id = a.id
-                WHERE a.date >= ?
-                GROUP BY e.id, e.name, e.type
-                ORDER BY mentions_7d DESC
-                LIMIT 20
-            """, (days_7_ago,))
-            summary["key_actors"] = [
-                {
-                    'entity_id': row['entity_id'],
-                    'name': row['name'],
-                    'type': row['type'],
-                    'mentions_7d': row['mentions_7d']
-                }
-                for row in cursor.fetchall()
-            ]
-            
-            # Get cluster evolution (last N days)
-            cursor.execute("""
-                SELECT 
-                    a.date,
-                    a.cluster_id,
-                    COUNT(*) as count
-                FROM articles a
-                WHERE a.date >= ? AND a.cluster_id IS NOT NULL
-                GROUP BY a.date, a.cluster_id
-                ORDER BY a.date ASC, a.cluster_id ASC
-            """, (days_back_date,))
-            
-            # Group by date
-            evolution_by_date = {}
-            for row in cursor.fetchall():
-                date = row['date']
-                if date not in evolution_by_date:
-                    evolution_by_date[date] = {}
-                evolution_by_date[date][row['cluster_id']] = row['count']
-            
-            # Convert to list format
-            summary["cluster_evolution"] = [
-                {'date': date, 'cluster_sizes': cluster_sizes}
-                for date, cluster_sizes in evolution_by_date.items()
-            ]
-            
-            # Get stats
-            cursor.execute("SELECT COUNT(*) FROM articles")
-            total_articles = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM storylines WHERE status = 'active'")
-            active_storylines_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM storylines WHERE status = 'dormant'")
-            dormant_storylines_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM entities")
-            total_entities = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(*) FROM articles WHERE date >= ?", (days_7_ago,))
-            new_articles_7d = cursor.fetchone()[0]
-            
-            # Get unacknowledged alerts count
-            cursor.execute("SELECT COUNT(*) FROM alerts WHERE acknowledged = 0")
-            unacknowledged_alerts = cursor.fetchone()[0]
-            
-            summary["stats"] = {
-                "total_articles": total_articles,
-                "active_storylines_count": active_storylines_count,
-                "dormant_storylines_count": dormant_storylines_count,
-                "total_entities": total_entities,
-                "new_articles_7d": new_articles_7d,
-                "unacknowledged_alerts": unacknowledged_alerts
-            }
-            
-        except Exception as e:
-            logger.error(f"Error generating dashboard summary: {e}", exc_info=True)
+            return builder(conn.cursor(), *args)
         finally:
             conn.close()
+    
+    @staticmethod
+    def _get_active_storylines(cursor):
+        """Top 10 active storylines by momentum."""
+        cursor.execute("""
+            SELECT id, label, status, momentum_score, article_count, first_date, last_date
+            FROM storylines
+            WHERE status = 'active'
+            ORDER BY momentum_score DESC, last_date DESC
+            LIMIT 10
+        """)
+        return fetchall_dicts(cursor)
+    
+    @staticmethod
+    def _get_temporal_heatmap(cursor, since):
+        """Article counts per day since the cutoff date."""
+        cursor.execute("""
+            SELECT date, COUNT(*) as count
+            FROM articles
+            WHERE date >= ?
+            GROUP BY date
+            ORDER BY date ASC
+        """, (since,))
+        return fetchall_dicts(cursor)
+    
+    @staticmethod
+    def _get_key_actors(cursor, since):
+        """Top 20 entities by mentions since the cutoff date."""
+        cursor.execute("""
+            SELECT 
+                e.id as entity_id,
+                e.name,
+                e.type,
+                COUNT(ae.article_id) as mentions_7d
+            FROM entities e
+            JOIN article_entities ae ON e.id = ae.entity_id
+            JOIN articles a ON ae.article_id = a.id
+            WHERE a.date >= ?
+            GROUP BY e.id, e.name, e.type
+            ORDER BY mentions_7d DESC
+            LIMIT 20
+        """, (since,))
+        return fetchall_dicts(cursor)
+    
+    @staticmethod
+    def _get_cluster_evolution(cursor, since):
+        """Cluster sizes per day since the cutoff date."""
+        cursor.execute("""
+            SELECT 
+                a.date,
+                a.cluster_id,
+                COUNT(*) as count
+            FROM articles a
+            WHERE a.date >= ? AND a.cluster_id IS NOT NULL
+            GROUP BY a.date, a.cluster_id
+            ORDER BY a.date ASC, a.cluster_id ASC
+        """, (since,))
         
-        logger.info("Dashboard summary generated successfully")
-        return summary
-
+        # Group by date
+        evolution_by_date = defaultdict(dict)
+        for date, cluster_id, count in cursor:
+            evolution_by_date[date][cluster_id] = count
+        
+        # Convert to list format
+        return [
+            {'date': date, 'cluster_sizes': cluster_sizes}
+            for date, cluster_sizes in evolution_by_date.items()
+        ]
+    
+    @staticmethod
+    def _get_stats(cursor, new_since):
+        """Headline counts for the stats panel."""
+        # One statement so the panel costs a single roundtrip
+        cursor.execute("""
+            SELECT
+                (SELECT COUNT(*) FROM articles),
+                (SELECT COUNT(*) FROM storylines WHERE status = 'active'),
+                (SELECT COUNT(*) FROM storylines WHERE status = 'dormant'),
+                (SELECT COUNT(*) FROM entities),
+                (SELECT COUNT(*) FROM articles WHERE date >= ?),
+                (SELECT COUNT(*) FROM alerts WHERE acknowledged = 0)
+        """, (new_since,))
+        (total_articles, active_storylines_count, dormant_storylines_count,
+         total_entities, new_articles_7d, unacknowledged_alerts) = cursor.fetchone()
+        
+        return {
+            "total_articles": total_articles,
+            "active_storylines_count": active_storylines_count,
+            "dormant_storylines_count": dormant_storylines_count,
+            "total_entities": total_entities,
+            "new_articles_7d": new_articles_7d,
+            "unacknowledged_alerts": unacknowledged_alerts
+        }
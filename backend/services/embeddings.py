@@ -2,18 +2,36 @@
 Embedding generation service.
 Generates sentence embeddings using sentence-transformers and builds FAISS index.
 """
+import atexit
 import logging
+import os
+import queue
+import re
+import threading
 import numpy as np
-import sqlite3
 from pathlib import Path
-from typing import List, Tuple, Optional
-from sentence_transformers import SentenceTransformer
+from typing import Dict, List, Tuple, Optional
+import torch
 import faiss
-from backend.db import get_db
+from backend.db import get_db, sqlite3
+from backend.services._model_registry import get_sentence_transformer
+from backend.services._embedding_store import (
+    EMBEDDING_STORAGE_DTYPE, blob_to_vector, blobs_to_matrix, load_matrix, quantize
+)
 from backend.config import Config
 
 logger = logging.getLogger(__name__)
 
+# generate_embeddings: batches read ahead of the encoder, and batches
+# written per commit
+EMBEDDING_READ_AHEAD = 2
+EMBEDDING_COMMIT_BATCHES = 10
+
+_INSERT_EMBEDDING_SQL = """
+    INSERT OR REPLACE INTO embeddings (article_id, vec, dtype, scale)
+    VALUES (?, ?, ?, ?)
+"""
+
 
 class EmbeddingService:
     """Service for generating article embeddings and managing FAISS index."""
@@ -21,33 +39,66 @@ class EmbeddingService:
     def __init__(self):
         """Initialize embedding service."""
         self.model = None
+        self.pool = None
         self.model_name = Config.EMBEDDING_MODEL
         self.dim = Config.EMBEDDING_DIM
         
+        # Loaded FAISS index and mapping, reused until the files change
+        self._index = None
+        self._article_ids = None
+        self._index_mtime = None
+        self._index_lock = threading.Lock()
+        
     def _load_model(self):
-        """Load sentence-transformers model (with caching)."""
+        """Load sentence-transformers model (shared with other services)."""
         if self.model is None:
-            logger.info(f"Loading embedding model: {self.model_name}")
-            cache_dir = Path(Config.MODEL_CACHE_DIR)
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Load model with cache directory
-            self.model = SentenceTransformer(
-                self.model_name,
-                cache_folder=str(cache_dir)
-            )
-            logger.info(f"Model loaded: {self.model_name}")
+            self.model = get_sentence_transformer(self.model_name)
         return self.model
     
-    def _vector_to_blob(self, vector: np.ndarray) -> bytes:
-        """Convert numpy array to BLOB for SQLite storage."""
-        # Ensure float32 and contiguous
-        vector = np.ascontiguousarray(vector.astype(np.float32))
-        return vector.tobytes()
+    def _multi_gpu_pool(self):
+        """
+        Encoding pool with one worker process per GPU, or None with fewer
+        than two GPUs.
+        
+        Started once per service and stopped at interpreter exit.
+        """
+        if self.pool is None and torch.cuda.device_count() > 1:
+            self.pool = self._load_model().start_multi_process_pool()
+            atexit.register(self.model.stop_multi_process_pool, self.pool)
+            logger.info(f"Started encoding pool on {torch.cuda.device_count()} GPUs")
+        return self.pool
+    
+    def _encode(self, texts: List[str], pool=None) -> np.ndarray:
+        """Encode texts to unit-length vectors, on the multi-GPU pool if given."""
+        if pool is None:
+            return self._load_model().encode(
+                texts,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+                normalize_embeddings=True  # Normalize for cosine similarity
+            )
+        
+        embeddings = self.model.encode_multi_process(texts, pool)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1
+        return embeddings / norms
+    
+    def _quantize(self, vectors: np.ndarray) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Convert float vectors to stored rows (see _embedding_store.quantize)."""
+        return quantize(vectors)
+    
+    def _blob_to_vector(self, blob: bytes, dtype: str = EMBEDDING_STORAGE_DTYPE,
+                        scale: Optional[float] = None) -> np.ndarray:
+        """Convert one stored BLOB to a float32 vector (see _embedding_store.blob_to_vector)."""
+        return blob_to_vector(blob, dtype, scale)
+    
+    def _blobs_to_matrix(self, blobs, dtype: str = EMBEDDING_STORAGE_DTYPE, scales=None) -> np.ndarray:
+        """Convert equal-length stored BLOBs to a float32 matrix (see _embedding_store.blobs_to_matrix)."""
+        return blobs_to_matrix(blobs, dtype, scales)
     
-    def _blob_to_vector(self, blob: bytes) -> np.ndarray:
-        """Convert BLOB to numpy array."""
-        return np.frombuffer(blob, dtype=np.float32)
+    def _load_matrix(self, conn, after_article_id: int = 0) -> Tuple[np.ndarray, List[int]]:
+        """Load every stored embedding, ordered by article_id (see _embedding_store.load_matrix)."""
+        return load_matrix(conn, after_article_id)
     
     def generate_embeddings(self, force_recompute=False, batch_size=50):
         """
@@ -62,85 +113,64 @@ class EmbeddingService:
         """
         logger.info("Generating embeddings for articles...")
         
-        model = self._load_model()
+        self._load_model()
+        pool = self._multi_gpu_pool()
+        if pool is not None:
+            # Larger batches so each dispatch to the GPU workers is worth it
+            batch_size = max(batch_size, Config.MULTIGPU_THRESHOLD)
+        
         conn = get_db()
         cursor = conn.cursor()
         
         stats = {'processed': 0, 'skipped': 0, 'errors': 0}
         
         try:
-            # Get articles that need embeddings
-            if force_recompute:
-                cursor.execute("""
-                    SELECT id, title, summary FROM articles
-                    ORDER BY id
-                """)
-            else:
-                cursor.execute("""
-                    SELECT a.id, a.title, a.summary
-                    FROM articles a
-                    LEFT JOIN embeddings e ON a.id = e.article_id
-                    WHERE e.article_id IS NULL
-                    ORDER BY a.id
-                """)
-            
-            articles = cursor.fetchall()
-            total = len(articles)
-            
-            if total == 0:
-                logger.info("No articles need embeddings")
-                return stats
-            
-            logger.info(f"Processing {total} articles in batches of {batch_size}")
-            
-            # Process in batches
-            for i in range(0, total, batch_size):
-                batch = articles[i:i + batch_size]
-                
-                # Prepare texts for embedding
-                texts = []
-                article_ids = []
-                for row in batch:
-                    title = row['title'] or ''
-                    summary = row['summary'] or ''
-                    # Combine as specified: title + " \n " + summary
-                    text = f"{title} \n {summary}".strip()
-                    if text:  # Skip empty texts
-                        texts.append(text)
-                        article_ids.append(row['id'])
-                
-                if not texts:
-                    continue
+            batch_num = 0
+            batches = self._pending_batches(force_recompute, batch_size, stats)
+            for batch_num, batch in enumerate(batches, 1):
+                article_ids, texts = zip(*batch)
                 
                 try:
                     # Generate embeddings
-                    logger.info(f"Generating embeddings for batch {i//batch_size + 1} ({len(texts)} articles)...")
-                    embeddings = model.encode(
-                        texts,
-                        show_progress_bar=False,
-                        convert_to_numpy=True,
-                        normalize_embeddings=True  # Normalize for cosine similarity
-                    )
+                    logger.info(f"Generating embeddings for batch {batch_num} ({len(texts)} articles)...")
+                    embeddings = self._encode(list(texts), pool)
                     
-                    # Store embeddings in database
-                    for article_id, embedding in zip(article_ids, embeddings):
-                        try:
-                            blob = self._vector_to_blob(embedding)
-                            cursor.execute("""
-                                INSERT OR REPLACE INTO embeddings (article_id, vec)
-                                VALUES (?, ?)
-                            """, (article_id, blob))
-                            stats['processed'] += 1
-                        except sqlite3.Error as e:
-                            logger.error(f"Error storing embedding for article {article_id}: {e}")
-                            stats['errors'] += 1
+                    # Store embeddings in database: one cast for the batch,
+                    # then one executemany
+                    stored, scales = self._quantize(embeddings)
+                    scales = scales.tolist() if scales is not None else [None] * len(stored)
+                    rows = [
+                        (article_id, vector.tobytes(), EMBEDDING_STORAGE_DTYPE, scale)
+                        for article_id, vector, scale in zip(article_ids, stored, scales)
+                    ]
+                    try:
+                        cursor.executemany(_INSERT_EMBEDDING_SQL, rows)
+                        stats['processed'] += len(rows)
+                    except sqlite3.Error as e:
+                        # Retry row by row so only the failing articles are counted
+                        # as errors (rows already written are simply replaced)
+                        logger.warning(f"Batch insert failed ({e}); storing embeddings one at a time")
+                        for row in rows:
+                            try:
+                                cursor.execute(_INSERT_EMBEDDING_SQL, row)
+                                stats['processed'] += 1
+                            except sqlite3.Error as e:
+                                logger.error(f"Error storing embedding for article {row[0]}: {e}")
+                                stats['errors'] += 1
                     
-                    conn.commit()
+                    if batch_num % EMBEDDING_COMMIT_BATCHES == 0:
+                        conn.commit()
                     
                 except Exception as e:
                     logger.error(f"Error processing batch: {e}", exc_info=True)
                     stats['errors'] += len(article_ids)
             
+            conn.commit()
+            
+            if batch_num == 0:
+                logger.info("No articles need embeddings")
+                return stats
+            
             logger.info(f"Embeddings generation complete: {stats['processed']} processed, "
                        f"{stats['skipped']} skipped, {stats['errors']} errors")
             
@@ -153,11 +183,85 @@ class EmbeddingService:
         
         return stats
     
+    def _pending_batches(self, force_recompute: bool, batch_size: int, stats: dict):
+        """
+        Yield lists of (article_id, text) needing embeddings, shortest first.
+        
+        Texts are title + " \n " + summary. Articles with empty text are
+        counted in stats['skipped'] before batching, so every batch but the
+        last holds batch_size texts to encode. Ordering by length lets each
+        batch pad to a similar length (encode only sorts within the texts it
+        is given). A reader thread on its own connection fetches up to
+        EMBEDDING_READ_AHEAD batches ahead, so reads overlap encoding and only
+        those batches are held in memory.
+        """
+        batches = queue.Queue(maxsize=EMBEDDING_READ_AHEAD)
+        stop = threading.Event()
+        
+        def put(item):
+            # Give up once the consumer has stopped instead of blocking forever
+            while not stop.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+        
+        def read():
+            conn = get_db()
+            try:
+                if force_recompute:
+                    cursor = conn.execute("""
+                        SELECT id, title, summary FROM articles
+                        ORDER BY coalesce(length(title), 0) + coalesce(length(summary), 0)
+                    """)
+                else:
+                    cursor = conn.execute("""
+                        SELECT a.id, a.title, a.summary
+                        FROM articles a
+                        LEFT JOIN embeddings e ON a.id = e.article_id
+                        WHERE e.article_id IS NULL
+                        ORDER BY coalesce(length(a.title), 0) + coalesce(length(a.summary), 0)
+                    """)
+                
+                batch = []
+                while rows := cursor.fetchmany(batch_size):
+                    for article_id, title, summary in rows:
+                        text = f"{title or ''} \n {summary or ''}".strip()
+                        if not text:
+                            stats['skipped'] += 1
+                            continue
+                        batch.append((article_id, text))
+                        if len(batch) == batch_size:
+                            if not put(batch):
+                                return
+                            batch = []
+                if batch and not put(batch):
+                    return
+            except Exception as e:
+                put(e)
+            finally:
+                conn.close()
+                put(None)
+        
+        threading.Thread(target=read, name='embedding-reader', daemon=True).start()
+        try:
+            while (item := batches.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+    
     def build_faiss_index(self, force_rebuild=False):
         """
         Build or update FAISS index from embeddings in database.
         
-        Uses IndexFlatIP (inner product) with normalized vectors for cosine similarity.
+        Uses an inner-product index over normalized vectors for cosine
+        similarity: exact (Flat) for small corpora, approximate (HNSW or IVF)
+        for larger ones, per Config.FAISS_INDEX_SPEC. Embeddings of articles
+        newer than the existing index are added to it instead of rebuilding.
         
         Args:
             force_rebuild: If True, rebuild index even if it exists
@@ -179,7 +283,7 @@ class EmbeddingService:
                 db_count = cursor.fetchone()[0]
                 
                 # Check vector_meta
-                cursor.execute("SELECT count FROM vector_meta WHERE version = 1")
+                cursor.execute("SELECT dim, count FROM vector_meta WHERE version = 1")
                 meta_row = cursor.fetchone()
                 
                 if meta_row and meta_row['count'] == db_count:
@@ -190,12 +294,16 @@ class EmbeddingService:
                         'dim': self.dim,
                         'message': 'Index already exists and is current'
                     }
+                
+                if meta_row and meta_row['dim'] == self.dim and meta_row['count'] < db_count:
+                    stats = self._add_to_faiss_index(conn, meta_row['count'], db_count)
+                    if stats is not None:
+                        return stats
             
             # Load all embeddings from database
-            cursor.execute("SELECT article_id, vec FROM embeddings ORDER BY article_id")
-            rows = cursor.fetchall()
+            vectors_array, article_ids = self._load_matrix(conn)
             
-            if len(rows) == 0:
+            if len(article_ids) == 0:
                 logger.warning("No embeddings found in database")
                 return {
                     'index_built': False,
@@ -204,46 +312,41 @@ class EmbeddingService:
                     'message': 'No embeddings to index'
                 }
             
-            # Convert BLOBs to numpy array
-            vectors = []
-            article_ids = []
-            
-            for row in rows:
-                vector = self._blob_to_vector(row['vec'])
-                vectors.append(vector)
-                article_ids.append(row['article_id'])
-            
-            vectors_array = np.array(vectors, dtype=np.float32)
-            
             # Ensure vectors are normalized (for cosine similarity via inner product)
-            faiss.normalize_L2(vectors_array)
-            
-            # Create FAISS index (IndexFlatIP for inner product with normalized vectors = cosine similarity)
-            index = faiss.IndexFlatIP(self.dim)
+            if not self._is_normalized(vectors_array):
+                faiss.normalize_L2(vectors_array)
+            
+            # Create FAISS index (inner product with normalized vectors = cosine similarity)
+            index_spec = self._faiss_index_spec(len(vectors_array))
+            index = faiss.index_factory(self.dim, index_spec, faiss.METRIC_INNER_PRODUCT)
+            if not index.is_trained:
+                index.train(vectors_array)
             index.add(vectors_array)
             
             # Save index
             index_path.parent.mkdir(parents=True, exist_ok=True)
-            faiss.write_index(index, str(index_path))
+            self._replace_file(index_path, lambda tmp: faiss.write_index(index, str(tmp)))
             
-            logger.info(f"FAISS index built: {len(vectors)} vectors, dimension {self.dim}")
+            logger.info(f"FAISS index built ({index_spec}): {len(vectors_array)} vectors, dimension {self.dim}")
             
             # Save article_id mapping (for lookup)
             # Store as separate file: article_id -> index position
             mapping_path = Path(Config.FAISS_INDEX_PATH).parent / 'faiss_mapping.npy'
-            np.save(mapping_path, np.array(article_ids, dtype=np.int32))
+            mapping = np.array(article_ids, dtype=np.int32)
+            self._replace_file(mapping_path, lambda tmp: np.save(tmp, mapping))
             
             # Update vector_meta table
             cursor.execute("""
                 INSERT OR REPLACE INTO vector_meta (version, dim, count, updated_at)
                 VALUES (1, ?, ?, CURRENT_TIMESTAMP)
-            """, (self.dim, len(vectors)))
+            """, (self.dim, len(vectors_array)))
             conn.commit()
             
             return {
                 'index_built': True,
-                'vector_count': len(vectors),
+                'vector_count': len(vectors_array),
                 'dim': self.dim,
+                'index_spec': index_spec,
                 'index_path': str(index_path)
             }
             
@@ -254,31 +357,159 @@ class EmbeddingService:
         finally:
             conn.close()
     
+    def _add_to_faiss_index(self, conn, indexed_count: int, db_count: int) -> Optional[dict]:
+        """
+        Add embeddings newer than the saved index to it, without a rebuild.
+        
+        Only applies when every embedding missing from the index belongs to
+        an article newer than the last indexed one, and the corpus has not
+        grown into a different index type (see _faiss_index_spec).
+        
+        Args:
+            conn: Database connection
+            indexed_count: Vectors in the saved index, from vector_meta
+            db_count: Embeddings currently in the database
+            
+        Returns:
+            Stats dict like build_faiss_index, or None if a full rebuild is needed
+        """
+        index_path = Path(Config.FAISS_INDEX_PATH)
+        mapping_path = index_path.parent / 'faiss_mapping.npy'
+        
+        spec_tiers = {re.sub(r'\d+', '', self._faiss_index_spec(n)) for n in (indexed_count, db_count)}
+        if len(spec_tiers) > 1 or not mapping_path.exists():
+            return None
+        
+        article_ids = np.load(mapping_path)
+        if len(article_ids) != indexed_count:
+            return None
+        
+        vectors, new_ids = self._load_matrix(conn, int(article_ids.max()))
+        if indexed_count + len(new_ids) != db_count:
+            # Embeddings were removed or written for older articles
+            return None
+        
+        if not self._is_normalized(vectors):
+            faiss.normalize_L2(vectors)
+        
+        # Read fully (not memory-mapped) since the index is modified
+        index = faiss.read_index(str(index_path))
+        index.add(vectors)
+        
+        self._replace_file(index_path, lambda tmp: faiss.write_index(index, str(tmp)))
+        mapping = np.concatenate([article_ids, np.array(new_ids, dtype=np.int32)])
+        self._replace_file(mapping_path, lambda tmp: np.save(tmp, mapping))
+        
+        conn.execute("""
+            INSERT OR REPLACE INTO vector_meta (version, dim, count, updated_at)
+            VALUES (1, ?, ?, CURRENT_TIMESTAMP)
+        """, (self.dim, index.ntotal))
+        conn.commit()
+        
+        logger.info(f"FAISS index extended: {len(new_ids)} vectors added, {index.ntotal} total")
+        
+        return {
+            'index_built': True,
+            'vector_count': index.ntotal,
+            'vectors_added': len(new_ids),
+            'dim': self.dim,
+            'index_path': str(index_path)
+        }
+    
+    @staticmethod
+    def _replace_file(path: Path, write):
+        """
+        Write a file next to path with write(tmp_path), then swap it in.
+        
+        Processes that memory-mapped the old file keep reading it intact
+        instead of seeing it rewritten underneath them.
+        """
+        tmp_path = path.with_name(f'.tmp.{path.name}')  # keeps the suffix np.save expects
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+    
+    @staticmethod
+    def _is_normalized(vectors: np.ndarray, sample: int = 100) -> bool:
+        """
+        Whether vectors can be used as unit length without normalizing.
+        
+        Trusts Config.ASSUME_NORMALIZED after checking the first rows, with
+        a tolerance that allows for int8 quantization error.
+        """
+        if not Config.ASSUME_NORMALIZED:
+            return False
+        norms = np.linalg.norm(vectors[:sample], axis=1)
+        if not np.allclose(norms, 1.0, atol=1e-2):
+            logger.warning("Embeddings are not unit length; normalizing")
+            return False
+        return True
+    
+    @staticmethod
+    def _faiss_index_spec(n_vectors: int) -> str:
+        """FAISS index_factory spec for n_vectors, resolving 'auto' by corpus size."""
+        if Config.FAISS_INDEX_SPEC != 'auto':
+            return Config.FAISS_INDEX_SPEC
+        if n_vectors < Config.FAISS_FLAT_MAX_VECTORS:
+            return 'Flat'
+        if n_vectors < Config.FAISS_HNSW_MAX_VECTORS:
+            return 'HNSW32,SQ8'
+        return f'IVF{int(4 * np.sqrt(n_vectors))},SQ8'
+    
+    @staticmethod
+    def _set_search_params(index):
+        """Apply the configured search breadth to approximate indexes."""
+        if isinstance(index, faiss.IndexHNSW):
+            index.hnsw.efSearch = Config.FAISS_EF_SEARCH
+        elif isinstance(index, faiss.IndexIVF):
+            index.nprobe = Config.FAISS_NPROBE
+    
     def load_faiss_index(self):
         """
         Load FAISS index from disk.
         
+        The loaded index is kept on the service and returned again until the
+        index or mapping file is rewritten. IVF inverted lists are
+        memory-mapped; other index types are loaded into memory.
+        
         Returns:
             tuple: (faiss.Index, np.ndarray of article_ids) or (None, None) if not found
         """
         index_path = Path(Config.FAISS_INDEX_PATH)
         mapping_path = index_path.parent / 'faiss_mapping.npy'
         
-        if not index_path.exists():
-            return None, None
-        
-        try:
-            index = faiss.read_index(str(index_path))
-            
-            # Load article_id mapping
-            article_ids = None
-            if mapping_path.exists():
-                article_ids = np.load(mapping_path)
-            
+        with self._index_lock:
+            try:
+                mtime = (
+                    index_path.stat().st_mtime_ns,
+                    mapping_path.stat().st_mtime_ns if mapping_path.exists() else None,
+                )
+            except FileNotFoundError:
+                return None, None
+            
+            if mtime == self._index_mtime:
+                return self._index, self._article_ids
+            
+            try:
+                # IO_FLAG_MMAP only maps the inverted lists of IVF indexes
+                # (the large corpora), which then page in on demand and are
+                # shared between workers through the OS page cache. Flat and
+                # HNSW indexes ignore it and are read fully into memory.
+                index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP)
+                self._set_search_params(index)
+                
+                # Load article_id mapping
+                article_ids = None
+                if mapping_path.exists():
+                    article_ids = np.load(mapping_path)
+            except Exception as e:
+                logger.error(f"Error loading FAISS index: {e}", exc_info=True)
+                return None, None
+            
+            self._index, self._article_ids, self._index_mtime = index, article_ids, mtime
             return index, article_ids
-        except Exception as e:
-            logger.error(f"Error loading FAISS index: {e}", exc_info=True)
-            return None, None
     
     def query_similar(self, article_id: int, k: int = 20) -> List[Tuple[int, float]]:
         """
@@ -291,50 +522,75 @@ class EmbeddingService:
         Returns:
             List of (article_id, similarity_score) tuples
         """
+        return self.query_similar_batch([article_id], k).get(article_id, [])
+    
+    def query_similar_batch(self, article_ids: List[int], k: int = 20) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        Query FAISS index for articles similar to each of several articles.
+        
+        All query vectors are searched in one call, so the index is traversed
+        once for the whole batch.
+        
+        Args:
+            article_ids: IDs of articles to find similarities for
+            k: Number of similar articles to return per article
+            
+        Returns:
+            Dict mapping each article_id with an embedding to its list of
+            (article_id, similarity_score) tuples
+        """
+        if not article_ids:
+            return {}
+        
         conn = get_db()
         cursor = conn.cursor()
         
         try:
-            # Get embedding for this article
-            cursor.execute("SELECT vec FROM embeddings WHERE article_id = ?", (article_id,))
-            row = cursor.fetchone()
+            # Get embeddings for these articles
+            placeholders = ','.join('?' * len(article_ids))
+            cursor.execute(f"""
+                SELECT article_id, vec, dtype, scale FROM embeddings
+                WHERE article_id IN ({placeholders})
+            """, list(article_ids))
+            rows = cursor.fetchall()
             
-            if not row:
-                return []
+            if not rows:
+                return {}
             
             # Load FAISS index
             index, article_ids_map = self.load_faiss_index()
             if index is None:
-                return []
-            
-            # Convert article embedding to vector
-            query_vector = self._blob_to_vector(row['vec']).reshape(1, -1)
-            faiss.normalize_L2(query_vector)  # Normalize for cosine similarity
+                return {}
+            if article_ids_map is None:
+                logger.warning("No article_ids mapping found, cannot map FAISS indices")
+                return {}
+            
+            # Convert article embeddings to one query matrix
+            query_ids = [row['article_id'] for row in rows]
+            queries = np.vstack([
+                self._blob_to_vector(row['vec'], row['dtype'], row['scale']) for row in rows
+            ])
+            if not self._is_normalized(queries):
+                faiss.normalize_L2(queries)  # Normalize for cosine similarity
             
             # Query index
-            distances, indices = index.search(query_vector, k + 1)  # +1 to exclude self
+            distances, indices = index.search(queries, k + 1)  # +1 to exclude self
             
             # Map indices back to article_ids
-            results = []
-            for i, dist in zip(indices[0], distances[0]):
-                if i < 0:  # Invalid index
-                    continue
-                if article_ids_map is not None and i < len(article_ids_map):
-                    similar_id = int(article_ids_map[i])
-                    if similar_id != article_id:  # Exclude self
-                        # Inner product with normalized vectors = cosine similarity
-                        results.append((similar_id, float(dist)))
-                elif article_ids_map is None:
-                    # Fallback: assume indices are article_ids (if no mapping file)
-                    # This shouldn't happen, but handle gracefully
-                    logger.warning("No article_ids mapping found, cannot map FAISS indices")
-                    break
+            results = {}
+            for query_id, row_indices, row_distances in zip(query_ids, indices, distances):
+                results[query_id] = [
+                    # Inner product with normalized vectors = cosine similarity
+                    (int(article_ids_map[i]), float(dist))
+                    for i, dist in zip(row_indices, row_distances)
+                    if 0 <= i < len(article_ids_map) and article_ids_map[i] != query_id  # Exclude self
+                ]
             
             return results
             
         except Exception as e:
-            logger.error(f"Error querying FAISS for article {article_id}: {e}", exc_info=True)
-            return []
+            logger.error(f"Error querying FAISS for articles {list(article_ids)}: {e}", exc_info=True)
+            return {}
         finally:
             conn.close()
 
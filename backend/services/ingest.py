@@ -3,13 +3,19 @@ CSV ingestion service.
 Parses CSV, normalizes data, and inserts into database.
 """
 import csv
-import sqlite3
+import re
 from urllib.parse import urlparse
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
-from backend.db import get_db
+from backend.db import get_db, analyze_db
 from backend.config import Config
 
+# CSV rows inserted per executemany
+INGEST_BATCH_SIZE = 1000
+
+# CSV header columns read, in the order ingest_csv unpacks them
+CSV_COLUMNS = ('Title', 'Summary', 'URL', 'Date')
+
 
 def extract_outlet(url):
     """Extract outlet domain from URL."""
@@ -26,6 +32,11 @@ def extract_outlet(url):
         return None
 
 
+# yyyy-m-d, and m/d/yy, m/d/yyyy or m-d-yyyy
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_US_DATE_RE = re.compile(r'(\d{1,2})([/-])(\d{1,2})\2(\d{4}|\d{2})')
+
+
 def normalize_date(date_str):
     """
     Normalize date string to ISO format (YYYY-MM-DD).
@@ -34,28 +45,38 @@ def normalize_date(date_str):
     - 2/10/25 -> 2025-02-10
     - 02/11/2025 -> 2025-02-11
     - 2025-02-10 -> 2025-02-10
+    - 02-11-2025 -> 2025-02-11
+    - 13/02/2025 -> 2025-02-13 (day first, when month first is not a date)
     """
     if not date_str:
         return None
     
     date_str = date_str.strip()
     
-    # Try common formats
-    formats = [
-        '%m/%d/%y',      # 2/10/25
-        '%m/%d/%Y',     # 02/11/2025
-        '%Y-%m-%d',     # 2025-02-10
-        '%m-%d-%Y',     # 02-11-2025
-        '%d/%m/%Y',     # 10/02/2025
-    ]
+    # Match the shape once and build the date directly, rather than trying
+    # strptime formats in turn and catching each failure
+    candidates = []
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if match:
+        year, month, day = map(int, match.groups())
+        candidates.append((year, month, day))
+    elif match := _US_DATE_RE.fullmatch(date_str):
+        month, separator, day, year_text = match.groups()
+        month, day, year = int(month), int(day), int(year_text)
+        if len(year_text) == 4:
+            candidates.append((year, month, day))
+            if separator == '/':
+                candidates.append((year, day, month))
+        elif separator == '/':
+            # Two-digit years pivot like strptime's %y: 69-99 -> 1900s
+            candidates.append((year + (1900 if year >= 69 else 2000), month, day))
     
-    for fmt in formats:
+    for year, month, day in candidates:
+        # If year is in the far future, assume it's actually past
+        if year > 2100:
+            year -= 100
         try:
-            dt = datetime.strptime(date_str, fmt)
-            # If year is 2-digit and result is in future, assume it's actually past
-            if dt.year > 2100:
-                dt = dt.replace(year=dt.year - 100)
-            return dt.strftime('%Y-%m-%d')
+            return date(year, month, day).isoformat()
         except ValueError:
             continue
     
@@ -77,13 +98,54 @@ def compute_date_bin(date_str):
         return None
 
 
+def _insert_articles(cursor, rows, stats):
+    """
+    Insert a batch of article rows, skipping URLs already stored.
+    
+    INSERT OR IGNORE leaves duplicates (in the table or within the batch)
+    to the UNIQUE url constraint, and rowcount sums the rows inserted.
+    """
+    if not rows:
+        return
+    cursor.executemany("""
+        INSERT OR IGNORE INTO articles (title, summary, url, outlet, date, date_bin)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, rows)
+    stats['inserted'] += cursor.rowcount
+    stats['skipped'] += len(rows) - cursor.rowcount
+
+
+def _insert_batch(cursor, rows, stats):
+    """
+    Insert a batch of article rows inside a savepoint.
+    
+    A batch that fails is rolled back on its own (earlier batches in the
+    file's transaction are kept), its counts are undone, and all of its
+    rows count as errors.
+    """
+    if not rows:
+        return
+    counts = dict(stats)
+    cursor.execute("SAVEPOINT ingest_batch")
+    try:
+        _insert_articles(cursor, rows, stats)
+    except Exception as e:
+        cursor.execute("ROLLBACK TO ingest_batch")
+        print(f"Error inserting batch of {len(rows)} rows: {e}")
+        stats.update(counts)
+        stats['errors'] += len(rows)
+    finally:
+        cursor.execute("RELEASE ingest_batch")
+
+
 def ingest_csv(csv_path, skip_duplicates=True):
     """
     Ingest articles from CSV file.
     
     Args:
         csv_path: Path to CSV file
-        skip_duplicates: If True, skip articles with duplicate URLs
+        skip_duplicates: If True, skip articles with duplicate URLs (the
+            UNIQUE url constraint skips them either way)
     
     Returns:
         dict with stats: {'inserted': int, 'skipped': int, 'errors': int}
@@ -98,15 +160,25 @@ def ingest_csv(csv_path, skip_duplicates=True):
     stats = {'inserted': 0, 'skipped': 0, 'errors': 0}
     
     try:
+        # One write transaction for the whole file, with the write lock taken
+        # up front (WAL and synchronous=NORMAL are set by get_db/init_db)
+        cursor.execute("BEGIN IMMEDIATE")
+        
         with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            reader = csv.reader(f)
+            header = next(reader, [])
+            # Cell index of each column read; a column missing from the header reads as ''
+            columns = [header.index(name) if name in header else None for name in CSV_COLUMNS]
+            pending = []
             
             for row in reader:
+                if not row:
+                    continue  # Blank line
                 try:
-                    title = row.get('Title', '').strip()
-                    summary = row.get('Summary', '').strip()
-                    url = row.get('URL', '').strip()
-                    date_str = row.get('Date', '').strip()
+                    # Cells missing from a row shorter than the header read as ''
+                    title, summary, url, date_str = (
+                        row[i].strip() if i is not None and i < len(row) else '' for i in columns
+                    )
                     
                     # Skip rows with missing essential fields
                     if not title or not url:
@@ -122,29 +194,23 @@ def ingest_csv(csv_path, skip_duplicates=True):
                     outlet = extract_outlet(url)
                     date_bin = compute_date_bin(date)
                     
-                    # Check for duplicate URL
-                    if skip_duplicates:
-                        cursor.execute("SELECT id FROM articles WHERE url = ?", (url,))
-                        if cursor.fetchone():
-                            stats['skipped'] += 1
-                            continue
-                    
-                    # Insert article
-                    cursor.execute("""
-                        INSERT INTO articles (title, summary, url, outlet, date, date_bin)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (title, summary, url, outlet, date, date_bin))
+                    pending.append((title, summary, url, outlet, date, date_bin))
                     
-                    stats['inserted'] += 1
-                    
-                except sqlite3.IntegrityError:
-                    # Duplicate URL (if skip_duplicates=False)
-                    stats['skipped'] += 1
                 except Exception as e:
                     print(f"Error processing row: {e}")
                     stats['errors'] += 1
+                
+                if len(pending) >= INGEST_BATCH_SIZE:
+                    try:
+                        _insert_batch(cursor, pending, stats)
+                    finally:
+                        pending = []
+            
+            _insert_batch(cursor, pending, stats)
         
         conn.commit()
+        if stats['inserted']:
+            analyze_db(conn)
         print(f"Ingestion complete: {stats['inserted']} inserted, {stats['skipped']} skipped, {stats['errors']} errors")
         
     except Exception as e:
@@ -4,7 +4,8 @@ Generates human-readable labels for clusters using KeyBERT.
 """
 import logging
 import sqlite3
-from typing import List, Dict
+from itertools import groupby
+from typing import List, Dict, Optional
 from keybert import KeyBERT
 from backend.db import get_db
 from backend.config import Config
@@ -26,18 +27,9 @@ class LabelingService:
         if self.keybert_model is None:
             logger.info("Loading KeyBERT model...")
             try:
-                # Use all-MiniLM-L6-v2 for consistency with embeddings
-                # KeyBERT can use a different model, but we'll use the same one
-                from sentence_transformers import SentenceTransformer
-                from pathlib import Path
-                
-                cache_dir = Path(Config.MODEL_CACHE_DIR)
-                cache_dir.mkdir(parents=True, exist_ok=True)
-                
-                sentence_model = SentenceTransformer(
-                    Config.EMBEDDING_MODEL,
-                    cache_folder=str(cache_dir)
-                )
+                # Same model instance as the embedding service, loaded once
+                from backend.services._model_registry import get_sentence_transformer
+                sentence_model = get_sentence_transformer()
                 
                 self.keybert_model = KeyBERT(model=sentence_model)
                 logger.info("KeyBERT model loaded")
@@ -116,26 +108,44 @@ class LabelingService:
             return []
         
         try:
-            model = self._load_keybert()
-            
-            # Extract keywords (returns list of tuples: (keyword, score))
-            keywords_with_scores = model.extract_keywords(
-                text,
-                keyphrase_ngram_range=(1, 2),  # Unigrams and bigrams
-                top_n=self.top_n,
-                use_mmr=True,  # Use Maximal Marginal Relevance for diversity
-                diversity=0.5
-            )
-            
-            # Extract just the keywords (drop scores)
-            keywords = [kw[0] for kw in keywords_with_scores]
-            
-            return keywords
-            
+            return self._extract_keywords_batch([text])[0]
         except Exception as e:
             logger.error(f"Error extracting keywords: {e}", exc_info=True)
             return []
     
+    def _extract_keywords_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract keywords from several texts in one KeyBERT call.
+        
+        KeyBERT embeds all documents together, so the model runs over the
+        whole batch at once instead of once per text.
+        
+        Args:
+            texts: Texts to extract keywords from
+            
+        Returns:
+            List of keyword lists, one per text
+        """
+        if not texts:
+            return []
+        
+        model = self._load_keybert()
+        
+        # Extract keywords (returns list of tuples: (keyword, score) per text)
+        keywords_with_scores = model.extract_keywords(
+            texts,
+            keyphrase_ngram_range=(1, 2),  # Unigrams and bigrams
+            top_n=self.top_n,
+            use_mmr=True,  # Use Maximal Marginal Relevance for diversity
+            diversity=0.5
+        )
+        if len(texts) == 1:
+            # KeyBERT unwraps the result for a single document
+            keywords_with_scores = [keywords_with_scores]
+        
+        # Extract just the keywords (drop scores)
+        return [[kw[0] for kw in keywords] for keywords in keywords_with_scores]
+    
     def _create_label(self, keywords: List[str]) -> str:
         """
         Create a readable label from keywords.
@@ -176,26 +186,38 @@ class LabelingService:
         # Get cluster articles
         articles = self._get_cluster_articles(cluster_id)
         
+        # Combine article texts
+        combined_text = self._combine_cluster_text(articles)
+        
+        label = self._fallback_label(cluster_id, articles, combined_text)
+        if label is None:
+            # Extract keywords and create label
+            label = self._create_label(self._extract_keywords(combined_text))
+            logger.info(f"Generated label for cluster {cluster_id}: '{label}'")
+        
+        return label
+    
+    def _fallback_label(self, cluster_id: int, articles: List[Dict], combined_text: str) -> Optional[str]:
+        """
+        Label for a cluster without enough text to extract keywords from.
+        
+        Args:
+            cluster_id: Cluster ID being labeled
+            articles: List of article dicts in the cluster
+            combined_text: Combined text of those articles
+            
+        Returns:
+            Label string, or None if the cluster can be labeled from keywords
+        """
         if len(articles) == 0:
             logger.warning(f"No articles found for cluster {cluster_id}")
             return "Empty Cluster"
         
-        # Combine article texts
-        combined_text = self._combine_cluster_text(articles)
-        
         if not combined_text or len(combined_text.strip()) < 10:
             logger.warning(f"Cluster {cluster_id} has insufficient text for labeling")
             return f"Cluster {cluster_id}"
         
-        # Extract keywords
-        keywords = self._extract_keywords(combined_text)
-        
-        # Create label
-        label = self._create_label(keywords)
-        
-        logger.info(f"Generated label for cluster {cluster_id}: '{label}'")
-        
-        return label
+        return None
     
     def label_all_clusters(self, force_recompute=False) -> Dict:
         """
@@ -215,11 +237,12 @@ class LabelingService:
         try:
             # Get all clusters
             if force_recompute:
-                cursor.execute("SELECT id FROM clusters ORDER BY id")
+                clusters_sql = "SELECT id FROM clusters"
             else:
                 # Only get clusters without labels
-                cursor.execute("SELECT id FROM clusters WHERE label IS NULL ORDER BY id")
+                clusters_sql = "SELECT id FROM clusters WHERE label IS NULL"
             
+            cursor.execute(f"{clusters_sql} ORDER BY id")
             cluster_ids = [row['id'] for row in cursor.fetchall()]
             
             if len(cluster_ids) == 0:
@@ -231,25 +254,48 @@ class LabelingService:
             
             logger.info(f"Labeling {len(cluster_ids)} clusters...")
             
-            # Label each cluster
-            labeled_count = 0
-            errors = 0
+            # Articles of every cluster in one query, grouped by cluster
+            cursor.execute(f"""
+                SELECT cluster_id, title, summary
+                FROM articles
+                WHERE cluster_id IN ({clusters_sql})
+                ORDER BY cluster_id
+            """)
+            cluster_articles = {
+                cluster_id: [
+                    {'title': row['title'] or '', 'summary': row['summary'] or ''}
+                    for row in rows
+                ]
+                for cluster_id, rows in groupby(cursor.fetchall(), key=lambda row: row['cluster_id'])
+            }
             
+            # Clusters without enough text get a fallback label; the rest
+            # have their keywords extracted in one batch
+            labels = {}
+            cluster_texts = {}
             for cluster_id in cluster_ids:
-                try:
-                    label = self.label_cluster(cluster_id)
-                    
-                    # Update cluster label
-                    cursor.execute("""
-                        UPDATE clusters SET label = ? WHERE id = ?
-                    """, (label, cluster_id))
-                    
-                    labeled_count += 1
-                    
-                except Exception as e:
-                    logger.error(f"Error labeling cluster {cluster_id}: {e}", exc_info=True)
-                    errors += 1
-                    continue
+                articles = cluster_articles.get(cluster_id, [])
+                combined_text = self._combine_cluster_text(articles)
+                label = self._fallback_label(cluster_id, articles, combined_text)
+                if label is None:
+                    cluster_texts[cluster_id] = combined_text
+                else:
+                    labels[cluster_id] = label
+            
+            errors = 0
+            try:
+                all_keywords = self._extract_keywords_batch(list(cluster_texts.values()))
+                for cluster_id, keywords in zip(cluster_texts, all_keywords):
+                    labels[cluster_id] = self._create_label(keywords)
+            except Exception as e:
+                logger.error(f"Error extracting keywords for {len(cluster_texts)} clusters: {e}", exc_info=True)
+                errors = len(cluster_texts)
+            
+            # Update cluster labels
+            cursor.executemany("""
+                UPDATE clusters SET label = ? WHERE id = ?
+            """, [(label, cluster_id) for cluster_id, label in labels.items()])
+            labeled_count = len(labels)
             
             conn.commit()
             
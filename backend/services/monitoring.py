@@ -88,30 +88,22 @@ class MonitoringService:
             previous_7d_start = (now - timedelta(days=14)).strftime('%Y-%m-%d')
             previous_7d_end = (now - timedelta(days=7)).strftime('%Y-%m-%d')
             
-            # Get all clusters
-            cursor.execute("SELECT id FROM clusters")
-            cluster_ids = [row['id'] for row in cursor.fetchall()]
+            # Count each cluster's articles in both weeks in one pass
+            cursor.execute("""
+                SELECT a.cluster_id,
+                       SUM(CASE WHEN a.date >= :current THEN 1 ELSE 0 END) AS current_count,
+                       SUM(CASE WHEN a.date < :previous_end THEN 1 ELSE 0 END) AS previous_count
+                FROM articles a
+                JOIN clusters c ON c.id = a.cluster_id
+                WHERE a.date >= :previous
+                GROUP BY a.cluster_id
+                ORDER BY a.cluster_id
+            """, {'current': last_7d_start, 'previous': previous_7d_start, 'previous_end': previous_7d_end})
             
-            for cluster_id in cluster_ids:
-                # Count articles in last 7 days
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM articles
-                    WHERE cluster_id = ? AND date >= ?
-                """, (cluster_id, last_7d_start))
-                current_count = cursor.fetchone()['count']
-                
+            for cluster_id, current_count, previous_count in cursor.fetchall():
                 if current_count == 0:
                     continue
                 
-                # Count articles in previous 7 days
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM articles
-                    WHERE cluster_id = ? AND date >= ? AND date < ?
-                """, (cluster_id, previous_7d_start, previous_7d_end))
-                previous_count = cursor.fetchone()['count']
-                
                 if previous_count == 0:
                     # No previous activity, skip (not a surge from existing baseline)
                     continue
@@ -207,9 +199,9 @@ class MonitoringService:
         Detect new actor emergence (first appearance in corpus).
         
         Logic:
-        - Find entities with mentions in last 7 days
-        - Check if zero mentions before that window
-        - If yes: ALERT
+        - Find entities whose first mention (entity_first_seen) is in the last 7 days
+        - Count their mentions in that window
+        - ALERT for each
         
         Returns:
             list of alert dicts created
@@ -226,45 +218,35 @@ class MonitoringService:
             now = datetime.now()
             last_7d_start = (now - timedelta(days=7)).strftime('%Y-%m-%d')
             
-            # Find entities mentioned in last 7 days
+            # Find entities first mentioned in the last 7 days, so with no
+            # mentions before that window
             cursor.execute("""
-                SELECT DISTINCT e.id, e.name, e.type, COUNT(DISTINCT ae.article_id) as mention_count
-                FROM entities e
+                SELECT e.id, e.name, e.type, COUNT(DISTINCT ae.article_id) as mention_count
+                FROM entity_first_seen efs
+                JOIN entities e ON e.id = efs.entity_id
                 JOIN article_entities ae ON e.id = ae.entity_id
                 JOIN articles a ON ae.article_id = a.id
-                WHERE a.date >= ?
+                WHERE efs.first_date >= ? AND a.date >= ?
                 GROUP BY e.id, e.name, e.type
-            """, (last_7d_start,))
+            """, (last_7d_start, last_7d_start))
             
-            recent_entities = cursor.fetchall()
+            new_entities = cursor.fetchall()
             
-            for entity in recent_entities:
-                # Check if this entity had any mentions before last 7 days
-                cursor.execute("""
-                    SELECT COUNT(*) as count
-                    FROM article_entities ae
-                    JOIN articles a ON ae.article_id = a.id
-                    WHERE ae.entity_id = ? AND a.date < ?
-                """, (entity['id'], last_7d_start))
+            for entity in new_entities:
+                # Create alert
+                entity_json = json.dumps({
+                    'entity_id': entity['id'],
+                    'entity_name': entity['name'],
+                    'entity_type': entity['type'],
+                    'mention_count_7d': entity['mention_count']
+                })
                 
-                historical_count = cursor.fetchone()['count']
+                description = f"New actor: {entity['name']} ({entity['type']}) appeared in {entity['mention_count']} article(s) this week"
                 
-                # If no historical mentions, this is a new actor
-                if historical_count == 0:
-                    # Create alert
-                    entity_json = json.dumps({
-                        'entity_id': entity['id'],
-                        'entity_name': entity['name'],
-                        'entity_type': entity['type'],
-                        'mention_count_7d': entity['mention_count']
-                    })
-                    
-                    description = f"New actor: {entity['name']} ({entity['type']}) appeared in {entity['mention_count']} article(s) this week"
-                    
-                    severity = 'medium' if entity['mention_count'] > 5 else 'low'
-                    
-                    alert = self.create_alert('new_actor', entity_json, description, severity)
-                    alerts_created.append(alert)
+                severity = 'medium' if entity['mention_count'] > 5 else 'low'
+                
+                alert = self.create_alert('new_actor', entity_json, description, severity)
+                alerts_created.append(alert)
                 
         except Exception as e:
             logger.error(f"Error checking new actors: {e}", exc_info=True)
@@ -355,7 +337,7 @@ class MonitoringService:
         cursor.execute(query, params)
         
         alerts = []
-        for row in cursor.fetchall():
+        for row in cursor:
             alerts.append({
                 'id': row['id'],
                 'alert_type': row['alert_type'],
@@ -5,14 +5,37 @@ Extracts entities from articles, tracks mentions, and classifies roles.
 """
 
 import logging
+import os
 import re
 import spacy
+from itertools import groupby
 from typing import List, Tuple
 from backend.db import get_db
 
 logger = logging.getLogger(__name__)
 
 
+# extract_entities: docs per nlp.pipe batch, and worker processes once there
+# are enough articles to repay starting them
+NER_BATCH_SIZE = 64
+NER_PROCESSES = max(1, (os.cpu_count() or 1) - 1)
+NER_MULTIPROCESS_MIN_ARTICLES = 2000
+
+# spaCy model, and the components it is loaded without: only entities and
+# sentence boundaries are used, and the senter component finds sentences
+# more cheaply than the parser
+SPACY_MODEL = "en_core_web_sm"
+SPACY_EXCLUDED_PIPES = ['tagger', 'parser', 'lemmatizer', 'attribute_ruler']
+
+# extract_entities/classify_entity_roles: rows written per executemany and commit
+NER_WRITE_BATCH_SIZE = 500
+
+# Sentence boundaries are only needed by classify_entity_roles
+NER_DISABLED_PIPES = ['senter', 'parser']
+
+# ...and entities are not needed to find them
+ROLE_DISABLED_PIPES = ['ner']
+
 # Entity stop list - common entities to filter out
 ENTITY_STOPLIST = {
     'PERSON': set(),  # Could add titles like "President"
@@ -23,6 +46,12 @@ ENTITY_STOPLIST = {
     'MISC': set(),
 }
 
+# Lowercased stop lists, for case-insensitive lookups
+ENTITY_STOPLIST_LOWER = {
+    entity_type: frozenset(name.lower() for name in names)
+    for entity_type, names in ENTITY_STOPLIST.items()
+}
+
 # Causal/action language patterns for role classification
 PROTAGONIST_PATTERNS = [
     r'\b(announced|ordered|signed|issued|declared|decided|acted|launched|introduced)\b',
@@ -45,6 +74,36 @@ ADJUDICATOR_PATTERNS = [
     r'\b(judge|court|supreme court|federal court|appeals court)\b',
 ]
 
+ROLE_PATTERNS = {
+    'protagonist': PROTAGONIST_PATTERNS,
+    'antagonist': ANTAGONIST_PATTERNS,
+    'subject': SUBJECT_PATTERNS,
+    'adjudicator': ADJUDICATOR_PATTERNS,
+}
+
+
+def _index_role_keywords(role_patterns):
+    """
+    Map each keyword of the role patterns to the (role, pattern index) pairs
+    it belongs to.
+    
+    Every pattern is an alternation of words or phrases between word
+    boundaries, so a pattern matches a sentence exactly when one of its
+    keywords appears there as a whole word or word sequence.
+    """
+    index = {}
+    for role, patterns in role_patterns.items():
+        for i, pattern in enumerate(patterns):
+            alternatives = re.fullmatch(r'\\b\((.*)\)\\b', pattern).group(1)
+            for keyword in alternatives.split('|'):
+                index.setdefault(tuple(keyword.split()), []).append((role, i))
+    return index
+
+
+# Keyword (as a tuple of words) -> [(role, pattern index)]
+ROLE_KEYWORDS = _index_role_keywords(ROLE_PATTERNS)
+ROLE_KEYWORD_LENGTHS = sorted({len(keyword) for keyword in ROLE_KEYWORDS})
+
 
 class NERService:
     """Service for Named Entity Recognition and role classification."""
@@ -52,8 +111,13 @@ class NERService:
     def __init__(self):
         """Initialize NER service with spaCy model."""
         try:
-            self.nlp = spacy.load("en_core_web_sm")
-            logger.info("Loaded spaCy model: en_core_web_sm")
+            self.nlp = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDED_PIPES)
+            try:
+                self.nlp.enable_pipe('senter')
+            except ValueError:
+                # Model ships without senter; keep the parser for doc.sents
+                self.nlp = spacy.load(SPACY_MODEL, exclude=['lemmatizer', 'attribute_ruler'])
+            logger.info(f"Loaded spaCy model: {SPACY_MODEL} ({', '.join(self.nlp.pipe_names)})")
         except Exception as e:
             logger.error(f"Failed to load spaCy model: {e}")
             logger.info("Please run: python -m spacy download en_core_web_sm")
@@ -99,18 +163,22 @@ class NERService:
         articles_processed = 0
         entities_found = 0
         entity_name_to_id = {}
+        links = []  # article_entities rows not yet written
         
         # Load existing entities
         cursor.execute("SELECT id, name FROM entities")
-        for row in cursor.fetchall():
+        for row in cursor:
             entity_name_to_id[row['name']] = row['id']
         
-        for article in articles:
+        # Run spaCy NER in batches (across worker processes for large
+        # backlogs); entities are written from this process as docs arrive
+        texts = (f"{article['title']}\n\n{article['summary']}" for article in articles)
+        n_process = NER_PROCESSES if len(articles) >= NER_MULTIPROCESS_MIN_ARTICLES else 1
+        docs = self.nlp.pipe(texts, batch_size=NER_BATCH_SIZE, n_process=n_process,
+                             disable=NER_DISABLED_PIPES)
+        
+        for article, doc in zip(articles, docs):
             article_id = article['id']
-            text = f"{article['title']}\n\n{article['summary']}"
-            
-            # Run spaCy NER
-            doc = self.nlp(text)
             
             # Extract entities
             article_entities = {}  # entity_name -> {type, count, first_char}
@@ -150,17 +218,19 @@ class NERService:
                     entity_id = entity_name_to_id[entity_name]
                 
                 # Link to article
-                cursor.execute("""
-                    INSERT OR IGNORE INTO article_entities (article_id, entity_id, count, first_mention_char)
-                    VALUES (?, ?, ?, ?)
-                """, (article_id, entity_id, info['count'], info['first_char']))
+                links.append((article_id, entity_id, info['count'], info['first_char']))
             
             articles_processed += 1
             
+            if len(links) >= NER_WRITE_BATCH_SIZE:
+                self._insert_links(cursor, links)
+                conn.commit()
+                links = []
+            
             if articles_processed % 100 == 0:
                 logger.info(f"Processed {articles_processed} articles...")
-                conn.commit()
         
+        self._insert_links(cursor, links)
         conn.commit()
         conn.close()
         
@@ -172,16 +242,19 @@ class NERService:
             'entities_found': entities_found
         }
     
+    @staticmethod
+    def _insert_links(cursor, links):
+        """Link articles to entities: (article_id, entity_id, count, first_mention_char) rows."""
+        cursor.executemany("""
+            INSERT OR IGNORE INTO article_entities (article_id, entity_id, count, first_mention_char)
+            VALUES (?, ?, ?, ?)
+        """, links)
+    
     def _is_stop_entity(self, name: str, entity_type: str) -> bool:
         """Check if entity is in stoplist."""
-        stoplist = ENTITY_STOPLIST.get(entity_type, set())
-        
         # Case-insensitive check
-        name_lower = name.lower().strip()
-        
-        for stop_name in stoplist:
-            if stop_name.lower() == name_lower:
-                return True
+        if name.lower().strip() in ENTITY_STOPLIST_LOWER.get(entity_type, ()):
+            return True
         
         # Additional heuristic: very short entities are often noise
         if len(name) <= 2:
@@ -210,12 +283,17 @@ class NERService:
         conn = get_db()
         cursor = conn.cursor()
         
-        # Get articles with entities
-        cursor.execute("""
+        # Get articles with entities (skipping pairs already classified)
+        unclassified = "" if force_recompute else """
+            LEFT JOIN entity_roles er ON er.article_id = a.id AND er.entity_id = e.id
+            WHERE er.entity_id IS NULL
+        """
+        cursor.execute(f"""
             SELECT DISTINCT a.id, a.title, a.summary, e.id as entity_id, e.name as entity_name
             FROM articles a
             JOIN article_entities ae ON a.id = ae.article_id
             JOIN entities e ON ae.entity_id = e.id
+            {unclassified}
             ORDER BY a.id
         """)
         
@@ -223,47 +301,47 @@ class NERService:
         logger.info(f"Classifying roles for {len(article_entities)} article-entity pairs")
         
         roles_classified = 0
+        roles = []  # entity_roles rows not yet written
         
-        for row in article_entities:
-            article_id = row['id']
-            entity_id = row['entity_id']
-            entity_name = row['entity_name']
-            text = f"{row['title']}\n\n{row['summary']}"
+        # Split each article into sentences once (rows are ordered by article),
+        # in nlp.pipe batches; only sentence boundaries are needed here
+        articles = [list(rows) for _, rows in groupby(article_entities, key=lambda row: row['id'])]
+        texts = (f"{rows[0]['title']}\n\n{rows[0]['summary']}" for rows in articles)
+        docs = self.nlp.pipe(texts, batch_size=NER_BATCH_SIZE, disable=ROLE_DISABLED_PIPES)
+        
+        for rows, doc in zip(articles, docs):
+            sentences = [sent.text for sent in doc.sents]
+            sentences_lower = [sentence.lower() for sentence in sentences]
             
-            # Skip if already classified
-            if not force_recompute:
-                cursor.execute("""
-                    SELECT 1 FROM entity_roles
-                    WHERE article_id = ? AND entity_id = ?
-                """, (article_id, entity_id))
-                if cursor.fetchone():
+            for row in rows:
+                article_id = row['id']
+                entity_id = row['entity_id']
+                entity_name = row['entity_name']
+                
+                # Extract sentences containing entity
+                name_lower = entity_name.lower()
+                entity_sentences = [
+                    sentence for sentence, sentence_lower in zip(sentences, sentences_lower)
+                    if name_lower in sentence_lower
+                ]
+                
+                if not entity_sentences:
                     continue
-            
-            # Extract sentences containing entity
-            doc = self.nlp(text)
-            entity_sentences = []
-            
-            for sent in doc.sents:
-                if entity_name.lower() in sent.text.lower():
-                    entity_sentences.append(sent.text)
-            
-            if not entity_sentences:
-                continue
-            
-            # Analyze patterns
-            role_type, confidence = self._classify_role(text, entity_name, entity_sentences)
-            
-            # Store role
-            cursor.execute("""
-                INSERT OR REPLACE INTO entity_roles (entity_id, article_id, role_type, confidence)
-                VALUES (?, ?, ?, ?)
-            """, (entity_id, article_id, role_type, confidence))
-            
-            roles_classified += 1
-            
-            if roles_classified % 100 == 0:
-                conn.commit()
-        
+                
+                # Analyze patterns
+                role_type, confidence = self._classify_role(doc.text, entity_name, entity_sentences)
+                
+                # Store role
+                roles.append((entity_id, article_id, role_type, confidence))
+                
+                if len(roles) >= NER_WRITE_BATCH_SIZE:
+                    self._insert_roles(cursor, roles)
+                    conn.commit()
+                    roles_classified += len(roles)
+                    roles = []
+        
+        self._insert_roles(cursor, roles)
+        roles_classified += len(roles)
         conn.commit()
         conn.close()
         
@@ -274,6 +352,14 @@ class NERService:
             'roles_classified': roles_classified
         }
     
+    @staticmethod
+    def _insert_roles(cursor, roles):
+        """Store classified roles: (entity_id, article_id, role_type, confidence) rows."""
+        cursor.executemany("""
+            INSERT OR REPLACE INTO entity_roles (entity_id, article_id, role_type, confidence)
+            VALUES (?, ?, ?, ?)
+        """, roles)
+    
     def _classify_role(self, text: str, entity_name: str, sentences: List[str]) -> Tuple[str, float]:
         """
         Classify role of entity based on context patterns.
@@ -286,43 +372,20 @@ class NERService:
         Returns:
             Tuple of (role_type, confidence)
         """
-        # Count pattern matches
-        protagonist_score = 0
-        antagonist_score = 0
-        subject_score = 0
-        adjudicator_score = 0
+        # Count pattern matches (each pattern at most once per sentence)
+        # from one pass over the sentence's words
+        scores = dict.fromkeys(ROLE_PATTERNS, 0)
         
         for sentence in sentences:
-            sentence_lower = sentence.lower()
-            
-            # Check protagonist patterns
-            for pattern in PROTAGONIST_PATTERNS:
-                if re.search(pattern, sentence_lower):
-                    protagonist_score += 1
-            
-            # Check antagonist patterns
-            for pattern in ANTAGONIST_PATTERNS:
-                if re.search(pattern, sentence_lower):
-                    antagonist_score += 1
-            
-            # Check subject patterns
-            for pattern in SUBJECT_PATTERNS:
-                if re.search(pattern, sentence_lower):
-                    subject_score += 1
-            
-            # Check adjudicator patterns
-            for pattern in ADJUDICATOR_PATTERNS:
-                if re.search(pattern, sentence_lower):
-                    adjudicator_score += 1
+            words = re.findall(r'\w+', sentence.lower())
+            matched = set()
+            for n in ROLE_KEYWORD_LENGTHS:
+                for start in range(len(words) - n + 1):
+                    matched.update(ROLE_KEYWORDS.get(tuple(words[start:start + n]), ()))
+            for role, _ in matched:
+                scores[role] += 1
         
         # Determine role
-        scores = {
-            'protagonist': protagonist_score,
-            'antagonist': antagonist_score,
-            'subject': subject_score,
-            'adjudicator': adjudicator_score
-        }
-        
         max_role = max(scores.items(), key=lambda x: x[1])
         
         if max_role[1] == 0:
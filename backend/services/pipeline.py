@@ -5,7 +5,7 @@ Runs the 9-step pipeline (steps 3-9) to compute embeddings, similarities, cluste
 Steps 1-2 (ingest and FTS) are handled separately during CSV ingestion.
 """
 import logging
-from backend.db import get_db
+from backend.db import get_db, analyze_db
 from backend.config import Config
 
 logger = logging.getLogger(__name__)
@@ -308,6 +308,13 @@ class PipelineRunner:
                     logger.error(f"Error in step {step_num}: {e}", exc_info=True)
                     results[f'step_{step_num}'] = {'status': 'error', 'error': str(e)}
         
+        # Steps rewrite cluster, projection, and entity columns wholesale
+        conn = get_db()
+        try:
+            analyze_db(conn)
+        finally:
+            conn.close()
+        
         return results
     
     def get_pipeline_status(self):
@@ -5,7 +5,8 @@ from backend.db import get_db
 from urllib.parse import quote
 
 
-def search_articles(query, date_from='', date_to='', outlet='', cluster_id=None, limit=100, offset=0, count_only=False):
+def search_articles(query, date_from='', date_to='', outlet='', cluster_id=None, limit=100, offset=0, count_only=False,
+                    conn=None):
     """
     Search articles using FTS5.
     
@@ -18,11 +19,14 @@ def search_articles(query, date_from='', date_to='', outlet='', cluster_id=None,
         limit: Maximum results
         offset: Pagination offset
         count_only: If True, return only the count
+        conn: Open connection to run on; if omitted, one is opened and closed here
     
     Returns:
         List of matching articles or count if count_only=True
     """
-    conn = get_db()
+    owns_conn = conn is None
+    if owns_conn:
+        conn = get_db()
     cursor = conn.cursor()
     
     # Build FTS5 query (escape special characters)
@@ -71,13 +75,14 @@ def search_articles(query, date_from='', date_to='', outlet='', cluster_id=None,
             cursor.execute(query_sql, params)
         else:
             cursor.execute(f"""
-                SELECT COUNT(DISTINCT a.id)
+                SELECT COUNT(*)
                 FROM articles_fts
                 JOIN articles a ON articles_fts.rowid = a.id
                 {where_clause}
             """, params)
         count = cursor.fetchone()[0]
-        conn.close()
+        if owns_conn:
+            conn.close()
         return count
     
     # Get matching articles with ranking
@@ -106,7 +111,8 @@ def search_articles(query, date_from='', date_to='', outlet='', cluster_id=None,
         """, query_params)
     
     results = cursor.fetchall()
-    conn.close()
+    if owns_conn:
+        conn.close()
     
     return results
 
@@ -15,6 +15,10 @@ from backend.services.embeddings import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+# Articles sent to FAISS per search; neighbour titles and summaries for the
+# whole batch are then read with one query
+SIMILARITY_QUERY_BATCH = 64
+
 
 class SimilarityService:
     """Service for building similarity graph and computing shared terms."""
@@ -102,10 +106,12 @@ class SimilarityService:
     
     def build_similarity_graph(self, force_recompute=False):
         """
-        Build similarity graph by querying FAISS for each article.
+        Build similarity graph by querying FAISS in batches of articles.
         
         For each article, finds top-k neighbors above similarity threshold,
-        computes shared terms, and stores in similarities table.
+        computes shared terms, and stores in similarities table. Each batch
+        of SIMILARITY_QUERY_BATCH articles is one FAISS search plus one
+        query for its neighbours' text.
         
         Args:
             force_recompute: If True, recompute even if similarities exist
@@ -142,112 +148,96 @@ class SimilarityService:
                 logger.error("FAISS index not found. Run step_embeddings first.")
                 return stats
             
-            # Create reverse mapping: article_id -> FAISS index position
-            article_to_index = {}
-            if article_ids_map is not None:
-                for idx, article_id in enumerate(article_ids_map):
-                    article_to_index[int(article_id)] = idx
+            # Articles that already have edges (including reverse edges stored
+            # earlier in this run) are skipped unless forcing
+            done = set()
+            if not force_recompute:
+                cursor.execute("SELECT DISTINCT src_id FROM similarities")
+                done = {row[0] for row in cursor}
+            pending = [row for row in articles if row['id'] not in done]
+            stats['skipped'] = len(articles) - len(pending)
             
-            # Process each article
             processed = 0
-            for article_row in articles:
-                article_id = article_row['id']
-                title = article_row['title'] or ''
-                summary = article_row['summary'] or ''
-                article_text = f"{title} \n {summary}".strip()
+            for start in range(0, len(pending), SIMILARITY_QUERY_BATCH):
+                batch = pending[start:start + SIMILARITY_QUERY_BATCH]
                 
-                try:
-                    # Check if we should skip (if similarities already exist and not forcing)
-                    if not force_recompute:
-                        cursor.execute("""
-                            SELECT COUNT(*) FROM similarities WHERE src_id = ?
-                        """, (article_id,))
-                        count = cursor.fetchone()[0]
-                        if count > 0:
-                            stats['skipped'] += 1
-                            continue
-                    
-                    # Query FAISS for similar articles
-                    similar_results = self.embedding_service.query_similar(
-                        article_id, k=self.knn_k
-                    )
+                # One FAISS search for the whole batch
+                neighbors = self.embedding_service.query_similar_batch(
+                    [row['id'] for row in batch], k=self.knn_k
+                )
+                
+                # Titles and summaries of every neighbour above the threshold
+                neighbor_ids = sorted({
+                    similar_id
+                    for results in neighbors.values()
+                    for similar_id, cosine_score in results
+                    if cosine_score >= self.threshold
+                })
+                neighbor_texts = {}
+                if neighbor_ids:
+                    placeholders = ','.join('?' * len(neighbor_ids))
+                    cursor.execute(f"""
+                        SELECT id, title, summary FROM articles WHERE id IN ({placeholders})
+                    """, neighbor_ids)
+                    neighbor_texts = {
+                        row['id']: f"{row['title'] or ''} \n {row['summary'] or ''}".strip()
+                        for row in cursor
+                    }
+                
+                for article_row in batch:
+                    article_id = article_row['id']
+                    title = article_row['title'] or ''
+                    summary = article_row['summary'] or ''
+                    article_text = f"{title} \n {summary}".strip()
                     
-                    # Filter by threshold and process
-                    edges_to_insert = []
+                    if article_id in done:
+                        stats['skipped'] += 1
+                        continue
                     
-                    for similar_id, cosine_score in similar_results:
-                        # Filter by similarity threshold
-                        if cosine_score < self.threshold:
-                            continue
-                        
-                        # Get similar article text for shared terms
-                        cursor.execute("""
-                            SELECT title, summary FROM articles WHERE id = ?
-                        """, (similar_id,))
-                        similar_row = cursor.fetchone()
+                    try:
+                        edges_to_insert = []
                         
-                        if not similar_row:
-                            continue
+                        for similar_id, cosine_score in neighbors.get(article_id, []):
+                            # Filter by similarity threshold
+                            if cosine_score < self.threshold:
+                                continue
+                            
+                            similar_text = neighbor_texts.get(similar_id)
+                            if similar_text is None:
+                                continue
+                            
+                            # Compute shared terms
+                            shared_terms = json.dumps(self.compute_shared_terms(
+                                article_text, similar_text, top_n=10
+                            ))
+                            
+                            # Store edge bidirectionally for easier querying
+                            # (shared terms are the same both ways)
+                            edges_to_insert.append((article_id, similar_id, cosine_score, json.dumps([]), shared_terms))
+                            edges_to_insert.append((similar_id, article_id, cosine_score, json.dumps([]), shared_terms))
                         
-                        similar_title = similar_row['title'] or ''
-                        similar_summary = similar_row['summary'] or ''
-                        similar_text = f"{similar_title} \n {similar_summary}".strip()
-                        
-                        # Compute shared terms
-                        shared_terms = self.compute_shared_terms(
-                            article_text, similar_text, top_n=10
-                        )
-                        
-                        # Store edge bidirectionally for easier querying
-                        # Store src -> dst
-                        edges_to_insert.append({
-                            'src_id': article_id,
-                            'dst_id': similar_id,
-                            'cosine': cosine_score,
-                            'shared_entities': json.dumps([]),  # Placeholder for P2 NER
-                            'shared_terms': json.dumps(shared_terms)
-                        })
-                        
-                        # Store dst -> src (reverse edge with same similarity)
-                        # Note: shared terms are the same, just reversed
-                        edges_to_insert.append({
-                            'src_id': similar_id,
-                            'dst_id': article_id,
-                            'cosine': cosine_score,
-                            'shared_entities': json.dumps([]),  # Placeholder for P2 NER
-                            'shared_terms': json.dumps(shared_terms)
-                        })
+                        if edges_to_insert:
+                            # Use INSERT OR IGNORE to avoid duplicate key errors when storing bidirectionally
+                            cursor.executemany("""
+                                INSERT OR IGNORE INTO similarities 
+                                (src_id, dst_id, cosine, shared_entities, shared_terms)
+                                VALUES (?, ?, ?, ?, ?)
+                            """, edges_to_insert)
+                            
+                            stats['edges_created'] += len(edges_to_insert)
+                            processed += 1
+                            if not force_recompute:
+                                done.add(article_id)
+                                done.update(edge[0] for edge in edges_to_insert)
                     
-                    # Batch insert edges
-                    if edges_to_insert:
-                        # Use INSERT OR IGNORE to avoid duplicate key errors when storing bidirectionally
-                        cursor.executemany("""
-                            INSERT OR IGNORE INTO similarities 
-                            (src_id, dst_id, cosine, shared_entities, shared_terms)
-                            VALUES (?, ?, ?, ?, ?)
-                        """, [
-                            (
-                                edge['src_id'],
-                                edge['dst_id'],
-                                edge['cosine'],
-                                edge['shared_entities'],
-                                edge['shared_terms']
-                            )
-                            for edge in edges_to_insert
-                        ])
-                        
-                        stats['edges_created'] += len(edges_to_insert)
-                        processed += 1
-                        
-                        # Commit periodically (every 50 articles)
-                        if processed % 50 == 0:
-                            conn.commit()
-                            logger.info(f"Processed {processed} articles, created {stats['edges_created']} edges...")
+                    except Exception as e:
+                        logger.error(f"Error processing article {article_id}: {e}", exc_info=True)
+                        stats['errors'] += 1
+                        continue
                 
-                except Exception as e:
-                    logger.error(f"Error processing article {article_id}: {e}", exc_info=True)
-                    stats['errors'] += 1
-                    continue
+                # Commit once per batch
+                conn.commit()
+                logger.info(f"Processed {processed} articles, created {stats['edges_created']} edges...")
             
             # Final commit
             conn.commit()
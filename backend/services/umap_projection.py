@@ -33,31 +33,9 @@ class UMAPService:
             tuple: (embeddings_array, article_ids_list)
         """
         conn = get_db()
-        cursor = conn.cursor()
         
         try:
-            cursor.execute("""
-                SELECT e.article_id, e.vec
-                FROM embeddings e
-                ORDER BY e.article_id
-            """)
-            rows = cursor.fetchall()
-            
-            if len(rows) == 0:
-                return np.array([]), []
-            
-            embeddings = []
-            article_ids = []
-            
-            for row in rows:
-                vector = self.embedding_service._blob_to_vector(row['vec'])
-                embeddings.append(vector)
-                article_ids.append(row['article_id'])
-            
-            embeddings_array = np.array(embeddings, dtype=np.float32)
-            
-            return embeddings_array, article_ids
-            
+            return self.embedding_service._load_matrix(conn)
         finally:
             conn.close()
     
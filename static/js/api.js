@@ -20,6 +20,7 @@ export const api = {
         }
         if (params.limit) queryString.append('limit', params.limit);
         if (params.offset) queryString.append('offset', params.offset);
+        if (params.include_total === false) queryString.append('include_total', 'false');
         
         const url = `${API_BASE}/articles?${queryString.toString()}`;
         
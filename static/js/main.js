@@ -339,7 +339,7 @@ async function loadOutlets() {
     try {
         // For now, we'll load outlets from articles
         // In future, could have a dedicated endpoint
-        const response = await api.getArticles({ limit: 1000 });
+        const response = await api.getArticles({ limit: 1000, include_total: false });
         const outlets = [...new Set(response.items.map(a => a.outlet).filter(Boolean))].sort();
         
         const select = document.getElementById('outlet-filter');
@@ -531,7 +531,7 @@ async function showArticleDetails(article) {
  */
 async function selectArticleById(articleId) {
     try {
-        const response = await api.getArticles({ limit: 1000 });
+        const response = await api.getArticles({ limit: 1000, include_total: false });
         const article = response.items.find(a => a.id === articleId);
         if (article) {
             selectArticle(article);
@@ -599,7 +599,7 @@ async function handleStorylineSelection(event) {
     // Fetch and display articles from this storyline
     try {
         const articleIds = articles.map(a => a.id);
-        const response = await api.getArticles({ limit: 1000 });
+        const response = await api.getArticles({ limit: 1000, include_total: false });
         const filteredArticles = response.items.filter(a => articleIds.includes(a.id));
         
         appState.totalArticles = filteredArticles.length;
@@ -633,11 +633,21 @@ async function handleEntitySelection(event) {
     switchView('list');
     
     try {
-        // Fetch entity timeline (articles mentioning this entity)
-        const response = await fetch(`/api/entities/${entityId}/timeline`);
+        // Fetch entity timeline (articles mentioning this entity), following
+        // next_cursor so entities with more than one page keep every article
+        const timelineUrl = `/api/entities/${entityId}/timeline?limit=1000`;
+        let response = await fetch(timelineUrl);
         if (!response.ok) throw new Error('Failed to load entity');
         
         const data = await response.json();
+        let nextCursor = data.next_cursor;
+        while (nextCursor) {
+            response = await fetch(`${timelineUrl}&cursor=${encodeURIComponent(nextCursor)}`);
+            if (!response.ok) throw new Error('Failed to load entity');
+            const page = await response.json();
+            data.articles.push(...page.articles);
+            nextCursor = page.next_cursor;
+        }
         
         // Clear other filters
         appState.filters = {
@@ -658,7 +668,7 @@ async function handleEntitySelection(event) {
         
         // Fetch full article details
         const articleIds = data.articles.map(a => a.id);
-        const articlesResponse = await api.getArticles({ limit: 1000 });
+        const articlesResponse = await api.getArticles({ limit: 1000, include_total: false });
         const filteredArticles = articlesResponse.items.filter(a => articleIds.includes(a.id));
         
         appState.totalArticles = filteredArticles.length;
@@ -25,7 +25,7 @@ export class GalaxyView {
         
         try {
             // Fetch UMAP data with article details for tooltips
-            const response = await fetch('/api/umap?include_details=true');
+            const response = await fetch('/api/umap?include_details=true&format=columns');
             if (!response.ok) {
                 throw new Error(`UMAP API error: ${response.status}`);
             }
@@ -73,9 +73,11 @@ export class GalaxyView {
         
         this.chart = echarts.init(chartDom);
         
-        const points = data.points || [];
+        // Columnar payload: parallel id/x/y/cluster_id/title/summary arrays
+        const columns = data.points || {};
+        const ids = columns.id || [];
         
-        if (points.length === 0) {
+        if (ids.length === 0) {
             this.container.innerHTML = `
                 <div style="text-align: center; padding: 4rem; color: #64748b;">
                     <h3>No UMAP Data</h3>
@@ -97,20 +99,26 @@ export class GalaxyView {
         const clustersMap = new Map();
         const articleMap = new Map(); // Map article IDs to full point data for tooltips
         
-        points.forEach(point => {
-            const clusterId = point.cluster_id !== null && point.cluster_id !== undefined 
-                ? String(point.cluster_id) : 'null';
+        ids.forEach((id, i) => {
+            // Unclustered points carry cluster_id -1 in the columnar format
+            const rawClusterId = columns.cluster_id[i];
+            const pointClusterId = rawClusterId >= 0 ? rawClusterId : null;
+            const clusterId = pointClusterId !== null ? String(pointClusterId) : 'null';
             if (!clustersMap.has(clusterId)) {
                 clustersMap.set(clusterId, []);
             }
             
             // Store article data for tooltips
-            articleMap.set(point.id, point);
+            articleMap.set(id, {
+                id: id,
+                title: columns.title ? columns.title[i] : null,
+                summary: columns.summary ? columns.summary[i] : null
+            });
             
             clustersMap.get(clusterId).push({
-                name: `Article ${point.id}`,
-                value: [point.x, point.y, point.id],
-                cluster_id: point.cluster_id
+                name: `Article ${id}`,
+                value: [columns.x[i], columns.y[i], id],
+                cluster_id: pointClusterId
             });
         });
         
@@ -50,7 +50,7 @@ class TestGetArticles:
     
     def test_get_articles_empty_database(self, client):
         """Test getting articles from empty database."""
-        response = client.get('/api/articles')
+        response = client.get('/api/articles?include_total=true')
         assert response.status_code == 200
         
         data = json.loads(response.data)
@@ -61,7 +61,7 @@ class TestGetArticles:
     
     def test_get_articles_with_data(self, client, sample_articles_data):
         """Test getting articles returns data."""
-        response = client.get('/api/articles')
+        response = client.get('/api/articles?include_total=true')
         assert response.status_code == 200
         
         data = json.loads(response.data)
@@ -72,7 +72,7 @@ class TestGetArticles:
     
     def test_get_articles_full_text_search(self, client, sample_articles_data):
         """Test full-text search via q parameter."""
-        response = client.get('/api/articles?q=Python')
+        response = client.get('/api/articles?q=Python&include_total=true')
         assert response.status_code == 200
         
         data = json.loads(response.data)
@@ -159,7 +159,7 @@ class TestGetArticles:
     
     def test_get_articles_response_format(self, client, sample_articles_data):
         """Test response format matches spec."""
-        response = client.get('/api/articles')
+        response = client.get('/api/articles?include_total=true')
         assert response.status_code == 200
         
         data = json.loads(response.data)
@@ -177,6 +177,31 @@ class TestGetArticles:
             assert 'url' in item
             assert 'outlet' in item
     
+    def test_get_articles_total_by_default(self, client, sample_articles_data):
+        """Test that total is returned unless include_total=false opts out."""
+        data = json.loads(client.get('/api/articles').data)
+        assert data['total'] == 3
+        
+        response = client.get('/api/articles?include_total=false')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert 'total' not in data
+        assert len(data['items']) >= 3
+    
+    def test_get_articles_total_with_pagination(self, client, sample_articles_data):
+        """Test that total reflects all matches, not just the current page."""
+        response = client.get('/api/articles?limit=1&include_total=true')
+        data = json.loads(response.data)
+        assert len(data['items']) == 1
+        assert data['total'] == 3
+        
+        # Offset past the end still reports the full total
+        response = client.get('/api/articles?offset=50&include_total=true')
+        data = json.loads(response.data)
+        assert data['items'] == []
+        assert data['total'] == 3
+    
     def test_get_articles_limit_clamping(self, client, sample_articles_data):
         """Test that limit is clamped to reasonable values."""
         # Test negative limit
@@ -295,3 +320,35 @@ Duplicate Test,2/15/25,https://example.com/dup,Summary"""
                 target_path.unlink()
             raise
 
+
+
+class TestResponseCompression:
+    """Test compression of JSON API responses."""
+    
+    def test_large_json_response_is_gzipped(self, client, temp_db):
+        """Test that large JSON payloads are compressed when the client accepts gzip."""
+        from backend.config import Config
+        import gzip
+        import sqlite3
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.executemany("""
+            INSERT INTO articles (title, summary, url, outlet, date, date_bin)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [(f'Article {i}', 'Summary text ' * 10, f'https://example.com/{i}',
+               'example.com', '2025-02-10', '2025-02') for i in range(50)])
+        conn.commit()
+        conn.close()
+        
+        response = client.get('/api/articles', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert response.headers.get('Content-Encoding') == 'gzip'
+        
+        data = json.loads(gzip.decompress(response.data))
+        assert len(data['items']) == 50
+    
+    def test_small_json_response_not_compressed(self, client):
+        """Test that payloads below the minimum size are sent uncompressed."""
+        response = client.get('/api/articles', headers={'Accept-Encoding': 'gzip'})
+        assert response.status_code == 200
+        assert 'Content-Encoding' not in response.headers
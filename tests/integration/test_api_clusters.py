@@ -0,0 +1,142 @@
+"""
+Integration tests for cluster API endpoints.
+"""
+import pytest
+from app import create_app
+import json
+
+
+@pytest.fixture
+def client(temp_db):
+    """Create test client backed by the temporary database."""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def clustered_articles(temp_db):
+    """Insert two clusters and a mix of clustered/unclustered articles."""
+    from backend.config import Config
+    import sqlite3
+    
+    conn = sqlite3.connect(Config.DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    cursor.executemany("INSERT INTO clusters (id, label, size, score) VALUES (?, ?, ?, ?)",
+                       [(1, 'Cluster A', 2, 0.0), (2, None, 1, 0.0)])
+    
+    articles = [
+        ('Article 1', 'https://example.com/1', '2025-02-10', 1),
+        ('Article 2', 'https://example.com/2', '2025-02-11', 1),
+        ('Article 3', 'https://example.com/3', '2025-02-12', 2),
+        ('Article 4', 'https://example.com/4', '2025-02-13', None),
+    ]
+    cursor.executemany("""
+        INSERT INTO articles (title, summary, url, outlet, date, date_bin, cluster_id)
+        VALUES (?, 'Summary', ?, 'example.com', ?, '2025-02', ?)
+    """, articles)
+    
+    conn.commit()
+    conn.close()
+
+
+class TestClustersAPI:
+    """Test GET /api/clusters endpoint."""
+    
+    def test_get_clusters_empty(self, client):
+        """Test clusters endpoint with no data."""
+        response = client.get('/api/clusters')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['clusters'] == []
+        assert data['stats'] == {
+            'total_clusters': 0,
+            'total_articles': 0,
+            'clustered_articles': 0,
+            'unclustered': 0
+        }
+    
+    def test_get_clusters_stats(self, client, clustered_articles):
+        """Test that cluster stats are computed correctly."""
+        response = client.get('/api/clusters')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert [c['id'] for c in data['clusters']] == [1, 2]
+        assert data['clusters'][1]['label'] == 'Unlabeled'
+        assert data['stats'] == {
+            'total_clusters': 2,
+            'total_articles': 4,
+            'clustered_articles': 3,
+            'unclustered': 1
+        }
+    
+    def test_get_clusters_not_modified(self, client, clustered_articles):
+        """Test that a matching If-None-Match returns 304."""
+        response = client.get('/api/clusters')
+        etag = response.headers['ETag']
+        assert etag
+        
+        response = client.get('/api/clusters', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        assert response.data == b''
+    
+    def test_get_clusters_refreshes_after_write(self, client, clustered_articles):
+        """Test that cached stats and ETag change when articles are written."""
+        from backend.config import Config
+        import sqlite3
+        
+        response = client.get('/api/clusters')
+        etag = response.headers['ETag']
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("""
+            INSERT INTO articles (title, summary, url, outlet, date, date_bin, cluster_id)
+            VALUES ('Article 5', 'Summary', 'https://example.com/5', 'example.com', '2025-02-14', '2025-02', 1)
+        """)
+        conn.commit()
+        conn.close()
+        
+        response = client.get('/api/clusters', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert response.headers['ETag'] != etag
+        
+        data = json.loads(response.data)
+        assert data['stats']['total_articles'] == 5
+        assert data['stats']['clustered_articles'] == 4
+
+
+class TestClusterArticlesAPI:
+    """Test GET /api/cluster/:id/articles endpoint."""
+    
+    def test_get_cluster_articles(self, client, clustered_articles):
+        """Test articles are newest first with every field populated."""
+        response = client.get('/api/cluster/1/articles')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['total'] == 2
+        assert data['cluster'] == {'id': 1, 'label': 'Cluster A', 'size': 2, 'score': 0.0}
+        assert [item['title'] for item in data['items']] == ['Article 2', 'Article 1']
+        assert data['items'][0] == {
+            'id': 2, 'title': 'Article 2', 'summary': 'Summary', 'url': 'https://example.com/2',
+            'outlet': 'example.com', 'date': '2025-02-11', 'date_bin': '2025-02', 'cluster_id': 1
+        }
+    
+    def test_get_cluster_articles_pagination(self, client, clustered_articles):
+        """Test limit/offset, including a page past the end."""
+        data = json.loads(client.get('/api/cluster/1/articles?limit=1&offset=1').data)
+        assert [item['title'] for item in data['items']] == ['Article 1']
+        assert data['total'] == 2
+        
+        data = json.loads(client.get('/api/cluster/1/articles?offset=10').data)
+        assert data['items'] == []
+    
+    def test_get_cluster_articles_not_found(self, client):
+        """Test that an unknown cluster returns 404."""
+        response = client.get('/api/cluster/999/articles')
+        assert response.status_code == 404
+        assert json.loads(response.data)['error']['code'] == 'CLUSTER_NOT_FOUND'
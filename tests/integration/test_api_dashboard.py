@@ -0,0 +1,117 @@
+"""
+Integration tests for dashboard API endpoints.
+"""
+import pytest
+from datetime import date, timedelta
+from app import create_app
+import json
+
+
+@pytest.fixture
+def client(temp_db):
+    """Create test client backed by the temporary database."""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def dashboard_data(temp_db):
+    """Insert recent and old articles, a storyline, an entity, and an alert."""
+    from backend.config import Config
+    import sqlite3
+    
+    today = date.today()
+    recent = (today - timedelta(days=2)).isoformat()
+    old = (today - timedelta(days=60)).isoformat()
+    
+    conn = sqlite3.connect(Config.DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    cursor.executemany("""
+        INSERT INTO articles (id, title, url, date, cluster_id) VALUES (?, ?, ?, ?, ?)
+    """, [
+        (1, 'Recent A', 'https://example.com/1', recent, 1),
+        (2, 'Recent B', 'https://example.com/2', recent, None),
+        (3, 'Old', 'https://example.com/3', old, 1),
+    ])
+    cursor.execute("""
+        INSERT INTO storylines (id, label, status, momentum_score, first_date, last_date, article_count)
+        VALUES (1, 'Story', 'active', 0.8, ?, ?, 2)
+    """, (old, recent))
+    cursor.execute("INSERT INTO entities (id, name, type) VALUES (1, 'NASA', 'ORG')")
+    cursor.executemany("INSERT INTO article_entities (article_id, entity_id) VALUES (?, 1)", [(1,), (3,)])
+    cursor.execute("""
+        INSERT INTO alerts (alert_type, entity_json, triggered_at, description)
+        VALUES ('new_actor', '{}', ?, 'NASA appeared')
+    """, (recent,))
+    
+    conn.commit()
+    conn.close()
+    return recent
+
+
+class TestDashboardSummaryAPI:
+    """Test GET /api/dashboard/summary endpoint."""
+    
+    def test_summary_sections(self, client, dashboard_data):
+        """Test every section is assembled from its own query."""
+        response = client.get('/api/dashboard/summary')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['stats'] == {
+            'total_articles': 3,
+            'active_storylines_count': 1,
+            'dormant_storylines_count': 0,
+            'total_entities': 1,
+            'new_articles_7d': 2,
+            'unacknowledged_alerts': 1,
+        }
+        assert [s['id'] for s in data['active_storylines']] == [1]
+        assert data['temporal_heatmap'] == [{'date': dashboard_data, 'count': 2}]
+        assert data['key_actors'] == [{'entity_id': 1, 'name': 'NASA', 'type': 'ORG', 'mentions_7d': 1}]
+        assert data['cluster_evolution'] == [{'date': dashboard_data, 'cluster_sizes': {'1': 1}}]
+        assert data['recent_alerts'] == []
+    
+    def test_summary_empty_database(self, client):
+        """Test the summary is well-formed with no data."""
+        data = json.loads(client.get('/api/dashboard/summary').data)
+        assert data['stats']['total_articles'] == 0
+        assert data['active_storylines'] == []
+        assert data['cluster_evolution'] == []
+    
+    def test_service_shared_across_requests(self, client):
+        """Test handlers use the service registered on the app."""
+        from backend.services.dashboard import DashboardService
+        
+        service = client.application.extensions['dashboard_service']
+        assert isinstance(service, DashboardService)
+        
+        client.get('/api/dashboard/summary')
+        assert client.application.extensions['dashboard_service'] is service
+    
+    def test_summary_cached_until_corpus_changes(self, client, dashboard_data, monkeypatch):
+        """Test repeated requests reuse the summary until a write bumps the version."""
+        from backend.config import Config
+        import sqlite3
+        
+        service = client.application.extensions['dashboard_service']
+        calls = []
+        build = service.get_dashboard_summary
+        monkeypatch.setattr(service, 'get_dashboard_summary',
+                            lambda **kwargs: calls.append(kwargs) or build(**kwargs))
+        
+        client.get('/api/dashboard/summary?days_back=45')
+        client.get('/api/dashboard/summary?days_back=45')
+        assert len(calls) == 1
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("UPDATE storylines SET status = 'dormant' WHERE id = 1")
+        conn.commit()
+        conn.close()
+        
+        data = json.loads(client.get('/api/dashboard/summary?days_back=45').data)
+        assert len(calls) == 2
+        assert data['stats']['dormant_storylines_count'] == 1
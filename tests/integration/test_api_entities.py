@@ -0,0 +1,149 @@
+"""
+Integration tests for entities API endpoints.
+"""
+import pytest
+from app import create_app
+import json
+
+
+@pytest.fixture
+def client(temp_db):
+    """Create test client backed by the temporary database."""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def entity_graph(temp_db):
+    """
+    Insert articles and entities:
+    - Biden appears in articles 1-4
+    - NASA appears in articles 1-2
+    - Paris appears in article 3
+    - Berlin appears in article 5 only (never with Biden)
+    """
+    from backend.config import Config
+    import sqlite3
+    
+    conn = sqlite3.connect(Config.DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    cursor.executemany("""
+        INSERT INTO articles (id, title, summary, url, outlet, date, date_bin)
+        VALUES (?, ?, 'Summary', ?, 'example.com', ?, '2025-02')
+    """, [(i, f'Article {i}', f'https://example.com/{i}', f'2025-02-{10 + i:02d}') for i in range(1, 6)])
+    
+    cursor.executemany("INSERT INTO entities (id, name, type) VALUES (?, ?, ?)", [
+        (1, 'Biden', 'PERSON'),
+        (2, 'NASA', 'ORG'),
+        (3, 'Paris', 'GPE'),
+        (4, 'Berlin', 'GPE'),
+    ])
+    
+    mentions = [(1, 1), (2, 1), (3, 1), (4, 1), (1, 2), (2, 2), (3, 3), (5, 4)]
+    cursor.executemany("INSERT INTO article_entities (article_id, entity_id) VALUES (?, ?)", mentions)
+    
+    cursor.execute("""
+        INSERT INTO entity_roles (entity_id, article_id, role_type, confidence)
+        VALUES (1, 2, 'protagonist', 0.9)
+    """)
+    
+    conn.commit()
+    conn.close()
+
+
+class TestEntitiesAPI:
+    """Test GET /api/entities endpoint."""
+    
+    def test_get_entities_ordered_by_degree(self, client, entity_graph):
+        """Test entities are returned with degree, highest first."""
+        response = client.get('/api/entities')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['items'][0] == {'id': 1, 'name': 'Biden', 'type': 'PERSON', 'degree': 4}
+        assert data['items'][1]['name'] == 'NASA'
+        assert data['items'][1]['degree'] == 2
+    
+    def test_get_entities_filters(self, client, entity_graph):
+        """Test type, q, and min_degree filters."""
+        data = json.loads(client.get('/api/entities?type=GPE').data)
+        assert {item['name'] for item in data['items']} == {'Paris', 'Berlin'}
+        
+        data = json.loads(client.get('/api/entities?q=as').data)
+        assert [item['name'] for item in data['items']] == ['NASA']
+        
+        data = json.loads(client.get('/api/entities?min_degree=2').data)
+        assert [item['name'] for item in data['items']] == ['Biden', 'NASA']
+    
+    def test_get_entities_substring_search(self, client, entity_graph):
+        """Test q matches anywhere in the name, case-insensitively."""
+        data = json.loads(client.get('/api/entities?q=erli').data)
+        assert [item['name'] for item in data['items']] == ['Berlin']
+        
+        data = json.loads(client.get('/api/entities?q=BID&type=PERSON').data)
+        assert [item['name'] for item in data['items']] == ['Biden']
+        
+        data = json.loads(client.get('/api/entities?q=%22Par').data)
+        assert data['items'] == []
+
+
+class TestEntityTimelineAPI:
+    """Test GET /api/entities/:id/timeline endpoint."""
+    
+    def test_get_entity_timeline(self, client, entity_graph):
+        """Test timeline lists mentioning articles in date order with roles."""
+        response = client.get('/api/entities/1/timeline')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['entity'] == {'id': 1, 'name': 'Biden', 'type': 'PERSON'}
+        assert [a['id'] for a in data['articles']] == [1, 2, 3, 4]
+        assert data['articles'][1]['role_type'] == 'protagonist'
+        assert data['articles'][0]['role_type'] == 'neutral'
+    
+    def test_get_entity_timeline_pagination(self, client, entity_graph):
+        """Test that next_cursor walks the timeline page by page."""
+        seen = []
+        url = '/api/entities/1/timeline?limit=3'
+        while url:
+            data = json.loads(client.get(url).data)
+            assert len(data['articles']) <= 3
+            seen.extend(a['id'] for a in data['articles'])
+            cursor = data['next_cursor']
+            url = f'/api/entities/1/timeline?limit=3&cursor={cursor}' if cursor else None
+        
+        assert seen == [1, 2, 3, 4]
+    
+    def test_get_entity_timeline_invalid_cursor(self, client, entity_graph):
+        """Test that a malformed cursor returns 400."""
+        response = client.get('/api/entities/1/timeline?cursor=not-a-cursor')
+        assert response.status_code == 400
+        assert json.loads(response.data)['error']['code'] == 'INVALID_CURSOR'
+    
+    def test_get_entity_timeline_not_found(self, client):
+        """Test that an unknown entity returns 404."""
+        response = client.get('/api/entities/999/timeline')
+        assert response.status_code == 404
+
+
+class TestEntityRelationshipsAPI:
+    """Test GET /api/entities/:id/relationships endpoint."""
+    
+    def test_get_entity_relationships(self, client, entity_graph):
+        """Test co-mention counts exclude the entity itself and unrelated entities."""
+        response = client.get('/api/entities/1/relationships')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['related_entities'] == [
+            {'entity_id': 2, 'name': 'NASA', 'co_mention_count': 2},
+            {'entity_id': 3, 'name': 'Paris', 'co_mention_count': 1},
+        ]
+    
+    def test_get_entity_relationships_isolated(self, client, entity_graph):
+        """Test an entity with no co-mentions returns an empty list."""
+        data = json.loads(client.get('/api/entities/4/relationships').data)
+        assert data['related_entities'] == []
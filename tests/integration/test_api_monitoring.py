@@ -0,0 +1,62 @@
+"""
+Integration tests for monitoring API endpoints.
+"""
+import pytest
+from datetime import datetime, timedelta
+from app import create_app
+import json
+
+
+@pytest.fixture
+def client(temp_db):
+    """Create test client backed by the temporary database."""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def alerts(temp_db):
+    """Insert recent and old alerts, one of them acknowledged."""
+    from backend.config import Config
+    import sqlite3
+    
+    now = datetime.now()
+    recent = (now - timedelta(hours=1)).isoformat()
+    old = (now - timedelta(days=3)).isoformat()
+    
+    conn = sqlite3.connect(Config.DATABASE_PATH)
+    conn.executemany("""
+        INSERT INTO alerts (alert_type, entity_json, triggered_at, description, severity, acknowledged)
+        VALUES (?, '{}', ?, 'Alert', ?, ?)
+    """, [
+        ('topic_surge', recent, 'high', 0),
+        ('new_actor', recent, 'low', 1),
+        ('story_reactivation', old, 'medium', 0),
+    ])
+    conn.commit()
+    conn.close()
+
+
+class TestMonitoringStatsAPI:
+    """Test GET /api/monitoring/stats endpoint."""
+    
+    def test_stats_empty(self, client):
+        """Test all counts are zero without alerts."""
+        data = json.loads(client.get('/api/monitoring/stats').data)
+        assert data == {'total_alerts': 0, 'unacknowledged_alerts': 0, 'recent_alerts_24h': 0}
+    
+    def test_stats_counts(self, client, alerts):
+        """Test total, unacknowledged, and last-24h counts."""
+        data = json.loads(client.get('/api/monitoring/stats').data)
+        assert data == {'total_alerts': 3, 'unacknowledged_alerts': 2, 'recent_alerts_24h': 2}
+
+
+class TestAlertsAPI:
+    """Test GET /api/alerts endpoint."""
+    
+    def test_get_alerts_filters(self, client, alerts):
+        """Test severity filter on the alert list."""
+        data = json.loads(client.get('/api/alerts?severity=high').data)
+        assert [alert['alert_type'] for alert in data['alerts']] == ['topic_surge']
@@ -0,0 +1,96 @@
+"""
+Integration tests for similar articles API endpoint.
+"""
+import pytest
+from app import create_app
+import json
+
+
+@pytest.fixture
+def client(temp_db):
+    """Create test client backed by the temporary database."""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def similar_articles(temp_db):
+    """Insert a source article with two similarity edges."""
+    from backend.config import Config
+    import sqlite3
+    
+    conn = sqlite3.connect(Config.DATABASE_PATH)
+    cursor = conn.cursor()
+    
+    cursor.executemany("""
+        INSERT INTO articles (id, title, summary, url, outlet, date, date_bin)
+        VALUES (?, ?, 'Summary', ?, ?, ?, '2025-02')
+    """, [
+        (1, 'Source', 'https://example.com/1', 'example.com', '2025-02-10'),
+        (2, 'Same outlet', 'https://example.com/2', 'example.com', '2025-02-13'),
+        (3, 'Other outlet', 'https://other.com/3', 'other.com', '2025-02-01'),
+    ])
+    cursor.executemany("""
+        INSERT INTO similarities (src_id, dst_id, cosine, shared_entities, shared_terms, tier)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, [
+        (1, 2, 0.9, '["NASA"]', '["launch"]', 'continuation'),
+        (1, 3, 0.7, None, None, 'related'),
+    ])
+    
+    conn.commit()
+    conn.close()
+
+
+class TestSimilarAPI:
+    """Test GET /api/similar/:id endpoint."""
+    
+    def test_get_similar_not_found(self, client):
+        """Test that an unknown article returns 404."""
+        response = client.get('/api/similar/999')
+        assert response.status_code == 404
+        
+        data = json.loads(response.data)
+        assert data['ok'] is False
+        assert data['error']['code'] == 'ARTICLE_NOT_FOUND'
+    
+    def test_get_similar_items_and_evidence(self, client, similar_articles):
+        """Test similar items are ordered by cosine and carry 'why' evidence."""
+        response = client.get('/api/similar/1')
+        assert response.status_code == 200
+        
+        data = json.loads(response.data)
+        assert data['article'] == {'id': 1, 'title': 'Source'}
+        assert [item['id'] for item in data['items']] == [2, 3]
+        
+        first, second = data['items']
+        assert first['why']['shared_entities'] == ['NASA']
+        assert first['why']['shared_terms'] == ['launch']
+        assert first['why']['date_proximity_days'] == 3
+        assert first['why']['same_outlet'] is True
+        
+        assert second['why']['shared_entities'] == []
+        assert second['why']['date_proximity_days'] == 9
+        assert not second['why']['same_outlet']
+    
+    def test_get_similar_tolerates_malformed_evidence(self, client, similar_articles):
+        """Test that unparseable stored evidence degrades to empty lists."""
+        from backend.config import Config
+        import sqlite3
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("UPDATE similarities SET shared_terms = 'not json' WHERE dst_id = 2")
+        conn.commit()
+        conn.close()
+        
+        first = json.loads(client.get('/api/similar/1').data)['items'][0]
+        assert first['why']['shared_entities'] == ['NASA']
+        assert first['why']['shared_terms'] == []
+    
+    def test_get_similar_respects_k(self, client, similar_articles):
+        """Test that k limits the number of results."""
+        response = client.get('/api/similar/1?k=1')
+        data = json.loads(response.data)
+        assert len(data['items']) == 1
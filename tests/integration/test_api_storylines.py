@@ -0,0 +1,108 @@
+"""
+Integration tests for storylines API endpoints.
+"""
+import pytest
+from app import create_app
+import json
+
+
+@pytest.fixture
+def client(temp_db):
+    """Create test client backed by the temporary database."""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def storylines(temp_db):
+    """Insert storylines, including ties on momentum and last_date."""
+    from backend.config import Config
+    import sqlite3
+    
+    conn = sqlite3.connect(Config.DATABASE_PATH)
+    conn.executemany("""
+        INSERT INTO storylines (id, label, status, momentum_score, first_date, last_date, article_count)
+        VALUES (?, ?, ?, ?, '2025-01-01', ?, 1)
+    """, [
+        (1, 'Low', 'dormant', 0.1, '2025-02-01'),
+        (2, 'High', 'active', 0.9, '2025-02-01'),
+        (3, 'Tie A', 'active', 0.5, '2025-02-10'),
+        (4, 'Tie B', 'active', 0.5, '2025-02-10'),
+        (5, 'Tie older', 'active', 0.5, '2025-02-05'),
+    ])
+    conn.commit()
+    conn.close()
+
+
+class TestStorylinesAPI:
+    """Test GET /api/storylines endpoint."""
+    
+    def test_get_storylines_ordered_by_momentum(self, client, storylines):
+        """Test storylines are ordered by momentum, then recency, then id."""
+        data = json.loads(client.get('/api/storylines').data)
+        assert [s['id'] for s in data['storylines']] == [2, 4, 3, 5, 1]
+        assert data['next_cursor'] is None
+    
+    def test_get_storylines_pagination(self, client, storylines):
+        """Test keyset pagination visits every storyline exactly once."""
+        seen = []
+        url = '/api/storylines?limit=2'
+        while url:
+            data = json.loads(client.get(url).data)
+            assert len(data['storylines']) <= 2
+            seen.extend(s['id'] for s in data['storylines'])
+            cursor = data['next_cursor']
+            url = f'/api/storylines?limit=2&cursor={cursor}' if cursor else None
+        
+        assert seen == [2, 4, 3, 5, 1]
+    
+    def test_get_storylines_pagination_null_momentum(self, client, storylines):
+        """Test a page ending on a NULL momentum row still leads to the rest."""
+        from backend.config import Config
+        import sqlite3
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("""
+            INSERT INTO storylines (id, label, status, momentum_score, first_date, last_date, article_count)
+            VALUES (6, 'Unscored', 'active', NULL, '2025-01-01', '2025-03-01', 1)
+        """)
+        conn.execute("UPDATE storylines SET momentum_score = 0 WHERE id = 1")
+        conn.commit()
+        conn.close()
+        
+        seen = []
+        url = '/api/storylines?limit=5'
+        while url:
+            data = json.loads(client.get(url).data)
+            seen.extend((s['id'], s['momentum_score']) for s in data['storylines'])
+            cursor = data['next_cursor']
+            url = f'/api/storylines?limit=5&cursor={cursor}' if cursor else None
+        
+        # NULL sorts as 0 (ahead of id 1 on recency) and the page after it is kept
+        assert seen == [(2, 0.9), (4, 0.5), (3, 0.5), (5, 0.5), (6, 0), (1, 0)]
+    
+    def test_get_storylines_status_filter(self, client, storylines):
+        """Test status filter combines with pagination."""
+        data = json.loads(client.get('/api/storylines?status=active&limit=3').data)
+        assert [s['id'] for s in data['storylines']] == [2, 4, 3]
+        
+        cursor = data['next_cursor']
+        data = json.loads(client.get(f'/api/storylines?status=active&limit=3&cursor={cursor}').data)
+        assert [s['id'] for s in data['storylines']] == [5]
+        assert data['next_cursor'] is None
+    
+    def test_get_storylines_invalid_cursor(self, client, storylines):
+        """Test that a malformed cursor returns 400."""
+        response = client.get('/api/storylines?cursor=%%%')
+        assert response.status_code == 400
+
+
+class TestStorylineArticlesAPI:
+    """Test GET /api/storyline/:id/articles endpoint."""
+    
+    def test_get_storyline_articles_not_found(self, client):
+        """Test that an unknown storyline returns 404."""
+        response = client.get('/api/storyline/999/articles')
+        assert response.status_code == 404
@@ -94,3 +94,74 @@ class TestTimelineAPI:
         data = json.loads(response.data)
         assert 'bins' in data
 
+    
+    def test_get_timeline_merges_unbinned_articles(self, client, temp_db, monkeypatch):
+        """Test month grouping counts articles without date_bin by their date."""
+        from backend.config import Config
+        import sqlite3
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.executemany("""
+            INSERT INTO articles (title, url, date, date_bin, cluster_id) VALUES (?, ?, ?, ?, ?)
+        """, [
+            ('Binned', 'https://example.com/1', '2025-02-10', '2025-02', 1),
+            ('Unbinned', 'https://example.com/2', '2025-02-11', None, 1),
+            ('Unclustered', 'https://example.com/3', '2025-03-01', '2025-03', None),
+        ])
+        conn.commit()
+        conn.close()
+        
+        data = json.loads(client.get('/api/timeline').data)
+        assert data['bins'] == [
+            {'date': '2025-02', 'count': 2, 'by_cluster': {'1': 2}},
+            {'date': '2025-03', 'count': 1, 'by_cluster': {'null': 1}},
+        ]
+        
+        # Other groupings use date_bin as-is and skip unbinned articles
+        response = client.get('/api/timeline?group_by=week')
+        assert response.status_code == 200
+        assert [b['count'] for b in json.loads(response.data)['bins']] == [1, 1]
+        
+        data = json.loads(client.get('/api/timeline?group_by=week&cluster_id=1').data)
+        assert data['bins'] == [{'date': '2025-02', 'count': 1, 'by_cluster': {'1': 1}}]
+    
+    def test_get_timeline_not_modified(self, client, temp_db):
+        """Test the ETag round-trip and that it changes when articles are written."""
+        from backend.config import Config
+        import sqlite3
+        
+        response = client.get('/api/timeline?cluster_id=1')
+        etag = response.headers['ETag']
+        assert response.headers['Cache-Control'] == f'public, max-age={Config.API_CACHE_MAX_AGE}'
+        
+        response = client.get('/api/timeline?cluster_id=1', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        
+        # Other parameters have their own ETag
+        response = client.get('/api/timeline', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("""
+            INSERT INTO articles (title, url, date, date_bin, cluster_id)
+            VALUES ('New', 'https://example.com/new', '2025-02-10', '2025-02', 1)
+        """)
+        conn.commit()
+        conn.close()
+        
+        response = client.get('/api/timeline?cluster_id=1', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert json.loads(response.data)['bins'][0]['count'] == 1
+    
+    def test_get_timeline_reuses_cached_bins(self, client, temp_db, monkeypatch):
+        """Test repeat requests for an unchanged corpus skip the query."""
+        from backend.api import timeline
+        
+        first = client.get('/api/timeline')
+        assert first.status_code == 200
+        
+        # A broken statement would fail the request if it were re-run
+        monkeypatch.setattr(timeline, '_TIMELINE_SQL_MONTH_ALL', 'SELECT no_such_column')
+        second = client.get('/api/timeline')
+        assert second.status_code == 200
+        assert second.data == first.data
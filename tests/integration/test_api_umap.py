@@ -0,0 +1,94 @@
+"""
+Integration tests for UMAP API endpoint.
+"""
+import pytest
+from app import create_app
+from backend.config import Config
+import json
+
+
+@pytest.fixture
+def client(temp_db):
+    """Create test client backed by the temporary database."""
+    app = create_app()
+    app.config['TESTING'] = True
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def projected_articles(temp_db):
+    """Insert articles with UMAP coordinates, one unclustered and one unprojected."""
+    from backend.config import Config
+    import sqlite3
+    
+    conn = sqlite3.connect(Config.DATABASE_PATH)
+    conn.executemany("""
+        INSERT INTO articles (id, title, summary, url, date, umap_x, umap_y, cluster_id)
+        VALUES (?, ?, 'Summary', ?, '2025-02-10', ?, ?, ?)
+    """, [
+        (1, 'First', 'https://example.com/1', -3.12, 1.04, 7),
+        (2, 'Second', 'https://example.com/2', 0.5, -0.25, None),
+        (3, 'Unprojected', 'https://example.com/3', None, None, 7),
+    ])
+    conn.commit()
+    conn.close()
+
+
+class TestUmapAPI:
+    """Test GET /api/umap endpoint."""
+    
+    def test_get_umap_points(self, client, projected_articles):
+        """Test the default per-point format."""
+        data = json.loads(client.get('/api/umap').data)
+        assert data['points'] == [
+            {'id': 1, 'x': -3.12, 'y': 1.04, 'cluster_id': 7},
+            {'id': 2, 'x': 0.5, 'y': -0.25, 'cluster_id': None},
+        ]
+        assert data['meta']['total_points'] == 2
+        assert data['meta']['model'] == Config.EMBEDDING_MODEL.rsplit('/', 1)[-1]
+        assert data['meta']['umap']['metric'] == Config.UMAP_METRIC
+    
+    def test_get_umap_columns(self, client, projected_articles):
+        """Test the struct-of-arrays format, with details."""
+        data = json.loads(client.get('/api/umap?format=columns&include_details=true').data)
+        points = data['points']
+        
+        assert points['id'] == [1, 2]
+        assert points['x'] == pytest.approx([-3.12, 0.5], rel=1e-6)
+        assert points['y'] == pytest.approx([1.04, -0.25], rel=1e-6)
+        assert points['cluster_id'] == [7, -1]
+        assert points['title'] == ['First', 'Second']
+        assert data['meta']['total_points'] == 2
+    
+    def test_get_umap_columns_empty(self, client):
+        """Test the columnar format with no projected articles."""
+        data = json.loads(client.get('/api/umap?format=columns').data)
+        assert data['points'] == {'id': [], 'x': [], 'y': [], 'cluster_id': []}
+        assert data['meta']['total_points'] == 0
+        assert data['meta']['has_clusters'] is False
+    
+    def test_get_umap_has_clusters(self, client, projected_articles):
+        """Test has_clusters reflects whether any cluster exists."""
+        from backend.config import Config
+        import sqlite3
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("INSERT INTO clusters (id, label, size) VALUES (7, 'Cluster', 1)")
+        conn.commit()
+        conn.close()
+        
+        data = json.loads(client.get('/api/umap').data)
+        assert data['meta']['has_clusters'] is True
+    
+    def test_get_umap_not_modified(self, client, projected_articles):
+        """Test that a matching If-None-Match returns 304 per format."""
+        response = client.get('/api/umap?format=columns')
+        etag = response.headers['ETag']
+        assert response.headers['Cache-Control'] == f'public, max-age={Config.API_CACHE_MAX_AGE}'
+        
+        response = client.get('/api/umap?format=columns', headers={'If-None-Match': etag})
+        assert response.status_code == 304
+        
+        response = client.get('/api/umap', headers={'If-None-Match': etag})
+        assert response.status_code == 200
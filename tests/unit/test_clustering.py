@@ -55,6 +55,181 @@ class TestClusteringService:
         assert embeddings.dtype == np.float32
         assert article_id in article_ids
     
+    def test_load_embeddings_cached(self, temp_db, tmp_path, monkeypatch):
+        """Test normalized embeddings are memory-mapped from cache until they change."""
+        from backend.config import Config
+        from backend.db import get_db
+        monkeypatch.setattr(Config, 'EMBEDDINGS_CACHE_PATH', str(tmp_path / 'embeddings.npy'))
+        
+        conn = get_db()
+        for article_id in (1, 2):
+            conn.execute("INSERT INTO articles (id, title, url, date) VALUES (?, 'T', ?, '2025-02-10')",
+                         (article_id, f'https://example.com/{article_id}'))
+            conn.execute("INSERT INTO embeddings (article_id, vec) VALUES (?, ?)",
+                         (article_id, np.array([3, 4, 0, article_id], dtype=np.float32).tobytes()))
+        conn.commit()
+        
+        clustering_service = ClusteringService()
+        first, article_ids = clustering_service._load_embeddings()
+        second, cached_ids = clustering_service._load_embeddings()
+        
+        assert isinstance(second, np.memmap)
+        np.testing.assert_allclose(second, first)
+        assert cached_ids == article_ids == [1, 2]
+        np.testing.assert_allclose(np.linalg.norm(first, axis=1), 1.0, rtol=1e-6)
+        
+        conn.execute("INSERT INTO articles (id, title, url, date) VALUES (3, 'T', 'https://example.com/3', '2025-02-10')")
+        conn.execute("INSERT INTO embeddings (article_id, vec) VALUES (3, ?)", (np.ones(4, dtype=np.float32).tobytes(),))
+        conn.commit()
+        conn.close()
+        
+        third, article_ids = clustering_service._load_embeddings()
+        assert not isinstance(third, np.memmap)
+        assert article_ids == [1, 2, 3]
+        
+        # Rewriting a row in place leaves COUNT(*) and MAX(article_id) alone
+        conn = get_db()
+        conn.execute("INSERT OR REPLACE INTO embeddings (article_id, vec) VALUES (3, ?)",
+                     (np.array([0, 0, 1, 0], dtype=np.float32).tobytes(),))
+        conn.commit()
+        conn.close()
+        
+        fourth, _ = clustering_service._load_embeddings()
+        assert not isinstance(fourth, np.memmap)
+        np.testing.assert_allclose(fourth[2], [0, 0, 1, 0])
+    
+    def test_centroid_silhouette(self):
+        """Test the centroid silhouette rewards well-separated clusters."""
+        labels = np.array([0, 0, 1, 1])
+        
+        separated = np.array([[0.1, 9.0], [0.2, 9.1], [9.0, 0.1], [9.2, 0.2]])
+        assert ClusteringService._centroid_silhouette(separated, labels) > 0.95
+        
+        # Points sitting between both centers score near zero
+        ambiguous = np.array([[1.0, 1.1], [1.0, 1.0], [1.1, 1.0], [1.0, 1.0]])
+        assert abs(ClusteringService._centroid_silhouette(ambiguous, labels)) < 0.1
+    
+    def test_merge_close_clusters(self):
+        """Test batch clusters with nearby centroids merge and labels are renumbered."""
+        embeddings = np.array([
+            [1.0, 0.0], [0.99, 0.01],   # label 3
+            [0.98, 0.02], [1.0, 0.01],  # label 7, same direction as 3
+            [0.0, 1.0], [0.01, 0.99],   # label 5
+            [0.7, 0.7],                 # noise
+        ], dtype=np.float32)
+        labels = np.array([3, 3, 7, 7, 5, 5, -1])
+        
+        merged = ClusteringService._merge_close_clusters(embeddings, labels)
+        
+        assert merged[0] == merged[1] == merged[2] == merged[3]
+        assert merged[4] == merged[5] != merged[0]
+        assert merged[6] == -1
+        assert set(merged) == {-1, 0, 1}
+    
+    def test_cluster_sizes(self):
+        """Test per-cluster counts skip noise and unused ids."""
+        labels = np.array([2, 0, -1, 2, 2, -1, 0])
+        assert ClusteringService._cluster_sizes(labels) == {0: 2, 2: 3}
+        assert ClusteringService._cluster_sizes(np.array([-1, -1])) == {}
+    
+    def test_cluster_hdbscan_casts_once(self, tmp_path, monkeypatch):
+        """Test HDBSCAN receives C-contiguous float64 input on the CPU path."""
+        monkeypatch.setattr(Config, 'HDBSCAN_CACHE_DIR', str(tmp_path / 'hdbscan_cache'))
+        service = ClusteringService()
+        service.use_gpu = False
+        received = []
+        
+        class FakeHDBSCAN:
+            def __init__(self, metric='euclidean', memory=None):
+                self.memory = memory
+            
+            def fit_predict(self, X):
+                received.append((X, self.memory))
+                return np.zeros(len(X), dtype=np.int64)
+        
+        monkeypatch.setattr(service, '_hdbscan_model', FakeHDBSCAN)
+        labels, n_clusters = service._cluster_hdbscan(np.ones((10, 4), dtype=np.float32))
+        
+        assert n_clusters == 1
+        X, memory = received[0]
+        assert X.dtype == np.float64
+        assert X.flags.c_contiguous
+        assert memory is not None  # the unbatched fit is cached
+    
+    def test_cluster_hdbscan_batched_fits_uncached(self, monkeypatch):
+        """Test batched HDBSCAN fits don't write to the cache."""
+        from backend.services import clustering
+        monkeypatch.setattr(clustering, 'HDBSCAN_BATCH_SIZE', 5)
+        service = ClusteringService()
+        service.use_gpu = False
+        memories = []
+        
+        class FakeHDBSCAN:
+            def __init__(self, metric='euclidean', memory=None):
+                memories.append(memory)
+            
+            def fit_predict(self, X):
+                return np.full(len(X), -1, dtype=np.int64)
+        
+        monkeypatch.setattr(service, '_hdbscan_model', FakeHDBSCAN)
+        service._cluster_hdbscan_batched(np.ones((10, 4)), batch_size=5)
+        
+        assert memories and all(memory is None for memory in memories)
+    
+    def test_knn_distance_graph(self):
+        """Test the approximate k-NN graph is symmetric with no self loops."""
+        pytest.importorskip('pynndescent')
+        rng = np.random.default_rng(0)
+        embeddings = rng.normal(size=(200, 8)).astype(np.float32)
+        embeddings[1] = embeddings[0]  # exact duplicate stays connected
+        
+        graph = ClusteringService._knn_distance_graph(embeddings)
+        
+        assert graph.shape == (200, 200)
+        assert (graph != graph.T).nnz == 0
+        assert graph.diagonal().sum() == 0
+        assert graph[0, 1] > 0
+    
+    def test_cluster_kmeans_stops_after_patience(self, monkeypatch):
+        """Test the parallel k sweep keeps the best k and stops after it plateaus."""
+        from backend.services import clustering
+        service = ClusteringService()
+        service.use_gpu = False
+        monkeypatch.setattr(clustering, 'effective_n_jobs', lambda n_jobs: 2)
+        
+        scores = {2: 0.1, 3: 0.4, 4: 0.3, 5: 0.2, 6: 0.35, 7: 0.9}
+        fitted = []
+        
+        def fake_fit(embeddings, k, n_threads=None):
+            fitted.append((k, n_threads))
+            return np.full(len(embeddings), k), scores[k]
+        
+        monkeypatch.setattr(service, '_fit_kmeans', fake_fit)
+        labels, k = service._cluster_kmeans(np.zeros((100, 4)), k_range=(2, 7))
+        
+        assert k == 3
+        assert (labels == 3).all()
+        assert sorted(fitted) == [(k, 1) for k in range(2, 8)]  # k=7 was in the stopping wave
+    
+    def test_cluster_kmeans_wave_capped_at_patience(self, monkeypatch):
+        """Test a wave never fits more k values than the patience allows past the best."""
+        from backend.services import clustering
+        service = ClusteringService()
+        service.use_gpu = False
+        monkeypatch.setattr(clustering, 'effective_n_jobs', lambda n_jobs: 64)
+        
+        fitted = []
+        
+        def fake_fit(embeddings, k, n_threads=None):
+            fitted.append(k)
+            return np.full(len(embeddings), k), 1.0 if k == 2 else 0.0
+        
+        monkeypatch.setattr(service, '_fit_kmeans', fake_fit)
+        _, k = service._cluster_kmeans(np.zeros((200, 4)), k_range=(2, 20))
+        
+        assert k == 2
+        assert sorted(fitted) == list(range(2, 2 + 2 * clustering.KMEANS_PATIENCE))
+    
     def test_cluster_articles_hdbscan(self, temp_db, monkeypatch):
         """Test clustering articles with HDBSCAN."""
         from backend.config import Config
@@ -195,6 +370,43 @@ class TestClusteringService:
         
         conn.close()
     
+    def test_cluster_articles_assigns_new_articles(self, temp_db, tmp_path, monkeypatch):
+        """Test new articles join the nearest saved cluster within its radius."""
+        from backend.config import Config
+        monkeypatch.setattr(Config, 'CLUSTER_CENTROIDS_PATH', str(tmp_path / 'centroids.npz'))
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        vectors = {1: [1, 0, 0, 0], 2: [1, 0, 0, 0], 3: [1, 0.1, 0, 0], 4: [0, 1, 0, 0]}
+        for article_id, vec in vectors.items():
+            conn.execute("""
+                INSERT INTO articles (id, title, url, date, cluster_id) VALUES (?, 'T', ?, '2025-02-10', ?)
+            """, (article_id, f'https://example.com/{article_id}', 0 if article_id <= 2 else None))
+            conn.execute("INSERT INTO embeddings (article_id, vec) VALUES (?, ?)",
+                         (article_id, np.array(vec, dtype=np.float32).tobytes()))
+        conn.execute("INSERT INTO clusters (id, size) VALUES (0, 2)")
+        conn.commit()
+        database = conn.execute("SELECT epoch FROM corpus_version").fetchone()[0]
+        conn.close()
+        
+        ClusteringService._write_centroids(database, np.array([0]), np.array([[1, 0, 0, 0]], dtype=np.float32),
+                                           np.array([0.5], dtype=np.float32), 2)
+        
+        service = ClusteringService()
+        stats = service.cluster_articles(force_recompute=False)
+        assert stats['method'] == 'incremental'
+        assert stats['articles_clustered'] == 1
+        assert stats['noise'] == 1
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        assigned = dict(conn.execute("SELECT id, cluster_id FROM articles WHERE id > 2"))
+        size = conn.execute("SELECT size FROM clusters WHERE id = 0").fetchone()[0]
+        conn.close()
+        assert assigned == {3: 0, 4: None}
+        assert size == 3
+        
+        # Nothing new since the incremental run
+        assert service.cluster_articles(force_recompute=False)['status'] == 'skipped'
+    
     def test_cluster_articles_idempotent(self, temp_db, monkeypatch):
         """Test that clustering is idempotent (doesn't recompute if exists)."""
         from backend.config import Config
@@ -0,0 +1,55 @@
+"""
+Tests for configuration helpers.
+"""
+import os
+from backend.config import load_or_create_secret
+
+
+class TestSecretKey:
+    """Test the generated SECRET_KEY fallback."""
+    
+    def test_secret_created_once(self, tmp_path):
+        """Test the key is written on first use and reused afterwards."""
+        path = tmp_path / 'instance' / '.secret_key'
+        
+        secret = load_or_create_secret(path)
+        assert len(secret) == 48
+        assert path.read_text() == secret
+        assert load_or_create_secret(path) == secret
+    
+    def test_secret_file_private(self, tmp_path):
+        """Test the key file is readable by its owner only."""
+        path = tmp_path / '.secret_key'
+        load_or_create_secret(path)
+        
+        assert os.stat(path).st_mode & 0o777 == 0o600
+    
+    def test_existing_secret_used(self, tmp_path):
+        """Test an existing key file is read as-is."""
+        path = tmp_path / '.secret_key'
+        path.write_text('abc123\n')
+        
+        assert load_or_create_secret(path) == 'abc123'
+    
+    def test_empty_secret_file_replaced(self, tmp_path):
+        """Test an empty key file (an interrupted write) is treated as missing."""
+        path = tmp_path / '.secret_key'
+        path.write_text('')
+        
+        secret = load_or_create_secret(path)
+        assert len(secret) == 48
+        assert path.read_text() == secret
+        assert list(tmp_path.iterdir()) == [path]  # temporary file cleaned up
+    
+    def test_create_app_keeps_secret_in_instance_path(self, temp_db, tmp_path, monkeypatch):
+        """Test create_app generates the key at SECRET_KEY_PATH when none is configured."""
+        from app import create_app
+        from backend.config import Config
+        path = tmp_path / '.secret_key'
+        monkeypatch.setattr(Config, 'SECRET_KEY', None)
+        monkeypatch.setattr(Config, 'SECRET_KEY_PATH', str(path))
+        
+        app = create_app()
+        
+        assert app.config['SECRET_KEY'] == path.read_text()
+        assert create_app().config['SECRET_KEY'] == app.config['SECRET_KEY']
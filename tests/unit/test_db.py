@@ -3,7 +3,7 @@ Tests for database schema initialization.
 """
 import pytest
 import sqlite3
-from backend.db import init_db, get_db
+from backend.db import init_db, get_db, sqlite3 as db_sqlite3
 from backend.config import Config
 
 
@@ -114,6 +114,26 @@ class TestDatabaseSchema:
         
         conn.close()
     
+    def test_init_db_records_schema_version(self, temp_db, monkeypatch):
+        """Test that init_db stamps user_version and skips applied migrations."""
+        from backend.config import Config
+        from backend.db import SCHEMA_MIGRATIONS
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_MIGRATIONS[-1][0]
+        
+        # An up-to-date database is left untouched
+        conn.execute("DROP INDEX idx_articles_date")
+        conn.commit()
+        conn.close()
+        
+        init_db()
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        indexes = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")]
+        conn.close()
+        assert 'idx_articles_date' not in indexes
+    
     def test_cluster_id_column_is_nullable(self, temp_db, monkeypatch):
         """Test that cluster_id column accepts NULL values."""
         from backend.config import Config
@@ -279,6 +299,8 @@ class TestDatabaseSchema:
         assert 'vec' in columns
         assert columns['article_id'] == 'INTEGER'
         assert columns['vec'] == 'BLOB'
+        assert columns['dtype'] == 'TEXT'
+        assert columns['scale'] == 'REAL'
         
         conn.close()
     
@@ -390,6 +412,7 @@ class TestDatabaseSchema:
         assert 'idx_similarities_dst' in indexes
         assert 'idx_entities_name' in indexes
         assert 'idx_entities_type' in indexes
+        assert 'idx_article_entities_entity' in indexes
         
         conn.close()
     
@@ -414,6 +437,8 @@ class TestDatabaseSchema:
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        # Databases from before schema versioning report version 0
+        cursor.execute("PRAGMA user_version = 0")
         conn.commit()
         conn.close()
         
@@ -430,4 +455,342 @@ class TestDatabaseSchema:
         assert 'umap_y' in columns, "Migration should add umap_y column"
         
         conn.close()
+    
+    def test_migration_widens_article_filter_indexes(self, temp_db, monkeypatch):
+        """Test that single-column outlet/cluster indexes are rebuilt with date."""
+        from backend.config import Config
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("DROP INDEX idx_articles_outlet")
+        conn.execute("CREATE INDEX idx_articles_outlet ON articles(outlet)")
+        conn.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+        
+        init_db()
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        for index_name, column in (('idx_articles_outlet', 'outlet'), ('idx_articles_cluster', 'cluster_id')):
+            columns = [row[2] for row in conn.execute(f"PRAGMA index_info({index_name})")]
+            assert columns == [column, 'date']
+        conn.close()
+    
+    def test_similar_query_uses_cosine_index(self, temp_db, monkeypatch):
+        """Test top-k similarity lookups walk idx_similarities_src without sorting."""
+        from backend.config import Config
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        
+        plan = [row[3] for row in conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT dst_id FROM similarities WHERE src_id = ? ORDER BY cosine DESC LIMIT 10
+        """, (1,))]
+        conn.close()
+        
+        assert any('idx_similarities_src' in step for step in plan)
+        assert not any('TEMP B-TREE' in step for step in plan)
+    
+    def test_init_db_analyzes_new_schema(self, temp_db):
+        """Test that init_db gathers planner statistics after migrating."""
+        conn = sqlite3.connect(temp_db)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        conn.close()
+        
+        assert 'sqlite_stat1' in tables
+    
+    def test_umap_query_uses_partial_index(self, temp_db, monkeypatch):
+        """Test the UMAP point scan is served from the covering partial index."""
+        from backend.config import Config
+        from backend.api.umap import _UMAP_SQL
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        
+        plan = [row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + _UMAP_SQL)]
+        conn.close()
+        
+        assert plan == ['SCAN articles USING COVERING INDEX idx_articles_umap_nn']
+    
+    def test_dashboard_queries_use_covering_date_index(self, temp_db):
+        """Test the dashboard date-window scans read only idx_articles_date."""
+        conn = sqlite3.connect(temp_db)
+        columns = [row[2] for row in conn.execute("PRAGMA index_info(idx_articles_date)")]
+        
+        plan = [row[3] for row in conn.execute("""
+            EXPLAIN QUERY PLAN
+            SELECT date, cluster_id, COUNT(*) FROM articles
+            WHERE date >= ? AND cluster_id IS NOT NULL
+            GROUP BY date, cluster_id
+        """, ('2025-01-01',))]
+        conn.close()
+        
+        assert columns == ['date', 'cluster_id']
+        assert any('COVERING INDEX idx_articles_date ' in step for step in plan)
+    
+    def test_date_period_month_generated_column(self, temp_db):
+        """Test date_period_month prefers date_bin and falls back to the date."""
+        conn = get_db()
+        conn.executemany("INSERT INTO articles (title, url, date, date_bin) VALUES (?, ?, ?, ?)", [
+            ('Binned', 'https://example.com/1', '2025-02-10', '2025-02'),
+            ('Unbinned', 'https://example.com/2', '2025-03-01T12:00:00', None),
+        ])
+        conn.commit()
+        
+        periods = [row[0] for row in conn.execute("SELECT date_period_month FROM articles ORDER BY id")]
+        assert periods == ['2025-02', '2025-03']
+        
+        conn.close()
+
+
+class TestRequestConnection:
+    """Test the per-request database connection cached on flask.g."""
+    
+    def test_request_db_reused_within_app_context(self, temp_db):
+        """Test that get_request_db returns the same connection within one app context."""
+        from flask import Flask
+        from backend.db import get_request_db, close_request_db
+        
+        app = Flask(__name__)
+        with app.app_context():
+            conn1 = get_request_db()
+            conn2 = get_request_db()
+            assert conn1 is conn2
+            
+            journal_mode = conn1.execute("PRAGMA journal_mode").fetchone()[0]
+            assert journal_mode == 'wal'
+            
+            # Request connections are read-only
+            with pytest.raises(db_sqlite3.OperationalError):
+                conn1.execute("INSERT INTO clusters (label) VALUES ('x')")
+            
+            close_request_db()
+            
+            # Connection is closed on teardown
+            with pytest.raises(db_sqlite3.ProgrammingError):
+                conn1.execute("SELECT 1")
+    
+    def test_request_db_closed_on_teardown(self, temp_db):
+        """Test that the app-context teardown closes the request connection."""
+        from flask import Flask
+        from backend.db import get_request_db, close_request_db
+        
+        app = Flask(__name__)
+        app.teardown_appcontext(close_request_db)
+        
+        with app.app_context():
+            conn = get_request_db()
+        
+        with pytest.raises(db_sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+
+class TestGetDb:
+    """Test the plain (writable) connection helper."""
+    
+    def test_directories_created_by_init_db_only(self, tmp_path, monkeypatch):
+        """Test init_db creates the database directory and get_db does no filesystem checks."""
+        db_path = tmp_path / 'nested' / 'app.db'
+        monkeypatch.setattr(Config, 'DATABASE_PATH', str(db_path))
+        
+        init_db()
+        assert db_path.exists()
+        
+        calls = []
+        monkeypatch.setattr(Config, 'ensure_directories', staticmethod(lambda: calls.append(1)))
+        get_db().close()
+        assert calls == []
+    
+    def test_connection_pragmas_applied(self, temp_db):
+        """Test get_db connections are tuned and the database is in WAL mode."""
+        conn = get_db()
+        pragma = lambda name: conn.execute(f"PRAGMA {name}").fetchone()[0]
+        
+        assert pragma('journal_mode') == 'wal'
+        assert pragma('synchronous') == 1  # NORMAL
+        assert pragma('temp_store') == 2  # MEMORY
+        assert pragma('cache_size') == -65536
+        
+        conn.close()
+
+
+class TestCorpusVersion:
+    """Test the corpus_version token used for response caching."""
+    
+    def test_corpus_version_bumped_on_writes(self, temp_db):
+        """Test that writes to versioned tables change the version token."""
+        from backend.db import get_corpus_version
+        conn = get_db()
+        
+        version_0 = get_corpus_version(conn)
+        
+        conn.execute("""
+            INSERT INTO articles (title, url, date) VALUES ('A', 'https://example.com/a', '2025-02-10')
+        """)
+        conn.commit()
+        version_1 = get_corpus_version(conn)
+        assert version_1 != version_0
+        
+        conn.execute("UPDATE articles SET cluster_id = 1")
+        conn.commit()
+        version_2 = get_corpus_version(conn)
+        assert version_2 != version_1
+        
+        # Reads leave the version unchanged
+        conn.execute("SELECT COUNT(*) FROM articles").fetchone()
+        assert get_corpus_version(conn) == version_2
+        
+        conn.close()
+    
+    def test_corpus_version_epoch_differs_per_database(self, temp_db, tmp_path, monkeypatch):
+        """Test that a freshly created database never reuses another's tokens."""
+        from backend.db import get_corpus_version
+        
+        conn = get_db()
+        first = get_corpus_version(conn)
+        conn.close()
+        
+        monkeypatch.setattr(Config, 'DATABASE_PATH', str(tmp_path / 'other.db'))
+        init_db()
+        conn = get_db()
+        second = get_corpus_version(conn)
+        conn.close()
+        
+        assert first.endswith('-0') and second.endswith('-0')
+        assert first != second
+    
+    def test_embeddings_version_bumped_on_rewrites(self, temp_db):
+        """Test that embedding writes, including INSERT OR REPLACE, bump only embeddings_version."""
+        conn = get_db()
+        conn.execute("INSERT INTO articles (id, title, url, date) VALUES (1, 'A', 'https://example.com/a', '2025-02-10')")
+        conn.commit()
+        read = lambda: tuple(conn.execute("SELECT version, embeddings_version FROM corpus_version").fetchone())
+        version_0, embeddings_0 = read()
+        
+        conn.execute("INSERT INTO embeddings (article_id, vec) VALUES (1, x'00')")
+        conn.commit()
+        version_1, embeddings_1 = read()
+        
+        conn.execute("INSERT OR REPLACE INTO embeddings (article_id, vec) VALUES (1, x'01')")
+        conn.commit()
+        version_2, embeddings_2 = read()
+        conn.close()
+        
+        assert version_0 == version_1 == version_2
+        assert embeddings_0 < embeddings_1 < embeddings_2
+
 
+class TestEntityDegree:
+    """Test the entities.degree column maintained from article_entities."""
+    
+    def test_degree_tracks_article_entities(self, temp_db):
+        """Test that inserts, deletes, and re-links keep degree current."""
+        conn = get_db()
+        conn.execute("INSERT INTO entities (id, name, type) VALUES (1, 'Biden', 'PERSON'), (2, 'NASA', 'ORG')")
+        conn.executemany("INSERT INTO article_entities (article_id, entity_id) VALUES (?, ?)",
+                         [(1, 1), (2, 1), (3, 1), (1, 2)])
+        # Duplicate links are ignored and must not count twice
+        conn.execute("INSERT OR IGNORE INTO article_entities (article_id, entity_id) VALUES (1, 1)")
+        conn.commit()
+        
+        degree = lambda: dict(conn.execute("SELECT id, degree FROM entities").fetchall())
+        assert degree() == {1: 3, 2: 1}
+        
+        conn.execute("DELETE FROM article_entities WHERE article_id = 3")
+        conn.execute("UPDATE article_entities SET entity_id = 2 WHERE article_id = 2")
+        conn.commit()
+        assert degree() == {1: 1, 2: 2}
+        
+        conn.close()
+    
+    def test_migration_backfills_degree(self, temp_db):
+        """Test that adding the degree column backfills existing entities."""
+        from backend.config import Config
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        cursor = conn.cursor()
+        
+        # Simulate an old schema without the degree column or its triggers
+        for event in ('insert', 'delete', 'update'):
+            cursor.execute(f"DROP TRIGGER article_entities_degree_{event}")
+        cursor.execute("DROP TABLE entities")
+        cursor.execute("""
+            CREATE TABLE entities (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                type TEXT,
+                canonical_name TEXT
+            )
+        """)
+        cursor.execute("INSERT INTO entities (id, name, type) VALUES (1, 'Biden', 'PERSON'), (2, 'NASA', 'ORG')")
+        cursor.executemany("INSERT INTO article_entities (article_id, entity_id) VALUES (?, ?)",
+                           [(1, 1), (2, 1)])
+        cursor.execute("PRAGMA user_version = 0")
+        conn.commit()
+        conn.close()
+        
+        init_db()
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        rows = dict(conn.execute("SELECT id, degree FROM entities").fetchall())
+        conn.close()
+        assert rows == {1: 2, 2: 0}
+    
+    def test_entity_first_seen_tracks_article_entities(self, temp_db):
+        """Test that links keep each entity's earliest mention date current."""
+        conn = get_db()
+        conn.executemany("INSERT INTO articles (id, title, url, date) VALUES (?, 'Article', ?, ?)",
+                         [(1, 'https://example.com/1', '2025-02-10'),
+                          (2, 'https://example.com/2', '2025-01-05'),
+                          (3, 'https://example.com/3', '2025-03-01')])
+        conn.execute("INSERT INTO entities (id, name, type) VALUES (1, 'Biden', 'PERSON')")
+        conn.executemany("INSERT INTO article_entities (article_id, entity_id) VALUES (?, 1)",
+                         [(1,), (2,), (3,)])
+        conn.commit()
+        
+        first_date = lambda: conn.execute("SELECT first_date FROM entity_first_seen WHERE entity_id = 1").fetchone()[0]
+        assert first_date() == '2025-01-05'
+        
+        conn.execute("DELETE FROM article_entities WHERE article_id = 3")
+        assert first_date() == '2025-01-05'
+        conn.execute("DELETE FROM article_entities WHERE article_id = 2")
+        assert first_date() == '2025-02-10'
+        
+        conn.close()
+    
+    def test_migration_backfills_entity_first_seen(self, temp_db):
+        """Test that creating entity_first_seen backfills existing links."""
+        from backend.config import Config
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        # Simulate a schema from before the table and its triggers
+        conn.execute("DROP TABLE entity_first_seen")
+        for event in ('insert', 'delete'):
+            conn.execute(f"DROP TRIGGER article_entities_first_seen_{event}")
+        conn.executemany("INSERT INTO articles (id, title, url, date) VALUES (?, 'Article', ?, ?)",
+                         [(1, 'https://example.com/1', '2025-02-10'),
+                          (2, 'https://example.com/2', '2025-01-05')])
+        conn.execute("INSERT INTO entities (id, name, type) VALUES (1, 'Biden', 'PERSON'), (2, 'NASA', 'ORG')")
+        conn.executemany("INSERT INTO article_entities (article_id, entity_id) VALUES (?, ?)",
+                         [(1, 1), (2, 1), (1, 2)])
+        conn.execute("PRAGMA user_version = 5")
+        conn.commit()
+        conn.close()
+        
+        init_db()
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        rows = dict(conn.execute("SELECT entity_id, first_date FROM entity_first_seen").fetchall())
+        conn.close()
+        assert rows == {1: '2025-01-05', 2: '2025-02-10'}
+    
+    def test_entities_fts_follows_renames(self, temp_db):
+        """Test that entities_fts stays in sync with entity names."""
+        conn = get_db()
+        conn.execute("INSERT INTO entities (id, name, type) VALUES (1, 'Joe Biden', 'PERSON')")
+        conn.execute("UPDATE entities SET name = 'Kamala Harris' WHERE id = 1")
+        conn.commit()
+        
+        match = lambda q: [r[0] for r in conn.execute(
+            "SELECT rowid FROM entities_fts WHERE entities_fts MATCH ?", (f'"{q}"',))]
+        assert match('Biden') == []
+        assert match('mala') == [1]
+        
+        conn.execute("DELETE FROM entities WHERE id = 1")
+        conn.commit()
+        assert match('mala') == []
+        
+        conn.close()
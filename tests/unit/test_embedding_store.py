@@ -0,0 +1,56 @@
+"""
+Tests for embedding BLOB storage (runs without the model or FAISS).
+"""
+import numpy as np
+
+from backend.db import get_db
+from backend.services import _embedding_store
+from backend.services._embedding_store import load_matrix, quantize
+
+
+class TestLoadMatrix:
+    """Test loading stored embeddings into one float32 matrix."""
+    
+    def test_int8_round_trip_in_mixed_batches(self, temp_db, monkeypatch):
+        """Test quantized int8 rows load back within one step beside float32 and float16 rows."""
+        monkeypatch.setattr(_embedding_store, 'EMBEDDING_FETCH_SIZE', 3)
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(7, 16)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        stored, scales = quantize(vectors)
+        
+        # Batches: [1-3] int8 only, [4-6] int8 with a float32 and a float16 row, [7] int8
+        legacy = {5: 'float32', 6: 'float16'}
+        conn = get_db()
+        for article_id, vector in enumerate(vectors, start=1):
+            conn.execute("INSERT INTO articles (id, title, url, date) VALUES (?, 'T', ?, '2025-02-10')",
+                         (article_id, f'https://example.com/{article_id}'))
+            if article_id in legacy:
+                conn.execute("INSERT INTO embeddings (article_id, vec, dtype) VALUES (?, ?, ?)",
+                             (article_id, vector.astype(legacy[article_id]).tobytes(), legacy[article_id]))
+            else:
+                conn.execute("INSERT INTO embeddings (article_id, vec, dtype, scale) VALUES (?, ?, 'int8', ?)",
+                             (article_id, stored[article_id - 1].tobytes(), float(scales[article_id - 1])))
+        conn.commit()
+        
+        matrix, article_ids = load_matrix(conn)
+        tail, tail_ids = load_matrix(conn, after_article_id=4)
+        conn.close()
+        
+        assert article_ids == list(range(1, 8))
+        assert matrix.dtype == np.float32
+        int8_rows = [i for i in range(7) if i + 1 not in legacy]
+        np.testing.assert_allclose(matrix[int8_rows], vectors[int8_rows], atol=float(scales.max()) / 2)
+        np.testing.assert_array_equal(matrix[4], vectors[4])
+        np.testing.assert_allclose(matrix[5], vectors[5], atol=1e-3)
+        assert tail_ids == [5, 6, 7]
+        np.testing.assert_array_equal(tail, matrix[4:])
+    
+    def test_empty(self, temp_db):
+        """Test an empty embeddings table loads as an empty array."""
+        conn = get_db()
+        matrix, article_ids = load_matrix(conn)
+        conn.close()
+        
+        assert matrix.size == 0
+        assert article_ids == []
@@ -24,20 +24,79 @@ pytestmark = pytest.mark.skipif(not HAS_DEPENDENCIES, reason="ML dependencies no
 class TestEmbeddingService:
     """Test embedding generation and FAISS index building."""
     
-    def test_vector_to_blob_and_back(self):
-        """Test conversion between numpy array and BLOB."""
+    def test_quantize_and_back(self):
+        """Test int8 quantization round-trips through a BLOB within one step."""
         service = EmbeddingService()
         
-        # Create test vector
-        original = np.array([0.1, 0.2, 0.3, 0.4], dtype=np.float32)
+        original = np.array([[0.1, -0.2, 0.3, 0.4]], dtype=np.float32)
         
-        # Convert to blob and back
-        blob = service._vector_to_blob(original)
-        restored = service._blob_to_vector(blob)
+        stored, scales = service._quantize(original)
+        blob = stored[0].tobytes()
+        restored = service._blob_to_vector(blob, 'int8', scales[0])
         
-        np.testing.assert_array_almost_equal(original, restored)
+        assert len(blob) == original.size  # one byte per component
+        np.testing.assert_allclose(restored, original[0], atol=scales[0] / 2)
         assert restored.dtype == np.float32
     
+    def test_blobs_to_matrix(self):
+        """Test BLOBs are stacked into one writable, rescaled float32 matrix."""
+        service = EmbeddingService()
+        
+        rows = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, -0.6]], dtype=np.float32)
+        stored, scales = service._quantize(rows)
+        matrix = service._blobs_to_matrix([row.tobytes() for row in stored], 'int8', scales)
+        
+        np.testing.assert_allclose(matrix, rows, atol=float(scales.max()) / 2)
+        assert matrix.dtype == np.float32
+        assert matrix.flags.writeable
+    
+    def test_load_matrix_in_batches(self, temp_db, monkeypatch):
+        """Test all embeddings load in article_id order across fetch batches."""
+        from backend.services import _embedding_store
+        from backend.db import get_db
+        monkeypatch.setattr(_embedding_store, 'EMBEDDING_FETCH_SIZE', 3)
+        
+        service = EmbeddingService()
+        conn = get_db()
+        for article_id in range(1, 9):
+            conn.execute("INSERT INTO articles (id, title, url, date) VALUES (?, 'T', ?, '2025-02-10')",
+                         (article_id, f'https://example.com/{article_id}'))
+            stored, scales = service._quantize(np.full((1, 4), article_id, dtype=np.float32))
+            conn.execute("INSERT INTO embeddings (article_id, vec, dtype, scale) VALUES (?, ?, 'int8', ?)",
+                         (article_id, stored[0].tobytes(), float(scales[0])))
+        conn.commit()
+        
+        matrix, article_ids = service._load_matrix(conn)
+        conn.close()
+        
+        assert article_ids == list(range(1, 9))
+        np.testing.assert_array_equal(matrix[:, 0], np.arange(1, 9, dtype=np.float32))
+    
+    def test_load_matrix_mixed_dtypes(self, temp_db):
+        """Test legacy float32 and float16 rows load alongside int8 rows."""
+        from backend.db import get_db
+        
+        service = EmbeddingService()
+        conn = get_db()
+        for article_id in (1, 2, 3):
+            conn.execute("INSERT INTO articles (id, title, url, date) VALUES (?, 'T', ?, '2025-02-10')",
+                         (article_id, f'https://example.com/{article_id}'))
+        # Row 1 predates the dtype column and relies on its default
+        conn.execute("INSERT INTO embeddings (article_id, vec) VALUES (1, ?)",
+                     (np.full(4, 0.25, dtype=np.float32).tobytes(),))
+        conn.execute("INSERT INTO embeddings (article_id, vec, dtype) VALUES (2, ?, 'float16')",
+                     (np.full(4, 0.5, dtype=np.float16).tobytes(),))
+        conn.execute("INSERT INTO embeddings (article_id, vec, dtype, scale) VALUES (3, ?, 'int8', 0.0078125)",
+                     (np.full(4, 96, dtype=np.int8).tobytes(),))
+        conn.commit()
+        
+        matrix, article_ids = service._load_matrix(conn)
+        conn.close()
+        
+        assert article_ids == [1, 2, 3]
+        assert matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix[:, 0], [0.25, 0.5, 0.75])
+    
     def test_generate_embeddings_for_sample_articles(self, temp_db, monkeypatch):
         """Test generating embeddings for sample articles."""
         from backend.config import Config
@@ -76,15 +135,36 @@ class TestEmbeddingService:
         assert count >= 2
         
         # Verify embedding dimensions
-        cursor.execute("SELECT vec FROM embeddings LIMIT 1")
+        cursor.execute("SELECT vec, dtype, scale FROM embeddings LIMIT 1")
         row = cursor.fetchone()
         if row:
-            vector = service._blob_to_vector(row['vec'])
+            vector = service._blob_to_vector(row['vec'], row['dtype'], row['scale'])
             assert vector.shape[0] == Config.EMBEDDING_DIM
             assert vector.dtype == np.float32
         
         conn.close()
     
+    def test_generate_embeddings_counts_empty_text_as_skipped(self, temp_db):
+        """Test articles without text are skipped and counted, not encoded."""
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("""
+            INSERT INTO articles (title, summary, url, date)
+            VALUES (' ', NULL, 'https://example.com/blank', '2025-02-10')
+        """)
+        conn.commit()
+        conn.close()
+        
+        stats = EmbeddingService().generate_embeddings(force_recompute=False)
+        
+        assert stats['skipped'] == 1
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        count = conn.execute("""
+            SELECT COUNT(*) FROM embeddings e JOIN articles a ON a.id = e.article_id
+            WHERE a.url = 'https://example.com/blank'
+        """).fetchone()[0]
+        conn.close()
+        assert count == 0
+    
     def test_build_faiss_index(self, temp_db, monkeypatch):
         """Test building FAISS index."""
         from backend.config import Config
@@ -129,6 +209,32 @@ class TestEmbeddingService:
         assert meta['dim'] == Config.EMBEDDING_DIM
         conn.close()
     
+    def test_is_normalized(self, monkeypatch):
+        """Test stored unit vectors skip re-normalization unless disabled."""
+        from backend.config import Config
+        monkeypatch.setattr(Config, 'ASSUME_NORMALIZED', True)
+        unit = np.eye(4, dtype=np.float16).astype(np.float32)
+        
+        assert EmbeddingService._is_normalized(unit)
+        assert not EmbeddingService._is_normalized(unit * 2)
+        
+        monkeypatch.setattr(Config, 'ASSUME_NORMALIZED', False)
+        assert not EmbeddingService._is_normalized(unit)
+    
+    def test_faiss_index_spec_by_size(self, monkeypatch):
+        """Test 'auto' picks Flat, then HNSW, then IVF as the corpus grows."""
+        from backend.config import Config
+        monkeypatch.setattr(Config, 'FAISS_INDEX_SPEC', 'auto')
+        monkeypatch.setattr(Config, 'FAISS_FLAT_MAX_VECTORS', 100)
+        monkeypatch.setattr(Config, 'FAISS_HNSW_MAX_VECTORS', 10000)
+        
+        assert EmbeddingService._faiss_index_spec(99) == 'Flat'
+        assert EmbeddingService._faiss_index_spec(100) == 'HNSW32,SQ8'
+        assert EmbeddingService._faiss_index_spec(40000) == 'IVF800,SQ8'
+        
+        monkeypatch.setattr(Config, 'FAISS_INDEX_SPEC', 'HNSW16')
+        assert EmbeddingService._faiss_index_spec(99) == 'HNSW16'
+    
     def test_load_faiss_index(self, temp_db, monkeypatch):
         """Test loading FAISS index."""
         from backend.config import Config
@@ -146,6 +252,43 @@ class TestEmbeddingService:
         assert article_ids is not None
         assert index.ntotal > 0
     
+    def test_load_faiss_index_cached(self, temp_db, monkeypatch):
+        """Test the loaded index is reused until the index file is rewritten."""
+        service = EmbeddingService()
+        service.generate_embeddings(force_recompute=False)
+        service.build_faiss_index(force_rebuild=True)
+        
+        index, _ = service.load_faiss_index()
+        assert service.load_faiss_index()[0] is index
+        
+        import os
+        index_path = Config.FAISS_INDEX_PATH
+        stat = os.stat(index_path)
+        os.utime(index_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert service.load_faiss_index()[0] is not index
+    
+    def test_build_faiss_index_adds_new_articles(self, temp_db):
+        """Test embeddings of new articles are added to the existing index."""
+        service = EmbeddingService()
+        service.generate_embeddings(force_recompute=False)
+        first = service.build_faiss_index(force_rebuild=True)
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.execute("""
+            INSERT INTO articles (title, summary, url, date)
+            VALUES ('Rust Handbook', 'Systems programming in Rust', 'https://example.com/rust', '2025-02-12')
+        """)
+        conn.commit()
+        conn.close()
+        service.generate_embeddings(force_recompute=False)
+        
+        stats = service.build_faiss_index()
+        
+        assert stats['vectors_added'] == 1
+        assert stats['vector_count'] == first['vector_count'] + 1
+        index, article_ids = service.load_faiss_index()
+        assert index.ntotal == len(article_ids) == stats['vector_count']
+    
     def test_query_similar(self, temp_db, monkeypatch):
         """Test querying FAISS for similar articles."""
         from backend.config import Config
@@ -192,3 +335,30 @@ class TestEmbeddingService:
         assert all(isinstance(r, tuple) and len(r) == 2 for r in results)
         assert all(isinstance(r[1], (int, float)) for r in results)  # similarity score
 
+    
+    def test_query_similar_batch(self, temp_db):
+        """Test one batched search matches per-article queries."""
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.executemany("""
+            INSERT INTO articles (title, summary, url, date)
+            VALUES (?, ?, ?, '2025-02-10')
+        """, [
+            ('Python Programming', 'Learn Python programming', 'https://example.com/python'),
+            ('Python Tutorial', 'Python tutorial for beginners', 'https://example.com/tutorial'),
+            ('JavaScript Guide', 'JavaScript programming guide', 'https://example.com/js'),
+        ])
+        conn.commit()
+        article_ids = [row[0] for row in conn.execute("SELECT id FROM articles ORDER BY id")]
+        conn.close()
+        
+        service = EmbeddingService()
+        service.generate_embeddings(force_recompute=False)
+        service.build_faiss_index(force_rebuild=True)
+        
+        results = service.query_similar_batch(article_ids + [999999], k=2)
+        
+        assert set(results) == set(article_ids)  # no embedding, no entry
+        for article_id in article_ids:
+            assert [r[0] for r in results[article_id]] == [r[0] for r in service.query_similar(article_id, k=2)]
+            assert article_id not in [r[0] for r in results[article_id]]
+        assert service.query_similar_batch([], k=2) == {}
@@ -41,6 +41,16 @@ class TestNormalizeDate:
         result = normalize_date('10/02/2025')
         assert result == '2025-10-02'  # dd/mm format, so 10 is day, 02 is month
     
+    def test_normalize_date_day_first_fallback(self):
+        """Test 13/02/2025 -> 2025-02-13 (month first is not a date)"""
+        result = normalize_date('13/02/2025')
+        assert result == '2025-02-13'
+    
+    def test_normalize_date_impossible_date(self):
+        """Test a well-formed but impossible date returns None"""
+        assert normalize_date('2/30/25') is None
+        assert normalize_date('2-10-25') is None  # dashes need a 4-digit year
+    
     def test_normalize_date_with_whitespace(self):
         """Test that whitespace is stripped"""
         result = normalize_date('  2/10/25  ')
@@ -202,6 +212,29 @@ Test Article 2,02/11/2025,https://example.com/article2,Summary of article 2"""
         finally:
             Path(csv_path).unlink()
     
+    def test_ingest_csv_refreshes_statistics(self, temp_db):
+        """Test that ingest_csv re-runs ANALYZE after inserting"""
+        csv_content = """Title,Date,URL,Summary
+Test Article 1,2/10/25,https://example.com/article1,Summary
+Test Article 2,2/11/25,https://example.com/article2,Summary"""
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = Path(f.name)
+        
+        try:
+            ingest_csv(csv_path)
+            
+            from backend.db import get_db
+            conn = get_db()
+            stat = conn.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = 'articles' AND idx = 'idx_articles_date'"
+            ).fetchone()
+            conn.close()
+            assert stat[0].split()[0] == '2'  # Row count as of the last ANALYZE
+        finally:
+            Path(csv_path).unlink()
+    
     def test_ingest_csv_skips_duplicates(self, temp_db, monkeypatch):
         """Test that ingest_csv skips duplicate URLs"""
         from backend.config import Config
@@ -233,6 +266,77 @@ Test Article,2/10/25,https://example.com/article,Summary"""
         finally:
             Path(csv_path).unlink()
     
+    def test_ingest_csv_batches_inserts(self, temp_db, monkeypatch):
+        """Test rows are inserted across batches, skipping in-file duplicate URLs"""
+        from backend.services import ingest
+        monkeypatch.setattr(ingest, 'INGEST_BATCH_SIZE', 2)
+        
+        csv_content = """Title,Date,URL,Summary
+A,2/10/25,https://example.com/a,Summary
+B,2/10/25,https://example.com/b,Summary
+A again,2/11/25,https://example.com/a,Summary
+C,2/11/25,https://example.com/c,Summary
+B again,2/12/25,https://example.com/b,Summary"""
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = Path(f.name)
+        
+        try:
+            stats = ingest_csv(csv_path)
+            
+            assert stats == {'inserted': 3, 'skipped': 2, 'errors': 0}
+            
+            from backend.db import get_db
+            conn = get_db()
+            titles = [row[0] for row in conn.execute("SELECT title FROM articles ORDER BY id")]
+            conn.close()
+            assert titles == ['A', 'B', 'C']
+        finally:
+            Path(csv_path).unlink()
+    
+    def test_ingest_csv_failed_batch_rolled_back_alone(self, temp_db, monkeypatch):
+        """Test a batch whose insert fails is rolled back, counted as errors, and not retried"""
+        from backend.services import ingest
+        monkeypatch.setattr(ingest, 'INGEST_BATCH_SIZE', 2)
+        
+        insert_articles = ingest._insert_articles
+        calls = []
+        
+        def failing_second_batch(cursor, rows, stats):
+            calls.append([row[0] for row in rows])
+            insert_articles(cursor, rows[:1], stats)  # partly written before failing
+            if len(calls) == 2:
+                raise RuntimeError('disk full')
+            insert_articles(cursor, rows[1:], stats)
+        
+        monkeypatch.setattr(ingest, '_insert_articles', failing_second_batch)
+        
+        csv_content = """Title,Date,URL
+A,2/10/25,https://example.com/a
+B,2/10/25,https://example.com/b
+C,2/11/25,https://example.com/c
+D,2/11/25,https://example.com/d
+E,2/12/25,https://example.com/e"""
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = Path(f.name)
+        
+        try:
+            stats = ingest_csv(csv_path)
+            
+            assert calls == [['A', 'B'], ['C', 'D'], ['E']]
+            
+            from backend.db import get_db
+            conn = get_db()
+            titles = [row[0] for row in conn.execute("SELECT title FROM articles ORDER BY id")]
+            conn.close()
+            assert titles == ['A', 'B', 'E']
+            assert stats == {'inserted': 3, 'skipped': 0, 'errors': 2}
+        finally:
+            Path(csv_path).unlink()
+    
     def test_ingest_csv_handles_missing_title(self, temp_db, monkeypatch):
         """Test that rows with missing title are skipped"""
         from backend.config import Config
@@ -252,6 +356,26 @@ Test Article,2/10/25,https://example.com/article,Summary"""
         finally:
             Path(csv_path).unlink()
     
+    def test_ingest_csv_handles_ragged_rows(self, temp_db):
+        """Test blank lines are ignored and cells missing from short rows or the header read as empty"""
+        csv_content = """Title,Date,URL,Summary
+First,2/10/25,https://example.com/1
+
+No URL,2/10/25
+No summary,2/11/25,https://example.com/2"""
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+            f.write(csv_content)
+            csv_path = Path(f.name)
+        
+        try:
+            stats = ingest_csv(csv_path)
+            
+            # Only the row without a URL is rejected
+            assert stats == {'inserted': 2, 'skipped': 0, 'errors': 1}
+        finally:
+            Path(csv_path).unlink()
+    
     def test_ingest_csv_handles_missing_url(self, temp_db, monkeypatch):
         """Test that rows with missing URL are skipped"""
         from backend.config import Config
@@ -249,3 +249,29 @@ class TestLabelingService:
         assert label == 'Existing Label'
         conn.close()
 
+    
+    def test_label_all_clusters_groups_articles(self, temp_db, monkeypatch):
+        """Test each cluster is labeled from its own articles only."""
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.executemany("INSERT INTO clusters (id, label, size, score) VALUES (?, NULL, ?, 0.0)",
+                         [(1, 1), (2, 1), (3, 0)])
+        conn.executemany("""
+            INSERT INTO articles (title, summary, url, date, cluster_id)
+            VALUES (?, ?, ?, '2025-02-10', ?)
+        """, [
+            ('Python Guide', 'Python programming guide', 'https://example.com/1', 1),
+            ('JavaScript Basics', 'JavaScript programming basics', 'https://example.com/2', 2),
+        ])
+        conn.commit()
+        conn.close()
+        
+        service = LabelingService()
+        monkeypatch.setattr(service, '_extract_keywords_batch',
+                            lambda texts: [[text.split()[0]] for text in texts])
+        stats = service.label_all_clusters(force_recompute=False)
+        
+        assert stats['clusters_labeled'] == 3
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        labels = dict(conn.execute("SELECT id, label FROM clusters").fetchall())
+        conn.close()
+        assert labels == {1: 'Python', 2: 'JavaScript', 3: 'Empty Cluster'}
@@ -0,0 +1,74 @@
+"""
+Tests for monitoring (anomaly detection) service.
+"""
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+from backend.config import Config
+from backend.services.monitoring import MonitoringService
+
+
+def _days_ago(days):
+    return (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+
+
+class TestTopicSurges:
+    """Test week-over-week cluster surge detection."""
+    
+    def test_check_topic_surges(self, temp_db):
+        """Test only clusters growing past the threshold from a baseline alert."""
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.executemany("INSERT INTO clusters (id, label, size) VALUES (?, 'Cluster', 0)",
+                         [(1,), (2,), (3,)])
+        # (cluster_id, articles this week, articles the week before)
+        weekly_counts = [(1, 4, 1), (2, 2, 2), (3, 3, 0)]
+        rows = []
+        for cluster_id, current, previous in weekly_counts:
+            rows += [(cluster_id, _days_ago(1)) for _ in range(current)]
+            rows += [(cluster_id, _days_ago(10)) for _ in range(previous)]
+        rows.append((1, _days_ago(30)))  # outside both weeks
+        conn.executemany("""
+            INSERT INTO articles (title, url, date, cluster_id)
+            VALUES ('Article', 'https://example.com/' || hex(randomblob(8)), ?, ?)
+        """, [(date, cluster_id) for cluster_id, date in rows])
+        conn.commit()
+        conn.close()
+        
+        alerts = MonitoringService().check_topic_surges()
+        
+        assert len(alerts) == 1
+        assert alerts[0]['severity'] == 'high'
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        entity_json = conn.execute("SELECT entity_json FROM alerts WHERE alert_type = 'topic_surge'").fetchone()[0]
+        conn.close()
+        assert json.loads(entity_json) == {
+            'cluster_id': 1, 'current_count': 4, 'previous_count': 1, 'growth_ratio': 4.0
+        }
+
+
+class TestNewActors:
+    """Test first-appearance detection for entities."""
+    
+    def test_check_new_actors(self, temp_db):
+        """Test only entities with no mentions before the last 7 days alert."""
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        conn.executemany("""
+            INSERT INTO articles (id, title, url, date)
+            VALUES (?, 'Article', 'https://example.com/' || ?, ?)
+        """, [(1, 1, _days_ago(30)), (2, 2, _days_ago(2)), (3, 3, _days_ago(1))])
+        conn.executemany("INSERT INTO entities (id, name, type) VALUES (?, ?, 'ORG')",
+                         [(1, 'Veteran Corp'), (2, 'Newcomer Inc')])
+        conn.executemany("INSERT INTO article_entities (article_id, entity_id) VALUES (?, ?)",
+                         [(1, 1), (2, 1), (2, 2), (3, 2)])
+        conn.commit()
+        first_seen = dict(conn.execute("SELECT entity_id, first_date FROM entity_first_seen").fetchall())
+        conn.close()
+        
+        assert first_seen == {1: _days_ago(30), 2: _days_ago(2)}
+        
+        alerts = MonitoringService().check_new_actors()
+        
+        assert [alert['description'] for alert in alerts] == [
+            'New actor: Newcomer Inc (ORG) appeared in 2 article(s) this week'
+        ]
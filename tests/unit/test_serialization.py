@@ -0,0 +1,86 @@
+"""
+Tests for orjson-based API response serialization.
+"""
+import pytest
+import json
+from flask import Flask
+from backend.api.serialization import (
+    ORJSONProvider, json_list_response, raw_json_list_response, STREAM_MIN_ITEMS
+)
+
+
+@pytest.fixture
+def app():
+    """Create a bare Flask app using the orjson provider."""
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+    return app
+
+
+class TestORJSONProvider:
+    """Test the Flask JSON provider."""
+    
+    def test_jsonify_uses_orjson(self, app):
+        """Test jsonify output round-trips and stringifies int keys."""
+        from flask import jsonify
+        with app.app_context():
+            response = jsonify({'cluster_sizes': {1: 5, 2: 3}, 'label': 'café'})
+        
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.data) == {'cluster_sizes': {'1': 5, '2': 3}, 'label': 'café'}
+
+
+class TestJsonListResponse:
+    """Test list responses, including the streamed path."""
+    
+    def test_short_list_not_streamed(self, app):
+        """Test that short lists are returned as a single buffered body."""
+        with app.app_context():
+            response = json_list_response('items', [{'id': 1}], total=1)
+        
+        assert not response.is_streamed
+        assert json.loads(response.data) == {'items': [{'id': 1}], 'total': 1}
+    
+    def test_long_list_streamed(self, app):
+        """Test that long lists stream a body identical to the buffered encoding."""
+        items = [{'id': i, 'title': f'Article {i}', 'summary': None} for i in range(STREAM_MIN_ITEMS + 123)]
+        with app.app_context():
+            response = json_list_response('items', items, total=len(items), cluster={'id': 7})
+        
+        assert response.is_streamed
+        assert response.mimetype == 'application/json'
+        
+        data = json.loads(b''.join(response.response))
+        assert data['items'] == items
+        assert data['total'] == len(items)
+        assert data['cluster'] == {'id': 7}
+
+    
+    def test_very_long_list_encoded_ahead(self, app, monkeypatch):
+        """Test that encoding chunks ahead on the worker pool keeps the body intact."""
+        from backend.api import serialization
+        monkeypatch.setattr(serialization, 'PREFETCH_MIN_ITEMS', STREAM_MIN_ITEMS)
+        
+        items = [{'id': i, 'x': i / 7} for i in range(STREAM_MIN_ITEMS * 3 + 1)]
+        with app.app_context():
+            response = json_list_response('points', items, meta={'total_points': len(items)})
+        
+        data = json.loads(b''.join(response.response))
+        assert data == {'points': items, 'meta': {'total_points': len(items)}}
+
+
+class TestRawJsonListResponse:
+    """Test responses wrapping a list that is already JSON-encoded."""
+    
+    def test_wraps_encoded_list(self, app):
+        """Test the encoded list is embedded verbatim alongside extra fields."""
+        with app.app_context():
+            response = raw_json_list_response('items', '[{"id":1,"title":"café"}]',
+                                              total=1, cluster={'id': 7, 'label': None})
+        
+        assert response.mimetype == 'application/json'
+        assert json.loads(response.data) == {
+            'items': [{'id': 1, 'title': 'café'}],
+            'total': 1,
+            'cluster': {'id': 7, 'label': None},
+        }
@@ -149,3 +149,40 @@ class TestSimilarityService:
         
         conn.close()
 
+    
+    def test_build_similarity_graph_queries_in_batches(self, temp_db, monkeypatch):
+        """Test articles are searched in batches and skipped once they have edges."""
+        from backend.services import similarity
+        monkeypatch.setattr(similarity, 'SIMILARITY_QUERY_BATCH', 2)
+        monkeypatch.setattr(Config, 'SIMILARITY_THRESHOLD', 0.5)
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        for article_id in range(1, 6):
+            conn.execute("INSERT INTO articles (id, title, summary, url, date) VALUES (?, ?, 'S', ?, '2025-02-10')",
+                         (article_id, f'Title {article_id}', f'https://example.com/{article_id}'))
+            conn.execute("INSERT INTO embeddings (article_id, vec) VALUES (?, x'00')", (article_id,))
+        conn.commit()
+        conn.close()
+        
+        neighbors = {1: [(2, 0.9), (5, 0.2)], 2: [(1, 0.9)], 3: [(4, 0.8)], 4: [(3, 0.8)], 5: [(1, 0.2)]}
+        batches = []
+        
+        class FakeEmbeddingService:
+            def load_faiss_index(self):
+                return object(), None
+            
+            def query_similar_batch(self, article_ids, k=20):
+                batches.append(list(article_ids))
+                return {article_id: neighbors[article_id] for article_id in article_ids}
+        
+        service = SimilarityService()
+        service.embedding_service = FakeEmbeddingService()
+        stats = service.build_similarity_graph(force_recompute=False)
+        
+        assert batches == [[1, 2], [3, 4], [5]]
+        assert stats == {'edges_created': 4, 'skipped': 2, 'errors': 0}
+        
+        conn = sqlite3.connect(Config.DATABASE_PATH)
+        edges = sorted(conn.execute("SELECT src_id, dst_id FROM similarities").fetchall())
+        conn.close()
+        assert edges == [(1, 2), (2, 1), (3, 4), (4, 3)]